@@ -0,0 +1,167 @@
+"""
+Micro-Batching Module
+=====================
+Coalesces concurrent single-transaction predictions into vectorized batches.
+"""
+
+import time
+import queue
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from .metrics import Histogram
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket bounds
+BATCH_SIZE_BOUNDS = [1, 2, 4, 8, 16, 32, 64, 128, 256]
+QUEUE_WAIT_MS_BOUNDS = [0.1, 0.25, 0.5, 1, 2, 5, 10, 25, 50, 100]
+
+# (is_fraud, confidence, message, partial, model_version) for one transaction
+PredictionResult = Tuple[bool, float, str, bool, Optional[str]]
+PredictBatchFn = Callable[[Sequence[Any]], List[PredictionResult]]
+
+
+class MicroBatcher:
+    """
+    Dynamic micro-batcher in front of a batch prediction function.
+
+    Callers submit one transaction and get a Future. A worker thread takes
+    the first waiting request, keeps collecting until max_batch_size
+    requests are gathered or max_wait_ms has passed since it picked up the
+    first one, runs one vectorized prediction and resolves every Future.
+    """
+
+    def __init__(
+        self,
+        predict_batch: PredictBatchFn,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 2.0,
+        max_queue_size: int = 10000
+    ):
+        self.predict_batch = predict_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._queue: "queue.Queue[Optional[Tuple[Any, Future, float]]]" = queue.Queue(
+            maxsize=max_queue_size
+        )
+        self._thread: Optional[threading.Thread] = None
+        self.batch_size_histogram = Histogram(BATCH_SIZE_BOUNDS)
+        self.queue_wait_histogram = Histogram(QUEUE_WAIT_MS_BOUNDS)
+
+    def start(self) -> None:
+        """Start the batching worker thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name="micro-batcher", daemon=True)
+        self._thread.start()
+        logger.info(
+            f"✅ Micro-batcher started (max {self.max_batch_size} rows / "
+            f"{self.max_wait * 1000:g} ms)"
+        )
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Finish queued requests and stop the worker thread.
+
+        Args:
+            timeout: Maximum seconds to wait for the worker
+        """
+        if self._thread is None:
+            return
+        # Wait for room for the sentinel, but never block shutdown forever
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            logger.warning(f"⚠️  Micro-batch queue still full after {timeout}s - abandoning queued requests")
+            self._thread = None
+            return
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.warning(f"⚠️  Micro-batcher did not finish within {timeout}s")
+        self._thread = None
+
+    def submit(self, features: Any) -> Future:
+        """
+        Queue one transaction for scoring.
+
+        Args:
+            features: TransactionInput or feature dictionary
+
+        Returns:
+            Future resolving to (is_fraud, confidence, message, partial, model_version)
+
+        Raises:
+            queue.Full: If the request queue is at capacity
+        """
+        future: Future = Future()
+        self._queue.put_nowait((features, future, time.perf_counter()))
+        return future
+
+    def predict(self, features: Any, timeout: Optional[float] = None) -> PredictionResult:
+        """
+        Submit one transaction and block until it is scored.
+
+        Args:
+            features: TransactionInput or feature dictionary
+            timeout: Maximum seconds to wait for the result
+
+        Returns:
+            Tuple of (is_fraud, confidence, message, partial, model_version)
+        """
+        return self.submit(features).result(timeout)
+
+    def get_stats(self) -> dict:
+        """Get batch size and queue wait histograms plus queue depth."""
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000,
+            "queue_depth": self._queue.qsize(),
+            "batch_size": self.batch_size_histogram.snapshot(),
+            "queue_wait_ms": self.queue_wait_histogram.snapshot()
+        }
+
+    def _run(self) -> None:
+        """Worker loop: gather a batch, score it, resolve futures."""
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is None:
+                break
+
+            batch = [item]
+            deadline = time.perf_counter() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                try:
+                    # Drain whatever is already queued even once the window closed
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            self._score(batch)
+
+    def _score(self, batch: List[Tuple[Any, Future, float]]) -> None:
+        """Run one prediction for the batch and fan results out."""
+        started = time.perf_counter()
+        self.batch_size_histogram.observe(len(batch))
+        self.queue_wait_histogram.observe_many(
+            (started - submitted) * 1000 for _, _, submitted in batch
+        )
+
+        try:
+            results = self.predict_batch([features for features, _, _ in batch])
+        except Exception as e:
+            logger.error(f"❌ Micro-batch of {len(batch)} failed: {e}")
+            for _, future, _ in batch:
+                future.set_exception(e)
+            return
+
+        for (_, future, _), result in zip(batch, results):
+            future.set_result(result)
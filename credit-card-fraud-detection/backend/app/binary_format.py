@@ -0,0 +1,107 @@
+"""
+Binary Request Format Module
+============================
+Zero-copy decoding of raw float64 and float32/float64 .npy batch request bodies.
+"""
+
+import io
+from typing import Optional
+
+import numpy as np
+
+from .model import N_FEATURES
+from .validation import validate_feature_matrix
+
+# Accepted Content-Type values
+RAW_CONTENT_TYPE = "application/octet-stream"
+NPY_CONTENT_TYPE = "application/x-npy"
+
+
+class BinaryFormatError(ValueError):
+    """Raised when a binary request body cannot be decoded."""
+
+
+def decode_raw(body: bytes) -> np.ndarray:
+    """
+    Wrap raw little-endian float64 rows without copying.
+
+    Args:
+        body: Row-major float64 values, 30 per transaction
+
+    Returns:
+        Read-only array of shape (N, 30) backed by body
+    """
+    row_bytes = N_FEATURES * 8
+    if len(body) % row_bytes:
+        raise BinaryFormatError(
+            f"Body length {len(body)} is not a multiple of {row_bytes} bytes ({N_FEATURES} float64 per row)"
+        )
+    return np.frombuffer(body, dtype='<f8').reshape(-1, N_FEATURES)
+
+
+def decode_npy(body: bytes) -> np.ndarray:
+    """
+    Wrap a .npy payload without copying.
+
+    Only the header is parsed; the data section is viewed in place, as
+    float32 (FEATURE_DTYPE, scored without conversion) or float64.
+
+    Args:
+        body: Contents of a .npy file holding an (N, 30) array
+
+    Returns:
+        Read-only array of shape (N, 30) backed by body
+    """
+    header = io.BytesIO(body)
+    try:
+        version = np.lib.format.read_magic(header)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(header)
+        elif version == (2, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(header)
+        else:
+            raise ValueError(f"unsupported format version {version}")
+    except ValueError as e:
+        raise BinaryFormatError(f"Invalid .npy payload: {e}") from e
+
+    if len(shape) != 2 or shape[1] != N_FEATURES:
+        raise BinaryFormatError(f"Expected an array of shape (N, {N_FEATURES}), got {shape}")
+    if dtype not in (np.dtype('<f8'), np.dtype('<f4')):
+        raise BinaryFormatError(f"Expected little-endian float64 or float32, got {dtype.str}")
+
+    count = shape[0] * shape[1]
+    offset = header.tell()
+    if len(body) - offset < count * dtype.itemsize:
+        raise BinaryFormatError("Truncated .npy payload")
+
+    data = np.frombuffer(body, dtype=dtype, count=count, offset=offset)
+    X = data.reshape(shape[::-1]).T if fortran_order else data.reshape(shape)
+    return X
+
+
+def decode_body(body: bytes, content_type: Optional[str]) -> np.ndarray:
+    """
+    Decode a binary batch body by its Content-Type and validate it.
+
+    Args:
+        body: Request body
+        content_type: Request Content-Type header
+
+    Returns:
+        Feature matrix of shape (N, 30)
+
+    Raises:
+        BinaryFormatError: If the body cannot be decoded
+        FeatureValidationError: If the decoded rows fail validation
+    """
+    media_type = (content_type or RAW_CONTENT_TYPE).split(';')[0].strip().lower()
+    if media_type == NPY_CONTENT_TYPE:
+        X = decode_npy(body)
+    elif media_type == RAW_CONTENT_TYPE:
+        X = decode_raw(body)
+    else:
+        raise BinaryFormatError(
+            f"Unsupported Content-Type {media_type}; use {RAW_CONTENT_TYPE} or {NPY_CONTENT_TYPE}"
+        )
+    validate_feature_matrix(X)
+    return X
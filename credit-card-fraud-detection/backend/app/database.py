@@ -5,17 +5,203 @@ Handles all database operations for storing prediction logs.
 """
 
 import os
+import time
+import queue
 import logging
-from datetime import datetime
-from typing import Optional, Dict, Any, List
-from pymongo import MongoClient, ASCENDING, DESCENDING
-from pymongo.collection import Collection
-from pymongo.errors import ConnectionFailure, OperationFailure
+import threading
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Callable, Optional, Dict, Any, List
+
+# pymongo is imported lazily so the API can start (and serve in mock mode)
+# without paying for it at import time
+if TYPE_CHECKING:
+    from pymongo import MongoClient
+    from pymongo.collection import Collection
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Same values as pymongo.ASCENDING / pymongo.DESCENDING
+ASCENDING = 1
+DESCENDING = -1
+
+# Single document in prediction_stats holding the maintained counters
+STATS_DOCUMENT_ID = "global"
+
+# Rollup bucket granularities and how long their buckets are kept (None = forever)
+ROLLUP_RETENTION = {
+    "minute": timedelta(days=7),
+    "hour": timedelta(days=90),
+    "day": None
+}
+
+EMPTY_STATS = {
+    "total_predictions": 0,
+    "fraud_count": 0,
+    "safe_count": 0,
+    "fraud_percentage": 0.0,
+    "avg_confidence": 0.0
+}
+
+
+class BatchedLogWriter:
+    """
+    Background writer for prediction logs.
+    
+    Documents are put on a bounded in-memory queue and a worker thread
+    writes them with insert_many(ordered=False) once batch_size documents
+    are waiting or flush_interval seconds have passed since the first one.
+    When the queue is full, producers wait up to enqueue_timeout seconds
+    and the document is dropped (and counted) if there is still no room.
+    
+    after_write, if given, is called from the worker thread with the
+    documents of each batch that were actually inserted.
+    """
+    
+    def __init__(
+        self,
+        collection: "Collection",
+        max_queue_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 0.5,
+        enqueue_timeout: float = 0.0,
+        after_write: Optional[Callable[[List[Dict[str, Any]]], None]] = None
+    ):
+        self.collection = collection
+        self.after_write = after_write
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.enqueue_timeout = enqueue_timeout
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize=max_queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._stats = {
+            "enqueued": 0,
+            "written": 0,
+            "dropped": 0,
+            "failed": 0,
+            "batches": 0
+        }
+    
+    def start(self) -> None:
+        """Start the worker thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name="prediction-log-writer", daemon=True)
+        self._thread.start()
+    
+    def submit(self, document: Dict[str, Any]) -> bool:
+        """
+        Queue a document for writing.
+        
+        Args:
+            document: Document to insert
+            
+        Returns:
+            True if queued, False if dropped because the queue is full.
+        """
+        try:
+            if self.enqueue_timeout > 0:
+                self._queue.put(document, timeout=self.enqueue_timeout)
+            else:
+                self._queue.put_nowait(document)
+        except queue.Full:
+            self._increment("dropped")
+            return False
+        
+        self._increment("enqueued")
+        return True
+    
+    def stop(self, timeout: float = 10.0) -> None:
+        """
+        Flush everything still queued and stop the worker thread.
+        
+        Args:
+            timeout: Maximum seconds to wait for the final flush
+        """
+        if self._thread is None:
+            return
+        # Wait for room for the sentinel, but never block shutdown forever
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            logger.warning(f"⚠️  Log writer queue still full after {timeout}s - abandoning queued logs")
+            self._thread = None
+            return
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.warning(f"⚠️  Log writer did not finish within {timeout}s")
+        self._thread = None
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Get writer counters plus the current queue depth."""
+        with self._lock:
+            stats = dict(self._stats)
+        stats["queue_depth"] = self._queue.qsize()
+        return stats
+    
+    def _increment(self, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[key] += amount
+    
+    def _run(self) -> None:
+        """Worker loop: collect a batch, write it, repeat until the sentinel."""
+        stopping = False
+        while not stopping:
+            document = self._queue.get()
+            if document is None:
+                break
+            
+            # Size trigger: batch_size documents; time trigger: flush_interval
+            batch = [document]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    document = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if document is None:
+                    stopping = True
+                    break
+                batch.append(document)
+            
+            self._write(batch)
+    
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        """Insert one batch, counting partial failures."""
+        from pymongo.errors import BulkWriteError, PyMongoError
+        
+        inserted: List[Dict[str, Any]] = []
+        try:
+            self.collection.insert_many(batch, ordered=False)
+            inserted = batch
+        except BulkWriteError as e:
+            rejected = {error["index"] for error in e.details.get("writeErrors", [])}
+            inserted = [doc for i, doc in enumerate(batch) if i not in rejected]
+            self._increment("failed", len(rejected))
+            logger.error(f"❌ {len(rejected)} prediction logs rejected: {e}")
+        except PyMongoError as e:
+            self._increment("failed", len(batch))
+            logger.error(f"❌ Failed to write {len(batch)} prediction logs: {e}")
+        except Exception as e:
+            # e.g. bson InvalidDocument; the worker thread must survive it
+            self._increment("dropped", len(batch))
+            logger.error(f"❌ Dropped {len(batch)} prediction logs: {e}")
+        finally:
+            self._increment("batches")
+        
+        self._increment("written", len(inserted))
+        if inserted and self.after_write is not None:
+            try:
+                self.after_write(inserted)
+            except Exception as e:
+                logger.error(f"❌ Post-write hook failed: {e}")
+
 
 class DatabaseManager:
     """
@@ -23,11 +209,24 @@ class DatabaseManager:
     Handles connection, insertion, and retrieval of prediction logs.
     """
     
-    def __init__(self):
-        self.client: Optional[MongoClient] = None
+    def __init__(
+        self,
+        log_queue_size: int = 10000,
+        log_batch_size: int = 500,
+        log_flush_interval: float = 0.5,
+        log_enqueue_timeout: float = 0.0
+    ):
+        self.client: Optional["MongoClient"] = None
         self.db = None
-        self.collection: Optional[Collection] = None
+        self.collection: Optional["Collection"] = None
+        self.stats_collection: Optional["Collection"] = None
+        self.rollup_collection: Optional["Collection"] = None
         self.is_connected = False
+        self.log_queue_size = log_queue_size
+        self.log_batch_size = log_batch_size
+        self.log_flush_interval = log_flush_interval
+        self.log_enqueue_timeout = log_enqueue_timeout
+        self.log_writer: Optional[BatchedLogWriter] = None
         
     def connect(self, connection_string: Optional[str] = None) -> bool:
         """
@@ -39,6 +238,9 @@ class DatabaseManager:
         Returns:
             True if connection successful, False otherwise.
         """
+        from pymongo import MongoClient
+        from pymongo.errors import ConnectionFailure
+        
         try:
             # Get connection string
             mongo_uri = connection_string or os.getenv(
@@ -57,10 +259,28 @@ class DatabaseManager:
             # Setup database and collection
             self.db = self.client['fraud_detection']
             self.collection = self.db['prediction_logs']
+            self.stats_collection = self.db['prediction_stats']
+            self.rollup_collection = self.db['prediction_rollups']
             
             # Create indexes
             self._create_indexes()
             
+            # Seed maintained counters from existing logs on first run. This
+            # runs before is_connected is set, so it skips the public guard.
+            if self.stats_collection.find_one({"_id": STATS_DOCUMENT_ID}) is None:
+                self._recompute_prediction_stats()
+            
+            # Start background log writer
+            self.log_writer = BatchedLogWriter(
+                self.collection,
+                max_queue_size=self.log_queue_size,
+                batch_size=self.log_batch_size,
+                flush_interval=self.log_flush_interval,
+                enqueue_timeout=self.log_enqueue_timeout,
+                after_write=self._on_logs_written
+            )
+            self.log_writer.start()
+            
             self.is_connected = True
             logger.info("✅ MongoDB connected successfully!")
             return True
@@ -84,7 +304,14 @@ class DatabaseManager:
             self.collection.create_index([("prediction", ASCENDING)])
             # Index on transaction_id for lookups
             self.collection.create_index([("transaction_id", ASCENDING)], unique=True)
-            logger.info("✅ Database indexes created")
+        if self.rollup_collection is not None:
+            # One bucket per (granularity, bucket_start); serves range reads
+            self.rollup_collection.create_index(
+                [("granularity", ASCENDING), ("bucket_start", ASCENDING)], unique=True
+            )
+            # Expire fine-grained buckets after their retention period
+            self.rollup_collection.create_index([("expires_at", ASCENDING)], expireAfterSeconds=0)
+        logger.info("✅ Database indexes created")
     
     def log_prediction(
         self, 
@@ -95,7 +322,10 @@ class DatabaseManager:
         client_ip: Optional[str] = None
     ) -> Optional[str]:
         """
-        Log a prediction to the database.
+        Queue a prediction log for the background writer.
+        
+        The call never waits on MongoDB; documents are written in batches
+        by BatchedLogWriter.
         
         Args:
             transaction_id: Unique transaction identifier
@@ -105,29 +335,40 @@ class DatabaseManager:
             client_ip: Client IP address
             
         Returns:
-            Inserted document ID or None if failed.
+            Document ID of the queued log or None if it was dropped.
         """
-        if not self.is_connected or self.collection is None:
+        if not self.is_connected or self.log_writer is None:
             logger.debug("Database not connected - skipping log")
             return None
         
-        try:
-            document = {
-                "transaction_id": transaction_id,
-                "input_features": input_features,
-                "prediction": prediction,
-                "confidence": confidence,
-                "timestamp": datetime.utcnow(),
-                "client_ip": client_ip
-            }
-            
-            result = self.collection.insert_one(document)
-            logger.debug(f"✅ Prediction logged: {transaction_id}")
-            return str(result.inserted_id)
-            
-        except OperationFailure as e:
-            logger.error(f"❌ Failed to log prediction: {e}")
+        from bson import ObjectId
+        
+        document = {
+            "_id": ObjectId(),
+            "transaction_id": transaction_id,
+            "input_features": input_features,
+            "prediction": prediction,
+            "confidence": confidence,
+            "timestamp": datetime.utcnow(),
+            "client_ip": client_ip
+        }
+        
+        if not self.log_writer.submit(document):
+            logger.debug(f"Log queue full - dropped prediction log: {transaction_id}")
             return None
+        
+        return str(document["_id"])
+    
+    def get_log_writer_stats(self) -> Dict[str, int]:
+        """
+        Get background log writer counters.
+        
+        Returns:
+            Dictionary with enqueued/written/dropped/failed/batches counts and queue depth.
+        """
+        if self.log_writer is None:
+            return {}
+        return self.log_writer.get_stats()
     
     def get_recent_predictions(self, limit: int = 100) -> List[Dict[str, Any]]:
         """
@@ -153,77 +394,253 @@ class DatabaseManager:
         """
         Get prediction statistics.
         
+        Reads the counters maintained by _increment_stats, so the cost is a
+        single document lookup regardless of how many logs are stored.
+        
         Returns:
             Dictionary containing fraud/safe counts and other stats.
         """
-        if not self.is_connected or self.collection is None:
-            return {
-                "total_predictions": 0,
-                "fraud_count": 0,
-                "safe_count": 0,
-                "fraud_percentage": 0.0,
-                "avg_confidence": 0.0
-            }
+        if not self.is_connected or self.stats_collection is None:
+            return dict(EMPTY_STATS)
+        
+        try:
+            stats = self.stats_collection.find_one({"_id": STATS_DOCUMENT_ID})
+            if not stats:
+                return dict(EMPTY_STATS)
+            return self._format_stats(stats)
+            
+        except Exception as e:
+            logger.error(f"❌ Failed to get stats: {e}")
+            return dict(EMPTY_STATS)
+    
+    def recompute_prediction_stats(self) -> Dict[str, Any]:
+        """
+        Rebuild the maintained counters from a full scan of prediction_logs.
+        
+        Use for reconciliation; logs written while the aggregation runs may
+        be counted twice or not at all until the next recompute.
+        
+        Returns:
+            Dictionary containing the recomputed stats.
+        """
+        if not self.is_connected:
+            return dict(EMPTY_STATS)
+        return self._recompute_prediction_stats()
+    
+    def _recompute_prediction_stats(self) -> Dict[str, Any]:
+        """Run the recompute against the collection handles (used while connecting)."""
+        if self.collection is None or self.stats_collection is None:
+            return dict(EMPTY_STATS)
         
         try:
             pipeline = [
                 {
                     "$group": {
                         "_id": None,
-                        "total": {"$sum": 1},
+                        "total_predictions": {"$sum": 1},
                         "fraud_count": {
                             "$sum": {"$cond": [{"$eq": ["$prediction", True]}, 1, 0]}
                         },
                         "safe_count": {
                             "$sum": {"$cond": [{"$eq": ["$prediction", False]}, 1, 0]}
                         },
-                        "avg_confidence": {"$avg": "$confidence"}
+                        "confidence_sum": {"$sum": "$confidence"}
                     }
                 }
             ]
             
             result = list(self.collection.aggregate(pipeline))
+            stats = result[0] if result else {}
+            counters = {
+                "total_predictions": stats.get("total_predictions", 0),
+                "fraud_count": stats.get("fraud_count", 0),
+                "safe_count": stats.get("safe_count", 0),
+                "confidence_sum": stats.get("confidence_sum", 0.0),
+                "updated_at": datetime.utcnow()
+            }
             
-            if result:
-                stats = result[0]
-                total = stats.get("total", 0)
-                fraud_count = stats.get("fraud_count", 0)
-                return {
-                    "total_predictions": total,
-                    "fraud_count": fraud_count,
-                    "safe_count": stats.get("safe_count", 0),
-                    "fraud_percentage": (fraud_count / total * 100) if total > 0 else 0.0,
-                    "avg_confidence": stats.get("avg_confidence", 0.0)
-                }
+            self.stats_collection.replace_one({"_id": STATS_DOCUMENT_ID}, counters, upsert=True)
+            logger.info(f"✅ Prediction stats recomputed: {counters['total_predictions']} logs")
+            return self._format_stats(counters)
             
-            return {
-                "total_predictions": 0,
-                "fraud_count": 0,
-                "safe_count": 0,
-                "fraud_percentage": 0.0,
-                "avg_confidence": 0.0
-            }
+        except Exception as e:
+            logger.error(f"❌ Failed to recompute stats: {e}")
+            return dict(EMPTY_STATS)
+    
+    def get_timeseries(
+        self,
+        granularity: str = "hour",
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: int = 168
+    ) -> List[Dict[str, Any]]:
+        """
+        Get pre-aggregated prediction buckets.
+        
+        Reads only prediction_rollups through the (granularity, bucket_start)
+        index, so the cost depends on the number of buckets returned, not on
+        the number of logged predictions.
+        
+        Args:
+            granularity: "minute", "hour" or "day"
+            start: Earliest bucket start (inclusive), UTC
+            end: Latest bucket start (exclusive), UTC
+            limit: Maximum number of buckets, newest kept
             
+        Returns:
+            List of buckets ordered oldest to newest.
+        """
+        if granularity not in ROLLUP_RETENTION:
+            raise ValueError(f"Unknown granularity: {granularity}")
+        
+        if not self.is_connected or self.rollup_collection is None:
+            return []
+        
+        query: Dict[str, Any] = {"granularity": granularity}
+        if start is not None or end is not None:
+            query["bucket_start"] = {}
+            if start is not None:
+                query["bucket_start"]["$gte"] = start
+            if end is not None:
+                query["bucket_start"]["$lt"] = end
+        
+        try:
+            cursor = (
+                self.rollup_collection.find(query, {"_id": 0, "expires_at": 0})
+                .sort("bucket_start", DESCENDING)
+                .limit(limit)
+            )
+            buckets = [self._format_bucket(bucket) for bucket in cursor]
+            buckets.reverse()
+            return buckets
         except Exception as e:
-            logger.error(f"❌ Failed to get stats: {e}")
-            return {
-                "total_predictions": 0,
-                "fraud_count": 0,
-                "safe_count": 0,
-                "fraud_percentage": 0.0,
-                "avg_confidence": 0.0
-            }
+            logger.error(f"❌ Failed to fetch timeseries: {e}")
+            return []
+    
+    def _on_logs_written(self, documents: List[Dict[str, Any]]) -> None:
+        """Update maintained counters and rollups after a batch is inserted."""
+        self._increment_stats(documents)
+        self._update_rollups(documents)
+    
+    def _update_rollups(self, documents: List[Dict[str, Any]]) -> None:
+        """
+        Add a written batch of logs to minute/hour/day buckets.
+        
+        Documents are grouped in memory first, so a batch costs one upsert
+        per distinct bucket (usually three) in a single bulk_write.
+        
+        Args:
+            documents: Prediction log documents that were inserted
+        """
+        from pymongo import UpdateOne
+        
+        buckets: Dict[tuple, Dict[str, float]] = defaultdict(
+            lambda: {"total": 0, "fraud_count": 0, "safe_count": 0,
+                     "confidence_sum": 0.0, "amount_sum": 0.0}
+        )
+        
+        for doc in documents:
+            timestamp = doc["timestamp"]
+            amount = float((doc.get("input_features") or {}).get("amount", 0.0) or 0.0)
+            for granularity in ROLLUP_RETENTION:
+                counters = buckets[(granularity, _bucket_start(timestamp, granularity))]
+                counters["total"] += 1
+                counters["fraud_count" if doc["prediction"] else "safe_count"] += 1
+                counters["confidence_sum"] += doc["confidence"]
+                counters["amount_sum"] += amount
+        
+        operations = []
+        for (granularity, bucket_start), counters in buckets.items():
+            update: Dict[str, Any] = {"$inc": counters}
+            retention = ROLLUP_RETENTION[granularity]
+            if retention is not None:
+                update["$setOnInsert"] = {"expires_at": bucket_start + retention}
+            operations.append(UpdateOne(
+                {"granularity": granularity, "bucket_start": bucket_start},
+                update,
+                upsert=True
+            ))
+        
+        self.rollup_collection.bulk_write(operations, ordered=False)
+    
+    def _format_bucket(self, bucket: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a raw rollup bucket into the public timeseries shape."""
+        total = bucket.get("total", 0)
+        fraud_count = bucket.get("fraud_count", 0)
+        return {
+            "bucket_start": bucket["bucket_start"].isoformat(),
+            "granularity": bucket["granularity"],
+            "total_predictions": total,
+            "fraud_count": fraud_count,
+            "safe_count": bucket.get("safe_count", 0),
+            "fraud_percentage": (fraud_count / total * 100) if total > 0 else 0.0,
+            "avg_confidence": (bucket.get("confidence_sum", 0.0) / total) if total > 0 else 0.0,
+            "amount_sum": bucket.get("amount_sum", 0.0)
+        }
+    
+    def _increment_stats(self, documents: List[Dict[str, Any]]) -> None:
+        """
+        Add a written batch of logs to the maintained counters with one $inc.
+        
+        Args:
+            documents: Prediction log documents that were inserted
+        """
+        fraud_count = sum(1 for doc in documents if doc["prediction"])
+        self.stats_collection.update_one(
+            {"_id": STATS_DOCUMENT_ID},
+            {
+                "$inc": {
+                    "total_predictions": len(documents),
+                    "fraud_count": fraud_count,
+                    "safe_count": len(documents) - fraud_count,
+                    "confidence_sum": sum(doc["confidence"] for doc in documents)
+                },
+                "$set": {"updated_at": datetime.utcnow()}
+            },
+            upsert=True
+        )
+    
+    def _format_stats(self, counters: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert raw counters into the public stats shape."""
+        total = counters.get("total_predictions", 0)
+        fraud_count = counters.get("fraud_count", 0)
+        return {
+            "total_predictions": total,
+            "fraud_count": fraud_count,
+            "safe_count": counters.get("safe_count", 0),
+            "fraud_percentage": (fraud_count / total * 100) if total > 0 else 0.0,
+            "avg_confidence": (counters.get("confidence_sum", 0.0) / total) if total > 0 else 0.0
+        }
     
     def close(self) -> None:
-        """Close database connection."""
+        """Flush pending prediction logs and close database connection."""
+        if self.log_writer is not None:
+            self.log_writer.stop()
+            logger.info(f"📝 Prediction logs flushed: {self.log_writer.get_stats()}")
+            self.log_writer = None
+        
         if self.client is not None:
             self.client.close()
             self.is_connected = False
             logger.info("🔌 MongoDB connection closed")
 
 
+def _bucket_start(timestamp: datetime, granularity: str) -> datetime:
+    """Truncate a timestamp to the start of its rollup bucket."""
+    if granularity == "minute":
+        return timestamp.replace(second=0, microsecond=0)
+    if granularity == "hour":
+        return timestamp.replace(minute=0, second=0, microsecond=0)
+    return timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
 # Global database instance
-db_manager = DatabaseManager()
+db_manager = DatabaseManager(
+    log_queue_size=int(os.getenv('LOG_QUEUE_SIZE', '10000')),
+    log_batch_size=int(os.getenv('LOG_BATCH_SIZE', '500')),
+    log_flush_interval=float(os.getenv('LOG_FLUSH_INTERVAL_MS', '500')) / 1000,
+    log_enqueue_timeout=float(os.getenv('LOG_ENQUEUE_TIMEOUT_MS', '0')) / 1000
+)
 
 
 def get_db_manager() -> DatabaseManager:
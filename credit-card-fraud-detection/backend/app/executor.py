@@ -0,0 +1,163 @@
+"""
+Inference Executor Module
+=========================
+Runs model inference off the event loop on a bounded thread or process pool.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from .model import (
+    FraudDetectionModel,
+    get_model,
+    load_artifact,
+    load_model_from_env,
+    set_model,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutorOverloadedError(RuntimeError):
+    """Raised when the inference executor has no free slot for a new task."""
+
+
+def score_matrix_arrays(
+    X: np.ndarray,
+    artifact: Optional[Dict[str, Optional[str]]] = None,
+    version: Optional[str] = None
+) -> Tuple[Optional[str], np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Score a raw feature matrix with the current process's model.
+    
+    Module-level so it can be sent to process pool workers. Pool processes
+    do not see hot-reloads in the parent, so the parent passes the artifact
+    and version it is serving and a worker on another version reloads first.
+    
+    Args:
+        X: Feature matrix of shape (N, 30), FEATURE_DTYPE or float64
+        artifact: Artifact description from FraudDetectionModel.artifact
+        version: Model version the artifact is expected to have
+        
+    Returns:
+        Tuple of (model version, boolean decisions, fraud probabilities,
+        boolean flags for probabilities that are not the full forest
+        average: early exits and cascade-skipped rows)
+    """
+    model = _current_model(artifact, version)
+    is_fraud, confidences, partial = model.predict_arrays_partial(X)
+    return model.version, is_fraud, confidences, partial
+
+
+def _current_model(
+    artifact: Optional[Dict[str, Optional[str]]], version: Optional[str]
+) -> FraudDetectionModel:
+    """Get this process's model, reloading it if the parent serves another version."""
+    model = get_model()
+    if artifact is not None and model.version != version:
+        model = _load_worker_model(artifact)
+    return model
+
+
+def _load_worker_model(artifact: Dict[str, Optional[str]]) -> FraudDetectionModel:
+    """Load and install a model in a pool process."""
+    model = FraudDetectionModel()
+    if not load_artifact(model, artifact["kind"], artifact["model_path"], artifact["scaler_path"]):
+        raise RuntimeError(f"Worker could not load model from {artifact['model_path']}")
+    set_model(model)
+    return model
+
+
+def _init_process_worker() -> None:
+    """Load the model once in each pool process (no-op if inherited by fork)."""
+    model = get_model()
+    if not model.model_loaded and load_model_from_env(model):
+        model.warmup()
+
+
+class InferenceExecutor:
+    """
+    Bounded executor for inference work.
+
+    At most ``max_workers + queue_limit`` tasks are admitted at once; further
+    submissions fail immediately with ExecutorOverloadedError instead of
+    queueing without bound. Only the event loop thread calls run(), so the
+    in-flight counter needs no lock.
+    """
+
+    def __init__(self, kind: str = "thread", max_workers: int = 4, queue_limit: int = 64):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Executor kind must be 'thread' or 'process', got {kind}")
+        self.kind = kind
+        self.max_workers = max_workers
+        self.queue_limit = queue_limit
+        self.max_in_flight = max_workers + queue_limit
+        self._pool: Optional[Executor] = None
+        self._in_flight = 0
+        self._rejected = 0
+        self._completed = 0
+
+    def start(self) -> None:
+        """Create the worker pool."""
+        if self._pool is not None:
+            return
+        if self.kind == "process":
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers, initializer=_init_process_worker
+            )
+        else:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="inference"
+            )
+        logger.info(
+            f"✅ Inference executor started ({self.kind}, {self.max_workers} workers, "
+            f"queue limit {self.queue_limit})"
+        )
+
+    def shutdown(self) -> None:
+        """Wait for running tasks and release the pool."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run ``fn(*args)`` on the pool and await its result.
+
+        Args:
+            fn: Callable to run (module-level for process pools)
+            *args: Positional arguments
+
+        Returns:
+            The callable's return value
+
+        Raises:
+            ExecutorOverloadedError: If max_in_flight tasks are already admitted
+        """
+        if self._pool is None:
+            raise RuntimeError("Inference executor not started. Call start() first.")
+        if self._in_flight >= self.max_in_flight:
+            self._rejected += 1
+            raise ExecutorOverloadedError("Inference capacity exhausted")
+
+        self._in_flight += 1
+        try:
+            return await asyncio.wrap_future(self._pool.submit(fn, *args))
+        finally:
+            self._in_flight -= 1
+            self._completed += 1
+
+    def get_stats(self) -> dict:
+        """Get executor configuration and counters."""
+        return {
+            "kind": self.kind,
+            "max_workers": self.max_workers,
+            "queue_limit": self.queue_limit,
+            "in_flight": self._in_flight,
+            "completed": self._completed,
+            "rejected": self._rejected
+        }
@@ -1,12 +1,181 @@
-from fastapi import FastAPI
+import time
+_import_started = time.perf_counter()
+
+from contextlib import asynccontextmanager
+import asyncio
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import Response, StreamingResponse
 from datetime import datetime
-import random
+from typing import Literal, Optional
+import hmac
+import json
+import logging
+import os
+import queue
+import tempfile
+import threading
+import uuid
+
+import numpy as np
+
+from .batching import MicroBatcher
+from .binary_format import BinaryFormatError, decode_body
+from .cache import PredictionCache, feature_key
+from .database import get_db_manager
+from .executor import ExecutorOverloadedError, InferenceExecutor, score_matrix_arrays
+from .metrics import StartupReport, get_latency_tracker
+from .ring_buffer import RingBuffer
+from .validation import FeatureValidationError, feature_row_errors, validate_feature_matrix
+from .streaming import StreamFormatError, iter_csv_blocks, iter_ndjson_blocks
+from .model import (
+    FEATURE_DTYPE,
+    FEATURE_KEYS,
+    MESSAGES,
+    feature_matrix,
+    get_model,
+    load_model_from_env,
+    message_indices,
+)
+from .responses import FastJSONResponse, render_batch_predictions
+from .registry import ModelReloadError, get_model_registry
+from .schema import (
+    BatchArrayInput,
+    BatchPredictionInput,
+    BatchPredictionResponse,
+    ModelReloadRequest,
+    PredictionResponse,
+    TransactionInput,
+)
+
+logger = logging.getLogger(__name__)
+
+# Per-phase startup timings, served at /metrics/startup
+startup_report = StartupReport()
+startup_report.record("import", (time.perf_counter() - _import_started) * 1000)
+
+# Coalesces concurrent /predict calls when MICRO_BATCHING=true
+micro_batcher: Optional[MicroBatcher] = None
+
+# POST /model/reload requires this in X-Admin-Token; unset disables the endpoint
+MODEL_ADMIN_TOKEN = os.getenv("MODEL_ADMIN_TOKEN") or None
+
+# Client-supplied reload paths must resolve inside this directory
+MODEL_RELOAD_DIR = os.path.realpath(
+    os.getenv("MODEL_RELOAD_DIR")
+    or os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "model")
+)
+
+# Runs inference off the event loop; created at startup
+inference_executor: Optional[InferenceExecutor] = None
+
+# Serves replayed /predict feature vectors without rescoring (0 = disabled)
+PREDICTION_CACHE_SIZE = int(os.getenv("PREDICTION_CACHE_SIZE", "10000"))
+prediction_cache: Optional[PredictionCache] = (
+    PredictionCache(
+        max_entries=PREDICTION_CACHE_SIZE,
+        ttl_seconds=float(os.getenv("PREDICTION_CACHE_TTL_SECONDS", "300"))
+    )
+    if PREDICTION_CACHE_SIZE > 0 else None
+)
+if prediction_cache is not None:
+    get_model_registry().add_swap_listener(lambda model: prediction_cache.clear())
+
+
+# -------------------------
+# Startup
+# -------------------------
+def _predict_batch_versioned(items):
+    model = get_model()
+    is_fraud, confidences, partial = model.predict_arrays_partial(feature_matrix(items))
+    return [
+        (fraud, confidence, MESSAGES[message], part, model.version)
+        for fraud, confidence, message, part in zip(
+            is_fraud.tolist(), confidences.tolist(),
+            message_indices(is_fraud, confidences).tolist(), partial.tolist()
+        )
+    ]
+
+
+def _connect_database_in_background() -> threading.Thread:
+    def connect():
+        with startup_report.phase("db_connect", background=True):
+            get_db_manager().connect()
+
+    thread = threading.Thread(target=connect, name="db-connect", daemon=True)
+    thread.start()
+    return thread
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global micro_batcher, inference_executor
+    model = get_model()
+    db_thread = None
+
+    # Load model and scaler once per process
+    with startup_report.phase("model_load"):
+        loaded = load_model_from_env(model)
+
+    if loaded:
+        with startup_report.phase("warmup"):
+            model.warmup()
+        get_model_registry().register_current()
+
+        if os.getenv("MICRO_BATCHING", "false").lower() == "true":
+            micro_batcher = MicroBatcher(
+                _predict_batch_versioned,
+                max_batch_size=int(os.getenv("MICRO_BATCH_MAX_SIZE", "64")),
+                max_wait_ms=float(os.getenv("MICRO_BATCH_MAX_WAIT_MS", "2")),
+                max_queue_size=int(os.getenv("MICRO_BATCH_QUEUE_SIZE", "10000"))
+            )
+            micro_batcher.start()
+    else:
+        logger.warning("⚠️  Serving without a model - prediction endpoints will return 503")
+
+    # Reload the artifact when it changes on disk (0 = admin endpoint only)
+    watch_interval = float(os.getenv("MODEL_WATCH_INTERVAL", "0"))
+    if watch_interval > 0:
+        get_model_registry().start_watching(watch_interval)
+
+    with startup_report.phase("executor_start"):
+        inference_executor = InferenceExecutor(
+            kind=os.getenv("INFERENCE_EXECUTOR", "thread").lower(),
+            max_workers=int(os.getenv("INFERENCE_WORKERS", str(os.cpu_count() or 4))),
+            queue_limit=int(os.getenv("INFERENCE_QUEUE_LIMIT", "64"))
+        )
+        inference_executor.start()
+
+    # Prediction logs go through the background writer. With FAST_STARTUP the
+    # connection is made off the critical path; logs are skipped until it is up.
+    if os.getenv("FAST_STARTUP", "false").lower() == "true":
+        db_thread = _connect_database_in_background()
+    else:
+        with startup_report.phase("db_connect"):
+            get_db_manager().connect()
+
+    logger.info(f"🚀 Startup completed: {startup_report.summary()}")
+    yield
+
+    get_model_registry().stop_watching()
+    if micro_batcher is not None:
+        micro_batcher.stop()
+        micro_batcher = None
+
+    inference_executor.shutdown()
+    inference_executor = None
+
+    # Flush queued prediction logs before exit
+    if db_thread is not None:
+        db_thread.join()
+    get_db_manager().close()
+
 
 app = FastAPI(
     title="Credit Card Fraud Detection API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse
 )
 
 # -------------------------
@@ -20,6 +189,22 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# -------------------------
+# Request latency
+# -------------------------
+@app.middleware("http")
+async def track_latency(request: Request, call_next):
+    started = time.perf_counter()
+    response = await call_next(request)
+    latency_ms = (time.perf_counter() - started) * 1000
+
+    route = request.scope.get("route")
+    path = route.path if route is not None else request.url.path
+    get_latency_tracker().record(f"{request.method} {path}", latency_ms)
+
+    response.headers["X-Process-Time-Ms"] = f"{latency_ms:.3f}"
+    return response
+
 # -------------------------
 # In-memory storage
 # -------------------------
@@ -29,42 +214,37 @@ stats = {
     "safe_count": 0
 }
 
-transactions = []
-
-# -------------------------
-# Request model
-# -------------------------
-class Transaction(BaseModel):
-    time: float
-    amount: float
-    v1: float
-    v2: float
-    v3: float
-    v4: float
-    v5: float
-    v6: float
-    v7: float
-    v8: float
-    v9: float
-    v10: float
-    v11: float
-    v12: float
-    v13: float
-    v14: float
-    v15: float
-    v16: float
-    v17: float
-    v18: float
-    v19: float
-    v20: float
-    v21: float
-    v22: float
-    v23: float
-    v24: float
-    v25: float
-    v26: float
-    v27: float
-    v28: float
+# /predict/stream block size and in-memory spool limit before spilling to disk
+STREAM_BLOCK_SIZE = int(os.getenv("STREAM_BLOCK_SIZE", "1024"))
+STREAM_SPOOL_BYTES = int(os.getenv("STREAM_SPOOL_MB", "16")) * 1024 * 1024
+
+# Bounded history for /recent (~320 bytes per entry, see RingBuffer)
+transactions = RingBuffer(capacity=int(os.getenv("RECENT_CAPACITY", "1000")))
+
+
+def _get_loaded_model():
+    model = get_model()
+    if not model.model_loaded:
+        raise HTTPException(status_code=503, detail="Model not loaded")
+    return model
+
+
+async def _score_rows(X):
+    """Score rows on the executor with score_matrix_arrays."""
+    if inference_executor.kind == "process":
+        # Pool processes sync to the version the parent is serving
+        model = get_model()
+        args = (X, model.artifact, model.version)
+    else:
+        args = (X,)
+    try:
+        return await inference_executor.run(score_matrix_arrays, *args)
+    except ExecutorOverloadedError:
+        raise HTTPException(status_code=503, detail="Inference capacity exhausted, retry later")
+
+
+def _client_ip(request: Request):
+    return request.client.host if request.client is not None else None
 
 # -------------------------
 # Root
@@ -83,13 +263,107 @@ def root():
 # -------------------------
 @app.get("/health")
 def health():
-    return {"status": "ok"}
+    model = get_model()
+    return {
+        "status": "ok",
+        "model_loaded": model.model_loaded,
+        "scaler_loaded": model.scaler_loaded,
+        "database_connected": get_db_manager().is_connected
+    }
+
+# -------------------------
+# Model info
+# -------------------------
+@app.get("/model/info")
+def model_info():
+    return {"data": get_model().get_model_info()}
+
+
+@app.get("/model/versions")
+def model_versions():
+    return {"data": get_model_registry().history()}
+
+
+def _require_admin_token(x_admin_token: Optional[str] = Header(default=None)) -> None:
+    """Reject model admin calls without the configured MODEL_ADMIN_TOKEN."""
+    if MODEL_ADMIN_TOKEN is None:
+        raise HTTPException(status_code=403, detail="Model reload is disabled - set MODEL_ADMIN_TOKEN")
+    if x_admin_token is None or not hmac.compare_digest(x_admin_token.encode(), MODEL_ADMIN_TOKEN.encode()):
+        raise HTTPException(status_code=401, detail="Invalid or missing X-Admin-Token")
+
+
+def _model_dir_path(path: Optional[str]) -> Optional[str]:
+    """
+    Resolve a client-supplied artifact path inside MODEL_RELOAD_DIR.
+    
+    Artifacts are unpickled, so a path (relative paths are taken from the
+    model directory) that resolves outside it, symlinks included, is refused.
+    """
+    if path is None:
+        return None
+    resolved = os.path.realpath(os.path.join(MODEL_RELOAD_DIR, path))
+    if os.path.commonpath([resolved, MODEL_RELOAD_DIR]) != MODEL_RELOAD_DIR:
+        raise HTTPException(status_code=403, detail="Artifact paths must be inside the model directory")
+    return resolved
+
+
+@app.post("/model/reload", dependencies=[Depends(_require_admin_token)])
+async def reload_model(reload_request: Optional[ModelReloadRequest] = None):
+    reload_request = reload_request or ModelReloadRequest()
+    model_path = _model_dir_path(reload_request.model_path)
+    scaler_path = _model_dir_path(reload_request.scaler_path)
+    try:
+        # Load and validate off the event loop; requests keep using the old model
+        entry = await asyncio.to_thread(
+            get_model_registry().reload, reload_request.artifact, model_path, scaler_path
+        )
+    except ModelReloadError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    return {"data": entry}
+
+# -------------------------
+# Latency metrics
+# -------------------------
+@app.get("/metrics/latency")
+def latency_metrics():
+    return {"data": get_latency_tracker().summary()}
+
+
+@app.get("/metrics/startup")
+def startup_metrics():
+    return {"data": startup_report.summary()}
+
+
+@app.get("/metrics/cache")
+def cache_metrics():
+    return {"data": prediction_cache.get_stats() if prediction_cache is not None else None}
+
+
+@app.get("/metrics/batching")
+def batching_metrics():
+    return {"data": micro_batcher.get_stats() if micro_batcher is not None else None}
+
+
+@app.get("/metrics/executor")
+def executor_metrics():
+    return {"data": inference_executor.get_stats() if inference_executor is not None else None}
+
+
+@app.get("/metrics/logging")
+def logging_metrics():
+    return {"data": get_db_manager().get_log_writer_stats()}
 
 # -------------------------
 # Stats
 # -------------------------
 @app.get("/stats")
 def get_stats():
+    db = get_db_manager()
+    if db.is_connected:
+        db_stats = db.get_prediction_stats()
+        db_stats["fraud_percentage"] = round(db_stats["fraud_percentage"], 2)
+        return {"data": db_stats}
+
     fraud_percentage = (
         (stats["fraud_count"] / stats["total_predictions"]) * 100
         if stats["total_predictions"] > 0
@@ -105,13 +379,59 @@ def get_stats():
         }
     }
 
+@app.get("/stats/timeseries")
+def get_timeseries(
+    granularity: Literal["minute", "hour", "day"] = "hour",
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    limit: int = Query(default=168, ge=1, le=10000)
+):
+    return {
+        "data": get_db_manager().get_timeseries(granularity, start, end, limit)
+    }
+
+
+@app.get("/stats/timeseries/{granularity}")
+def get_timeseries_by_granularity(
+    granularity: Literal["minute", "hour", "day"],
+    limit: int = Query(default=168, ge=1, le=10000)
+):
+    return get_timeseries(granularity, None, None, limit)
+
+
+@app.post("/stats/recompute")
+def recompute_stats():
+    db = get_db_manager()
+    if not db.is_connected:
+        raise HTTPException(status_code=503, detail="Database not connected")
+    return {"data": db.recompute_prediction_stats()}
+
 # -------------------------
 # Prediction
 # -------------------------
-@app.post("/predict")
-def predict(transaction: Transaction):
-    fraud_probability = random.random()
-    is_fraud = fraud_probability > 0.7
+@app.post("/predict", response_model=PredictionResponse)
+async def predict(transaction: TransactionInput, request: Request):
+    model = _get_loaded_model()
+    X = feature_matrix([transaction])
+    cache_key = feature_key(model.version, X[0]) if prediction_cache is not None else None
+    cached = prediction_cache.get(cache_key) if cache_key is not None else None
+
+    if cached is not None:
+        is_fraud, confidence, message, partial, model_version = cached
+    elif micro_batcher is not None:
+        try:
+            future = micro_batcher.submit(transaction)
+        except queue.Full:
+            raise HTTPException(status_code=503, detail="Prediction queue is full")
+        is_fraud, confidence, message, partial, model_version = await asyncio.wrap_future(future)
+    else:
+        model_version, fraud_flags, confidences, partial_flags = await _score_rows(X)
+        is_fraud, confidence, partial = bool(fraud_flags[0]), float(confidences[0]), bool(partial_flags[0])
+        message = MESSAGES[message_indices(fraud_flags, confidences)[0]]
+
+    # Only cache under the version that actually scored the row
+    if cached is None and cache_key is not None and model_version == model.version:
+        prediction_cache.put(cache_key, (is_fraud, confidence, message, partial, model_version))
 
     stats["total_predictions"] += 1
     if is_fraud:
@@ -119,20 +439,233 @@ def predict(transaction: Transaction):
     else:
         stats["safe_count"] += 1
 
+    timestamp = datetime.utcnow().isoformat()
     record = {
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": timestamp,
         "amount": transaction.amount,
         "is_fraud": is_fraud,
-        "fraud_probability": round(fraud_probability, 3)
+        "fraud_probability": round(confidence, 3)
     }
 
     transactions.append(record)
 
-    return {
-        "is_fraud": is_fraud,
-        "fraud_probability": round(fraud_probability, 3),
-        "message": "Fraud detected" if is_fraud else "Transaction is safe"
-    }
+    transaction_id = str(uuid.uuid4())
+    get_db_manager().log_prediction(
+        transaction_id,
+        transaction.model_dump(),
+        is_fraud,
+        confidence,
+        _client_ip(request)
+    )
+
+    return PredictionResponse(
+        fraud=is_fraud,
+        confidence=round(confidence, 4),
+        message=message,
+        transaction_id=transaction_id,
+        timestamp=timestamp,
+        model_version=model_version,
+        partial=partial
+    )
+
+# -------------------------
+# Batch prediction
+# -------------------------
+def _record_batch(make_features, is_fraud, confidences, partial, model_version, client_ip) -> bytes:
+    """
+    Log, record and render a scored batch. Every step is O(rows) Python
+    work, so this runs in a worker thread rather than on the event loop.
+
+    Args:
+        make_features: Callable returning the per-row input feature dicts
+        is_fraud: Boolean array of decisions
+        confidences: Array of fraud probabilities
+        partial: Flags for probabilities that are not the full forest average
+        model_version: Version that scored the rows
+        client_ip: Caller address for the prediction logs
+
+    Returns:
+        Rendered BatchPredictionResponse JSON
+    """
+    db = get_db_manager()
+    features = make_features()
+
+    timestamp = datetime.utcnow().isoformat()
+    transaction_ids = [str(uuid.uuid4()) for _ in range(len(confidences))]
+    fraud_flags = is_fraud.tolist()
+    probabilities = confidences.tolist()
+    rounded = np.round(confidences, 3).tolist()
+
+    records = []
+    for input_features, fraud, confidence, fraud_probability, transaction_id in zip(
+        features, fraud_flags, probabilities, rounded, transaction_ids
+    ):
+        records.append({
+            "timestamp": timestamp,
+            "amount": input_features["amount"],
+            "is_fraud": fraud,
+            "fraud_probability": fraud_probability
+        })
+        db.log_prediction(transaction_id, input_features, fraud, confidence, client_ip)
+
+    transactions.extend(records)
+
+    # Rendered straight from the arrays instead of per-row PredictionResponse models
+    return render_batch_predictions(is_fraud, confidences, partial, transaction_ids, timestamp, model_version)
+
+
+async def _batch_response(make_features, scored, request: Request) -> Response:
+    model_version, is_fraud, confidences, partial = scored
+    content = await asyncio.to_thread(
+        _record_batch, make_features, is_fraud, confidences, partial, model_version, _client_ip(request)
+    )
+
+    # Counters stay on the event loop, which is their only writer
+    fraud_count = int(np.count_nonzero(is_fraud))
+    stats["total_predictions"] += len(confidences)
+    stats["fraud_count"] += fraud_count
+    stats["safe_count"] += len(confidences) - fraud_count
+
+    return Response(content, media_type="application/json")
+
+
+@app.post("/predict/batch", response_model=BatchPredictionResponse)
+async def predict_batch(batch: BatchPredictionInput, request: Request):
+    _get_loaded_model()
+    scored = await _score_rows(feature_matrix(batch.transactions))
+    return await _batch_response(
+        lambda: [transaction.model_dump() for transaction in batch.transactions], scored, request
+    )
+
+
+@app.post("/predict/batch/array", response_model=BatchPredictionResponse)
+async def predict_batch_array(batch: BatchArrayInput, request: Request):
+    """
+    Batch prediction with fast validation: rows are validated as one typed
+    array and checked with a single vectorized pass instead of
+    TransactionInput's per-field validators.
+    """
+    _get_loaded_model()
+    X = np.array(batch.rows, dtype=FEATURE_DTYPE).reshape(-1, len(FEATURE_KEYS))
+    try:
+        validate_feature_matrix(X)
+    except FeatureValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    scored = await _score_rows(X)
+    return await _batch_response(lambda: [dict(zip(FEATURE_KEYS, row)) for row in batch.rows], scored, request)
+
+
+@app.post("/predict/batch/binary", response_model=BatchPredictionResponse)
+async def predict_batch_binary(request: Request):
+    """
+    Batch prediction from raw little-endian float64 rows
+    (application/octet-stream) or a float32/float64 .npy array
+    (application/x-npy), 30 columns in FEATURE_KEYS order.
+    """
+    _get_loaded_model()
+    try:
+        # Zero-copy view on the body; float64 rows are narrowed once when scored
+        X = decode_body(await request.body(), request.headers.get("content-type"))
+    except (BinaryFormatError, FeatureValidationError) as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    scored = await _score_rows(X)
+    return await _batch_response(lambda: [dict(zip(FEATURE_KEYS, row)) for row in X.tolist()], scored, request)
+
+# -------------------------
+# Streaming prediction
+# -------------------------
+def _render_stream_rows(rows, is_fraud, confidences, partial, errors=()) -> str:
+    """NDJSON lines for one block: scored rows plus (row, error) lines, in row order."""
+    bool_json = ("false", "true")
+    lines = [
+        f'{{"row":{row},"fraud":{bool_json[fraud]},"confidence":{confidence:.6g},"partial":{bool_json[part]}}}\n'
+        for row, fraud, confidence, part in zip(rows, is_fraud.tolist(), confidences.tolist(), partial.tolist())
+    ]
+    if errors:
+        lines = [line for _, line in sorted(
+            [*zip(rows, lines), *((row, json.dumps({"row": row, "error": error}) + "\n") for row, error in errors)],
+            key=lambda entry: entry[0]
+        )]
+    return "".join(lines)
+
+
+async def _stream_scores(body, blocks):
+    started = time.perf_counter()
+    rows = 0
+    fraud_count = 0
+    partial_count = 0
+    invalid_count = 0
+    model_version = None
+    try:
+        # Block parsing and rendering are per-row Python work, so both run
+        # in worker threads; only the counters are touched on the event loop
+        while (item := await asyncio.to_thread(next, blocks, None)) is not None:
+            start, block = item
+            # Same checks as the batch endpoints, but a bad row only gets an
+            # error line instead of failing the whole stream
+            errors = feature_row_errors(block)
+            row_numbers = range(start, start + len(block))
+            if errors:
+                valid = np.ones(len(block), dtype=bool)
+                valid[[row for row, _ in errors]] = False
+                block = block[valid]
+                row_numbers = (start + np.flatnonzero(valid)).tolist()
+                errors = [(start + row, error) for row, error in errors]
+                invalid_count += len(errors)
+            if not len(block):
+                yield _render_stream_rows([], np.empty(0, dtype=bool), np.empty(0), np.empty(0, dtype=bool), errors)
+                continue
+            model_version, is_fraud, confidences, partial = await _score_rows(block)
+            fraud_count += int(np.count_nonzero(is_fraud))
+            partial_count += int(np.count_nonzero(partial))
+            rows += len(confidences)
+            yield await asyncio.to_thread(_render_stream_rows, row_numbers, is_fraud, confidences, partial, errors)
+    except (StreamFormatError, HTTPException) as e:
+        detail = e.detail if isinstance(e, HTTPException) else str(e)
+        yield json.dumps({"error": detail, "rows_scored": rows}) + "\n"
+        return
+    finally:
+        body.close()
+
+    elapsed = time.perf_counter() - started
+    rows_per_sec = round(rows / elapsed, 1) if elapsed > 0 else 0.0
+    logger.info(f"📤 Streamed {rows} predictions in {elapsed:.2f}s ({rows_per_sec} rows/sec)")
+    yield json.dumps({"summary": {
+        "rows": rows,
+        "fraud_count": fraud_count,
+        "safe_count": rows - fraud_count,
+        "partial_count": partial_count,
+        "invalid_count": invalid_count,
+        "seconds": round(elapsed, 3),
+        "rows_per_sec": rows_per_sec,
+        "model_version": model_version
+    }}) + "\n"
+
+
+@app.post("/predict/stream")
+async def predict_stream(
+    request: Request,
+    format: Optional[Literal["ndjson", "csv"]] = None,
+    block_size: int = Query(default=STREAM_BLOCK_SIZE, ge=1, le=65536)
+):
+    _get_loaded_model()
+    if format is None:
+        format = "csv" if "csv" in request.headers.get("content-type", "") else "ndjson"
+
+    # Spool the upload (memory up to STREAM_SPOOL_MB, then disk) so the
+    # response never competes with the request body for receive()
+    body = tempfile.SpooledTemporaryFile(max_size=STREAM_SPOOL_BYTES)
+    async for chunk in request.stream():
+        body.write(chunk)
+    body.seek(0)
+
+    parse = iter_csv_blocks if format == "csv" else iter_ndjson_blocks
+    return StreamingResponse(
+        _stream_scores(body, parse(body, block_size)),
+        media_type="application/x-ndjson"
+    )
 
 # -------------------------
 # Recent transactions (FIX)
@@ -140,5 +673,5 @@ def predict(transaction: Transaction):
 @app.get("/recent")
 def get_recent(limit: int = 50):
     return {
-        "data": transactions[-limit:][::-1]
+        "data": transactions.newest(limit)
     }
@@ -0,0 +1,187 @@
+"""
+Metrics Module
+==============
+Lightweight in-process latency tracking and histograms for the API.
+"""
+
+import time
+import bisect
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterable, Iterator, Sequence
+
+import numpy as np
+
+
+class LatencyTracker:
+    """
+    Keeps a sliding window of recent request latencies per route
+    and reports percentiles over that window.
+    """
+
+    def __init__(self, window_size: int = 10000):
+        self.window_size = window_size
+        self._samples: Dict[str, Deque[float]] = {}
+        self._counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, route: str, latency_ms: float) -> None:
+        """
+        Record a single request latency.
+
+        Args:
+            route: Route identifier (e.g. "POST /predict")
+            latency_ms: Request latency in milliseconds
+        """
+        with self._lock:
+            samples = self._samples.get(route)
+            if samples is None:
+                samples = deque(maxlen=self.window_size)
+                self._samples[route] = samples
+                self._counts[route] = 0
+            samples.append(latency_ms)
+            self._counts[route] += 1
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get latency percentiles for every tracked route.
+
+        Returns:
+            Dictionary mapping route to count, p50, p99 and max latency (ms)
+        """
+        with self._lock:
+            snapshot = {route: np.fromiter(samples, dtype=np.float64)
+                        for route, samples in self._samples.items()}
+            counts = dict(self._counts)
+
+        result = {}
+        for route, samples in snapshot.items():
+            if samples.size == 0:
+                continue
+            p50, p99 = np.percentile(samples, [50, 99])
+            result[route] = {
+                "count": counts[route],
+                "p50_ms": round(float(p50), 3),
+                "p99_ms": round(float(p99), 3),
+                "max_ms": round(float(samples.max()), 3)
+            }
+        return result
+
+    def reset(self) -> None:
+        """Clear all recorded samples."""
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
+
+
+class Histogram:
+    """
+    Histogram with fixed upper bucket bounds. Each observation is counted
+    in the first bucket whose bound is >= the value, or in "+Inf".
+    """
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = sorted(bounds)
+        self._counts = [0] * (len(self.bounds) + 1)
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """
+        Record a single observation.
+
+        Args:
+            value: Observed value
+        """
+        index = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+
+    def observe_many(self, values: Iterable[float]) -> None:
+        """
+        Record several observations under one lock acquisition.
+
+        Args:
+            values: Observed values
+        """
+        indexed = [(bisect.bisect_left(self.bounds, value), value) for value in values]
+        with self._lock:
+            for index, value in indexed:
+                self._counts[index] += 1
+                self._sum += value
+            self._count += len(indexed)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get the current bucket counts.
+
+        Returns:
+            Dictionary with count, sum, mean and per-bucket counts keyed "<=bound"
+        """
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+            count = self._count
+
+        buckets = {f"<={bound:g}": n for bound, n in zip(self.bounds, counts)}
+        buckets["+Inf"] = counts[-1]
+        return {
+            "count": count,
+            "sum": round(total, 3),
+            "mean": round(total / count, 3) if count else 0.0,
+            "buckets": buckets
+        }
+
+
+class StartupReport:
+    """
+    Records how long each startup phase took, in the order they ran.
+    Background phases (e.g. a deferred DB connect) are reported separately
+    and not counted in the total.
+    """
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+        self.background: Dict[str, float] = {}
+
+    def record(self, name: str, duration_ms: float, background: bool = False) -> None:
+        """
+        Record a phase duration.
+
+        Args:
+            name: Phase name (e.g. "import", "model_load")
+            duration_ms: Duration in milliseconds
+            background: Whether the phase ran off the startup critical path
+        """
+        target = self.background if background else self.phases
+        target[name] = round(duration_ms, 3)
+
+    @contextmanager
+    def phase(self, name: str, background: bool = False) -> Iterator[None]:
+        """Time the enclosed block as one startup phase."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - started) * 1000, background)
+
+    def summary(self) -> Dict[str, Any]:
+        """Get per-phase durations and the critical-path total in milliseconds."""
+        return {
+            "phases_ms": dict(self.phases),
+            "background_ms": dict(self.background),
+            "total_ms": round(sum(self.phases.values()), 3)
+        }
+
+
+# Global latency tracker instance
+latency_tracker = LatencyTracker()
+
+
+def get_latency_tracker() -> LatencyTracker:
+    """Get the global latency tracker instance."""
+    return latency_tracker
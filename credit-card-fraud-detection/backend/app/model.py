@@ -5,16 +5,707 @@ Handles loading and inference with the trained fraud detection model.
 """
 
 import os
+import json
+import bisect
+import functools
+import hashlib
 import pickle
 import logging
+import mmap
+import operator
 import numpy as np
-from typing import Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 from datetime import datetime
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Default fraud decision threshold on P(fraud), matches RandomForest.predict
+DEFAULT_DECISION_THRESHOLD = 0.5
+
+# Metadata file written next to fraud_model.pkl by ml/train_model.py
+MODEL_META_FILENAME = 'model_meta.json'
+
+# Scaler-fused forest written by ml/train_model.py::export_fused_model
+FUSED_MODEL_FILENAME = 'fraud_model_fused.npz'
+
+# Distilled student forest written by ml/train_model.py::save_student; serve it
+# by pointing MODEL_PATH at it (scaler and cascade weights are shared, its own
+# thresholds come from the "artifacts" section of model_meta.json)
+STUDENT_MODEL_FILENAME = 'fraud_model_student.pkl'
+
+# Memory-mappable copy of the fused forest, shared by all worker processes
+RAW_MODEL_FILENAME = 'fraud_model_fused.bin'
+RAW_FOREST_MAGIC = b'CFOREST1'
+
+# Batches larger than this go to sklearn, whose compiled tree loop wins once
+# per-call overhead is amortised (see benchmarks/benchmark_compiled_forest.py)
+COMPILED_FOREST_MAX_ROWS = 2048
+
+# Early-exit evaluation: first checkpoint and spacing (in trees), and the
+# default probability that a row exits on the wrong side of the threshold.
+# Rows shrink after every checkpoint, so blocks are larger than chunk_size
+# to keep per-pass NumPy overhead amortised (see ml/evaluate_early_exit.py)
+EARLY_EXIT_MIN_TREES = 20
+EARLY_EXIT_STEP = 20
+EARLY_EXIT_DELTA = 0.01
+EARLY_EXIT_CHUNK_ROWS = 1024
+
+# Response messages by confidence band, lowest band first. Safe bands split
+# at the bounds with "<" (0.1 -> low risk), fraud bands with ">" (0.9 -> suspicious).
+SAFE_MESSAGES = (
+    "✅ Transaction appears safe.",
+    "✅ Low risk transaction.",
+    "✅ Transaction within normal parameters."
+)
+FRAUD_MESSAGES = (
+    "⚡ Potential fraud detected. Please verify.",
+    "⚠️  Suspicious transaction detected. Review recommended.",
+    "🚨 High risk transaction detected! Immediate attention required."
+)
+MESSAGES = SAFE_MESSAGES + FRAUD_MESSAGES
+SAFE_BAND_BOUNDS = (0.1, 0.3)
+FRAUD_BAND_BOUNDS = (0.7, 0.9)
+
+
+# Request field order, fixed once at import time (matches the training columns)
+FEATURE_KEYS = ('time',) + tuple(f'v{i}' for i in range(1, 29)) + ('amount',)
+N_FEATURES = len(FEATURE_KEYS)
+
+# Feature buffers are float32 end to end: sklearn trees split on float32
+# inputs anyway, so scoring in float32 avoids a cast and halves bandwidth
+FEATURE_DTYPE = np.float32
+
+# Anything exposing the request fields: a TransactionInput or a parsed JSON body
+FeatureSource = Union[Dict[str, Any], Any]
+
+_values_from_mapping = operator.itemgetter(*FEATURE_KEYS)
+_values_from_object = operator.attrgetter(*FEATURE_KEYS)
+
+
+def feature_values(source: FeatureSource) -> tuple:
+    """
+    Read the 30 feature values from a request in model column order.
+    
+    Args:
+        source: TransactionInput instance or feature dictionary (missing keys
+            in a dictionary default to 0.0)
+            
+    Returns:
+        Tuple of 30 feature values
+    """
+    if isinstance(source, dict):
+        try:
+            return _values_from_mapping(source)
+        except KeyError:
+            return tuple(source.get(key, 0.0) for key in FEATURE_KEYS)
+    return _values_from_object(source)
+
+
+def fill_feature_row(source: FeatureSource, out: np.ndarray) -> np.ndarray:
+    """
+    Write the feature values of one request into a preallocated row.
+    
+    Args:
+        source: TransactionInput instance or feature dictionary
+        out: FEATURE_DTYPE array of length 30, e.g. row i of a batch buffer
+        
+    Returns:
+        The filled ``out`` array
+    """
+    out[:] = feature_values(source)
+    return out
+
+
+def message_indices(is_fraud: np.ndarray, confidences: np.ndarray) -> np.ndarray:
+    """
+    Pick the MESSAGES index for every prediction with np.searchsorted.
+    
+    Args:
+        is_fraud: Boolean array of decisions
+        confidences: Fraud probabilities
+        
+    Returns:
+        Integer array of indexes into MESSAGES
+    """
+    safe = np.searchsorted(SAFE_BAND_BOUNDS, confidences, side='right')
+    fraud = np.searchsorted(FRAUD_BAND_BOUNDS, confidences, side='left') + len(SAFE_MESSAGES)
+    return np.where(is_fraud, fraud, safe)
+
+
+def _align(offset: int, alignment: int = 64) -> int:
+    """Round an offset up to the next multiple of alignment."""
+    return (offset + alignment - 1) // alignment * alignment
+
+
+def feature_matrix(sources: Sequence[FeatureSource]) -> np.ndarray:
+    """
+    Build a raw feature matrix from several requests.
+    
+    Args:
+        sources: TransactionInput instances or feature dictionaries
+        
+    Returns:
+        FEATURE_DTYPE array of shape (N, 30)
+    """
+    if not sources:
+        return np.empty((0, N_FEATURES), dtype=FEATURE_DTYPE)
+    return np.array([feature_values(source) for source in sources], dtype=FEATURE_DTYPE)
+
+
+def float32_thresholds(threshold: np.ndarray) -> np.ndarray:
+    """
+    Round split thresholds down to float32.
+    
+    sklearn compares float32 inputs against float64 thresholds. Rounding
+    each threshold to the largest float32 not above it keeps every
+    ``x <= threshold`` comparison identical for float32 x, so the whole
+    evaluation can run in float32.
+    
+    Args:
+        threshold: Split thresholds (float32 arrays are returned as-is)
+        
+    Returns:
+        Contiguous float32 thresholds
+    """
+    if threshold.dtype == np.float32:
+        return np.ascontiguousarray(threshold)
+    threshold = np.asarray(threshold, dtype=np.float64)
+    rounded = threshold.astype(np.float32)
+    above = rounded.astype(np.float64) > threshold
+    rounded[above] = np.nextafter(rounded[above], np.float32(-np.inf))
+    return np.ascontiguousarray(rounded)
+
+
+def artifact_version(paths: List[str]) -> str:
+    """
+    Derive a model version from the contents of an artifact's files.
+    
+    Sidecars (model_meta.json, scaler.pkl, ...) count as well, so changing
+    the decision threshold alone gives a new version. A missing sidecar
+    hashes differently from an empty one.
+    
+    Args:
+        paths: Model file followed by every sidecar the loader consulted
+        
+    Returns:
+        First 12 hex digits of the SHA-256 over all files
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(os.path.basename(path).encode() + b'\0')
+        if not os.path.exists(path):
+            digest.update(b'-\0')
+            continue
+        digest.update(b'+%d\0' % os.path.getsize(path))
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+    return digest.hexdigest()[:12]
+
+
+def load_artifact(
+    model: "FraudDetectionModel",
+    artifact: str = "pickle",
+    model_path: Optional[str] = None,
+    scaler_path: Optional[str] = None
+) -> bool:
+    """
+    Load one model artifact into a model instance.
+    
+    DECISION_THRESHOLD, USE_COMPILED_FOREST, USE_CASCADE and
+    EARLY_EXIT_DELTA from the environment are applied on top, so
+    hot-reloaded models get the same overrides.
+    
+    Args:
+        model: Model instance to load into
+        artifact: "pickle", "fused" or "mmap"
+        model_path: Artifact path. If None, uses the default path.
+        scaler_path: Scaler pickle for the "pickle" artifact. If None, uses
+            scaler.pkl next to model_path, or the default path.
+        
+    Returns:
+        True if the model loaded successfully, False otherwise.
+    """
+    if artifact not in ("pickle", "fused", "mmap"):
+        raise ValueError(f"Model artifact must be pickle, fused or mmap, got {artifact}")
+    
+    model.use_compiled_forest = os.getenv("USE_COMPILED_FOREST", "true").lower() != "false"
+    model.use_cascade = os.getenv("USE_CASCADE", "false").lower() == "true"
+    if artifact == "pickle":
+        if scaler_path is None and model_path is not None:
+            sibling = os.path.join(os.path.dirname(os.path.abspath(model_path)), 'scaler.pkl')
+            scaler_path = sibling if os.path.exists(sibling) else None
+        loaded = model.load_model(model_path)
+        if loaded:
+            model.load_scaler(scaler_path)
+    else:
+        loaded = model.load_fused_model(model_path, mmap_mode=artifact == "mmap")
+    
+    if loaded and os.getenv("DECISION_THRESHOLD"):
+        model.set_decision_threshold(float(os.getenv("DECISION_THRESHOLD")))
+    if loaded and os.getenv("EARLY_EXIT_DELTA"):
+        model.set_early_exit(
+            float(os.getenv("EARLY_EXIT_DELTA")),
+            min_trees=int(os.getenv("EARLY_EXIT_MIN_TREES", EARLY_EXIT_MIN_TREES))
+        )
+    return loaded
+
+
+def load_model_from_env(model: "FraudDetectionModel") -> bool:
+    """
+    Load model artifacts as configured by environment variables.
+    
+    MODEL_ARTIFACT selects "pickle" (MODEL_PATH + SCALER_PATH), "fused"
+    (FUSED_MODEL_PATH) or "mmap" (RAW_MODEL_PATH, memory-mapped);
+    DECISION_THRESHOLD and USE_COMPILED_FOREST are applied on top.
+    
+    Args:
+        model: Model instance to load into
+        
+    Returns:
+        True if the model loaded successfully, False otherwise.
+    """
+    artifact = os.getenv("MODEL_ARTIFACT", "pickle").lower()
+    if artifact == "fused":
+        return load_artifact(model, artifact, os.getenv("FUSED_MODEL_PATH") or None)
+    if artifact == "mmap":
+        return load_artifact(model, artifact, os.getenv("RAW_MODEL_PATH") or None)
+    return load_artifact(
+        model, "pickle", os.getenv("MODEL_PATH") or None, os.getenv("SCALER_PATH") or None
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _early_exit_schedule(
+    n_trees: int, delta: float, min_trees: int, step: int
+) -> Tuple[Tuple[int, ...], Tuple[float, ...]]:
+    """
+    Tree counts at which early exit is checked, and the bound at each.
+    
+    delta is split evenly over the exit checks (every checkpoint but the
+    last, where all trees are in), so by a union bound all of a row's
+    checks hold together with probability at least 1 - delta.
+    """
+    checkpoints = np.append(np.arange(min(min_trees, n_trees), n_trees, step), n_trees)
+    check_delta = delta / max(len(checkpoints) - 1, 1)
+    margins = np.sqrt((1.0 - (checkpoints - 1) / n_trees) * np.log(2.0 / check_delta) / (2.0 * checkpoints))
+    return tuple(checkpoints.tolist()), tuple(margins.tolist())
+
+
+class CompiledForest:
+    """
+    Flat-array tree ensemble evaluator.
+    
+    All trees of a fitted RandomForestClassifier are exported into contiguous
+    NumPy arrays (feature, threshold, children, leaf value) and evaluated
+    level by level for every (row, tree) pair at once, bypassing sklearn's
+    input validation and joblib dispatch. Thresholds are held in float32
+    (see float32_thresholds), so rows are compared without upcasting.
+    
+    Children are interleaved: the left child of node i is children[2 * i]
+    and the right child is children[2 * i + 1], so one comparison result
+    selects the next node without a branch.
+    """
+    
+    def __init__(
+        self,
+        feature: np.ndarray,
+        threshold: np.ndarray,
+        children: np.ndarray,
+        leaf_value: np.ndarray,
+        roots: np.ndarray,
+        max_depth: int,
+        n_features: int,
+        chunk_size: int = 256
+    ):
+        self.feature = feature
+        self.threshold = float32_thresholds(threshold)
+        self.children = children
+        self.leaf_value = leaf_value
+        self.roots = roots
+        self.max_depth = max_depth
+        self.n_features = n_features
+        self.n_trees = len(roots)
+        self.chunk_size = chunk_size
+    
+    @classmethod
+    def from_sklearn(cls, model, positive_class: int = 1) -> "CompiledForest":
+        """
+        Export a fitted sklearn forest into flat arrays.
+        
+        Leaf nodes point to themselves, so a fixed number of traversal steps
+        (the deepest tree's depth) lands every row on its leaf.
+        
+        Regression forests (distilled students trained on P(fraud)) are
+        exported with their leaf means as the fraud probability.
+        
+        Args:
+            model: Fitted RandomForestClassifier (or any forest with estimators_)
+            positive_class: Label of the fraud class
+            
+        Returns:
+            CompiledForest instance
+        """
+        is_classifier = hasattr(model, 'classes_')
+        if is_classifier:
+            class_index = int(np.flatnonzero(model.classes_ == positive_class)[0])
+        
+        features, thresholds, children, values, roots = [], [], [], [], []
+        offset = 0
+        max_depth = 0
+        
+        for estimator in model.estimators_:
+            tree = estimator.tree_
+            node_ids = np.arange(tree.node_count, dtype=np.intp)
+            is_leaf = tree.children_left == -1
+            
+            # Leaves loop back onto themselves
+            pairs = np.empty((tree.node_count, 2), dtype=np.intp)
+            pairs[:, 0] = np.where(is_leaf, node_ids, tree.children_left) + offset
+            pairs[:, 1] = np.where(is_leaf, node_ids, tree.children_right) + offset
+            children.append(pairs.ravel())
+            features.append(np.where(is_leaf, 0, tree.feature).astype(np.intp))
+            thresholds.append(np.where(is_leaf, np.inf, tree.threshold))
+            
+            if is_classifier:
+                # Per-leaf class probabilities, normalised like DecisionTreeClassifier.predict_proba
+                value = tree.value[:, 0, :]
+                normalizer = value.sum(axis=1)
+                normalizer[normalizer == 0.0] = 1.0
+                values.append(value[:, class_index] / normalizer)
+            else:
+                values.append(tree.value[:, 0, 0])
+            
+            roots.append(offset)
+            offset += tree.node_count
+            max_depth = max(max_depth, tree.max_depth)
+        
+        return cls(
+            feature=np.ascontiguousarray(np.concatenate(features)),
+            threshold=np.concatenate(thresholds).astype(np.float64),
+            children=np.ascontiguousarray(np.concatenate(children), dtype=np.intp),
+            leaf_value=np.ascontiguousarray(np.concatenate(values), dtype=np.float64),
+            roots=np.asarray(roots, dtype=np.intp),
+            max_depth=int(max_depth),
+            n_features=int(model.n_features_in_)
+        )
+    
+    def fold_scaler(self, mean: np.ndarray, scale: np.ndarray, columns: Sequence[int]) -> "CompiledForest":
+        """
+        Fold an affine feature scaler into the split thresholds.
+        
+        A split ``(x - mean) / scale <= t`` on a scaled column is rewritten as
+        ``x <= t * scale + mean``, so the returned forest takes raw features.
+        Decisions are identical except for raw values that fall within float32
+        rounding of a split boundary.
+        
+        Args:
+            mean: Per-column offsets (StandardScaler.mean_)
+            scale: Per-column positive scales (StandardScaler.scale_)
+            columns: Feature indices the scaler was applied to
+            
+        Returns:
+            New CompiledForest operating on unscaled inputs
+        """
+        threshold = self.threshold.astype(np.float64)
+        is_split = self.children[0::2] != np.arange(len(self.feature))
+        
+        for column, column_mean, column_scale in zip(columns, mean, scale):
+            if column_scale <= 0:
+                raise ValueError(f"Scale for column {column} must be positive, got {column_scale}")
+            mask = is_split & (self.feature == column)
+            threshold[mask] = threshold[mask] * column_scale + column_mean
+        
+        return CompiledForest(
+            feature=self.feature,
+            threshold=threshold,
+            children=self.children,
+            leaf_value=self.leaf_value,
+            roots=self.roots,
+            max_depth=self.max_depth,
+            n_features=self.n_features,
+            chunk_size=self.chunk_size
+        )
+    
+    def save(self, path: str) -> None:
+        """
+        Save the flat arrays to an uncompressed .npz file.
+        
+        Args:
+            path: Output file path
+        """
+        np.savez(
+            path,
+            feature=self.feature,
+            threshold=self.threshold,
+            children=self.children,
+            leaf_value=self.leaf_value,
+            roots=self.roots,
+            max_depth=np.int64(self.max_depth),
+            n_features=np.int64(self.n_features)
+        )
+    
+    @classmethod
+    def load(cls, path: str) -> "CompiledForest":
+        """
+        Load a forest written by save().
+        
+        Args:
+            path: Path to the .npz file
+            
+        Returns:
+            CompiledForest instance
+        """
+        with np.load(path) as data:
+            return cls(
+                feature=data['feature'].astype(np.intp),
+                threshold=data['threshold'],
+                children=data['children'].astype(np.intp),
+                leaf_value=data['leaf_value'],
+                roots=data['roots'].astype(np.intp),
+                max_depth=int(data['max_depth']),
+                n_features=int(data['n_features'])
+            )
+    
+    def save_raw(self, path: str) -> None:
+        """
+        Save the flat arrays into a single memory-mappable binary file.
+        
+        Layout: 8-byte magic, 8-byte little-endian header length, a JSON
+        header (array dtypes, shapes and offsets, scalar fields), then each
+        array at a 64-byte aligned offset.
+        
+        Args:
+            path: Output file path
+        """
+        arrays = {
+            'feature': self.feature.astype('<i8'),
+            'threshold': self.threshold.astype('<f4'),
+            'children': self.children.astype('<i8'),
+            'leaf_value': self.leaf_value.astype('<f8'),
+            'roots': self.roots.astype('<i8')
+        }
+        
+        # Header size depends on the offsets it contains, so reserve room first
+        layout = {name: {'dtype': a.dtype.str, 'shape': list(a.shape), 'offset': 0}
+                  for name, a in arrays.items()}
+        header = {'max_depth': self.max_depth, 'n_features': self.n_features, 'arrays': layout}
+        data_start = _align(16 + len(json.dumps(header)) + 256)
+        
+        offset = data_start
+        for name, array in arrays.items():
+            layout[name]['offset'] = offset
+            offset = _align(offset + array.nbytes)
+        
+        header_bytes = json.dumps(header).encode('utf-8')
+        if 16 + len(header_bytes) > data_start:
+            raise ValueError("Compiled forest header does not fit its reserved space")
+        
+        # Write beside the target and rename, so processes that have the old
+        # file mapped keep a valid mapping while the new one is swapped in
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(RAW_FOREST_MAGIC)
+            f.write(len(header_bytes).to_bytes(8, 'little'))
+            f.write(header_bytes)
+            for name, array in arrays.items():
+                f.seek(layout[name]['offset'])
+                f.write(array.tobytes())
+        os.replace(tmp_path, path)
+    
+    @classmethod
+    def load_raw(cls, path: str) -> "CompiledForest":
+        """
+        Memory-map a forest written by save_raw().
+        
+        The arrays are read-only views on one shared mapping, so every
+        process that loads the same file shares its physical pages and
+        nothing is copied or unpickled.
+        
+        Args:
+            path: Path to the binary file
+            
+        Returns:
+            CompiledForest instance backed by the mapping
+        """
+        with open(path, 'rb') as f:
+            if f.read(8) != RAW_FOREST_MAGIC:
+                raise ValueError(f"Not a compiled forest file: {path}")
+            header_length = int.from_bytes(f.read(8), 'little')
+            header = json.loads(f.read(header_length))
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        arrays = {}
+        for name, spec in header['arrays'].items():
+            dtype = np.dtype(spec['dtype'])
+            count = int(np.prod(spec['shape']))
+            arrays[name] = np.frombuffer(buffer, dtype=dtype, count=count, offset=spec['offset'])
+        
+        return cls(
+            feature=arrays['feature'],
+            threshold=arrays['threshold'],
+            children=arrays['children'],
+            leaf_value=arrays['leaf_value'],
+            roots=arrays['roots'],
+            max_depth=int(header['max_depth']),
+            n_features=int(header['n_features'])
+        )
+    
+    def predict_fraud_proba(self, X: np.ndarray) -> np.ndarray:
+        """
+        Compute P(fraud) for every row.
+        
+        Args:
+            X: Feature matrix of shape (N, n_features) or a single row
+            
+        Returns:
+            Array of shape (N,) with fraud probabilities
+        """
+        # sklearn trees split on float32 inputs; no copy for FEATURE_DTYPE rows
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        if X.shape[1] != self.n_features:
+            raise ValueError(f"Expected {self.n_features} features, got {X.shape[1]}")
+        
+        n_rows = X.shape[0]
+        if n_rows <= self.chunk_size:
+            return self._evaluate(X)
+        
+        out = np.empty(n_rows, dtype=np.float64)
+        for start in range(0, n_rows, self.chunk_size):
+            stop = start + self.chunk_size
+            out[start:stop] = self._evaluate(X[start:stop])
+        return out
+    
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """
+        sklearn-compatible two-column probability output.
+        
+        Args:
+            X: Feature matrix of shape (N, n_features)
+            
+        Returns:
+            Array of shape (N, 2) with [P(safe), P(fraud)]
+        """
+        fraud = self.predict_fraud_proba(X)
+        return np.column_stack([1.0 - fraud, fraud])
+    
+    def predict_fraud_proba_early_exit(
+        self,
+        X: np.ndarray,
+        threshold: float,
+        delta: float = EARLY_EXIT_DELTA,
+        min_trees: int = EARLY_EXIT_MIN_TREES,
+        step: int = EARLY_EXIT_STEP
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute P(fraud), stopping early for rows far from the threshold.
+        
+        Trees are evaluated in their stored order. Bagged trees are
+        exchangeable, so the first k leaf values are treated as a sample
+        drawn without replacement from all n. With m exit checks, after k
+        trees the Hoeffding-Serfling bound
+        
+            eps_k = sqrt((1 - (k - 1) / n) * ln(2m / delta) / (2 * k))
+        
+        holds |partial mean - full mean| <= eps_k with probability at least
+        1 - delta / m, so all m checks hold at once, and an exited row gets
+        the full forest's decision, with probability at least 1 - delta.
+        Rows whose partial mean is more than eps_k from the threshold keep
+        that partial mean and skip the remaining trees.
+        
+        Args:
+            X: Feature matrix of shape (N, n_features) or a single row
+            threshold: Decision threshold on P(fraud)
+            delta: Allowed probability, per row, of exiting with the wrong
+                decision (split across the exit checks)
+            min_trees: Trees evaluated before the first exit check
+            step: Trees evaluated between exit checks
+            
+        Returns:
+            Tuple of (fraud probabilities, number of trees each row used);
+            rows with fewer than n_trees report a partial average
+        """
+        if not 0.0 < delta < 1.0:
+            raise ValueError(f"Early-exit delta must be in (0, 1), got {delta}")
+        if min_trees < 1 or step < 1:
+            raise ValueError("Early-exit min_trees and step must be positive")
+        
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        if X.shape[1] != self.n_features:
+            raise ValueError(f"Expected {self.n_features} features, got {X.shape[1]}")
+        
+        checkpoints, margins = _early_exit_schedule(self.n_trees, delta, min_trees, step)
+        
+        n_rows = X.shape[0]
+        if n_rows <= EARLY_EXIT_CHUNK_ROWS:
+            return self._evaluate_early_exit(X, threshold, checkpoints, margins)
+        
+        proba = np.empty(n_rows, dtype=np.float64)
+        trees_used = np.empty(n_rows, dtype=np.intp)
+        for start in range(0, n_rows, EARLY_EXIT_CHUNK_ROWS):
+            stop = start + EARLY_EXIT_CHUNK_ROWS
+            proba[start:stop], trees_used[start:stop] = self._evaluate_early_exit(
+                X[start:stop], threshold, checkpoints, margins
+            )
+        return proba, trees_used
+    
+    def _evaluate(self, X: np.ndarray) -> np.ndarray:
+        """Traverse all trees for a block of float32 rows."""
+        return self._leaf_sum(X, self.roots) / self.n_trees
+    
+    def _evaluate_early_exit(
+        self,
+        X: np.ndarray,
+        threshold: float,
+        checkpoints: Tuple[int, ...],
+        margins: Tuple[float, ...]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Traverse trees checkpoint by checkpoint, dropping decided rows."""
+        n_rows = X.shape[0]
+        leaf_sum = np.zeros(n_rows, dtype=np.float64)
+        trees_used = np.full(n_rows, self.n_trees, dtype=np.intp)
+        active = np.arange(n_rows, dtype=np.intp)
+        
+        first_tree = 0
+        for last_tree, margin in zip(checkpoints, margins):
+            leaf_sum[active] += self._leaf_sum(X, self.roots[first_tree:last_tree])
+            first_tree = last_tree
+            if last_tree == self.n_trees:
+                break
+            
+            decided = np.abs(leaf_sum[active] / last_tree - threshold) > margin
+            if decided.any():
+                trees_used[active[decided]] = last_tree
+                undecided = ~decided
+                active = active[undecided]
+                X = X[undecided]
+                if not len(active):
+                    break
+        
+        return leaf_sum / trees_used, trees_used
+    
+    def _leaf_sum(self, X: np.ndarray, roots: np.ndarray) -> np.ndarray:
+        """Sum the leaf values reached by each row over the given trees."""
+        n_rows, n_features = X.shape
+        flat = np.ascontiguousarray(X).ravel()
+        row_offsets = (np.arange(n_rows, dtype=np.intp) * n_features)[:, None]
+        node = np.repeat(roots[None, :], n_rows, axis=0)
+        
+        for _ in range(self.max_depth):
+            values = flat.take(self.feature.take(node) + row_offsets)
+            go_right = values > self.threshold.take(node)
+            node *= 2
+            node += go_right
+            node = self.children.take(node)
+        
+        return self.leaf_value.take(node).sum(axis=1)
+
 
 class FraudDetectionModel:
     """
@@ -25,8 +716,24 @@ class FraudDetectionModel:
     def __init__(self):
         self.model = None
         self.scaler = None
+        self.scaler_mean: Optional[np.ndarray] = None
+        self.scaler_scale: Optional[np.ndarray] = None
         self.model_loaded = False
         self.scaler_loaded = False
+        self.scaler_fused = False
+        self.decision_threshold = DEFAULT_DECISION_THRESHOLD
+        self.use_compiled_forest = True
+        self.compiled_forest: Optional[CompiledForest] = None
+        self.early_exit_delta: Optional[float] = None
+        self.early_exit_min_trees = EARLY_EXIT_MIN_TREES
+        self.use_cascade = False
+        self.cascade_weights: Optional[np.ndarray] = None
+        self.cascade_bias = 0.0
+        self.cascade_threshold: Optional[float] = None
+        self.version: Optional[str] = None
+        self.artifact: Optional[Dict[str, Any]] = None
+        self._sidecar_paths: List[str] = []
+        self.loaded_at: Optional[str] = None
         self.feature_names = [
             'Time', 'V1', 'V2', 'V3', 'V4', 'V5', 'V6', 'V7', 'V8', 'V9',
             'V10', 'V11', 'V12', 'V13', 'V14', 'V15', 'V16', 'V17', 'V18', 'V19',
@@ -60,6 +767,14 @@ class FraudDetectionModel:
             with open(model_path, 'rb') as f:
                 self.model = pickle.load(f)
             
+            self.scaler_fused = False
+            self._sidecar_paths = []
+            meta = self._load_model_meta(os.path.dirname(model_path), os.path.basename(model_path))
+            if self.use_cascade:
+                self._load_cascade(meta)
+            self._compile_model()
+            self._set_artifact("pickle", model_path)
+            
             self.model_loaded = True
             logger.info("✅ Model loaded successfully!")
             return True
@@ -69,6 +784,259 @@ class FraudDetectionModel:
             self.model_loaded = False
             return False
     
+    def load_fused_model(self, model_path: Optional[str] = None, mmap_mode: bool = False) -> bool:
+        """
+        Load a scaler-fused compiled forest from disk.
+        
+        The Time/Amount scaler is folded into the split thresholds, so no
+        scaler is loaded and _apply_scaling is never called at serve time.
+        
+        Args:
+            model_path: Path to the fused artifact. If None, uses default path.
+            mmap_mode: Memory-map the raw .bin artifact read-only instead of
+                reading the .npz, so worker processes share one copy.
+            
+        Returns:
+            True if model loaded successfully, False otherwise.
+        """
+        try:
+            if model_path is None:
+                current_dir = os.path.dirname(os.path.abspath(__file__))
+                filename = RAW_MODEL_FILENAME if mmap_mode else FUSED_MODEL_FILENAME
+                model_path = os.path.join(current_dir, '..', 'model', filename)
+            
+            model_path = os.path.abspath(model_path)
+            logger.info(f"Loading fused model from: {model_path}")
+            
+            if not os.path.exists(model_path):
+                logger.error(f"❌ Fused model file not found: {model_path}")
+                return False
+            
+            if mmap_mode:
+                self.compiled_forest = CompiledForest.load_raw(model_path)
+            else:
+                self.compiled_forest = CompiledForest.load(model_path)
+            self.model = None
+            self.scaler = None
+            self.scaler_mean = None
+            self.scaler_scale = None
+            self.scaler_loaded = False
+            self.scaler_fused = True
+            self._sidecar_paths = []
+            meta = self._load_model_meta(os.path.dirname(model_path), os.path.basename(model_path))
+            if self.use_cascade:
+                self._load_cascade(meta)
+            self._set_artifact("mmap" if mmap_mode else "fused", model_path)
+            
+            self.model_loaded = True
+            logger.info(f"✅ Fused model loaded: {self.compiled_forest.n_trees} trees")
+            return True
+            
+        except Exception as e:
+            logger.error(f"❌ Failed to load fused model: {e}")
+            self.model_loaded = False
+            return False
+    
+    def _set_artifact(self, kind: str, model_path: str) -> None:
+        """Record where the model came from and its content version."""
+        self.artifact = {
+            "kind": kind,
+            "model_path": model_path,
+            "scaler_path": None,
+            "files": [model_path] + self._sidecar_paths
+        }
+        self.version = artifact_version(self.artifact["files"])
+        self.loaded_at = datetime.utcnow().isoformat()
+    
+    def _compile_model(self) -> None:
+        """Export the loaded forest into a CompiledForest, if possible."""
+        self.compiled_forest = None
+        if not self.use_compiled_forest or not hasattr(self.model, 'estimators_'):
+            return
+        
+        try:
+            self.compiled_forest = CompiledForest.from_sklearn(self.model)
+            logger.info(
+                f"✅ Compiled forest: {self.compiled_forest.n_trees} trees, "
+                f"{len(self.compiled_forest.feature)} nodes"
+            )
+        except Exception as e:
+            logger.warning(f"⚠️  Could not compile forest, using sklearn: {e}")
+            self.compiled_forest = None
+    
+    def _predict_fraud_proba(self, X: np.ndarray) -> np.ndarray:
+        """
+        Compute P(fraud) for a feature matrix with the active inference engine.
+        
+        Args:
+            X: Scaled feature matrix of shape (N, 30)
+            
+        Returns:
+            Array of shape (N,) with fraud probabilities
+        """
+        return self._predict_fraud_proba_partial(X)[0]
+    
+    def _predict_fraud_proba_partial(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute P(fraud), with the cascade and early exit when enabled.
+        
+        With the cascade on, rows the logistic regression scores below the
+        cascade threshold skip the forest and report the regression's
+        probability. The gate never exceeds the decision threshold, so a
+        skipped row is always classified safe.
+        
+        Args:
+            X: Scaled feature matrix of shape (N, 30)
+            
+        Returns:
+            Tuple of (fraud probabilities, boolean flags marking rows whose
+            probability is not the full forest average: cascade-skipped
+            rows and early exits)
+        """
+        if self.use_cascade and self.cascade_weights is not None:
+            logits = np.clip((X @ self.cascade_weights).astype(np.float64) + self.cascade_bias, -500.0, 500.0)
+            proba = 1.0 / (1.0 + np.exp(-logits))
+            forward = proba >= min(self.cascade_threshold, self.decision_threshold)
+            if not forward.all():
+                partial = ~forward
+                if forward.any():
+                    proba[forward], partial[forward] = self._forest_proba_partial(X[forward])
+                return proba, partial
+        return self._forest_proba_partial(X)
+    
+    def _forest_proba_partial(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Compute P(fraud) with the forest, with early exit when it is enabled."""
+        if self.early_exit_delta is not None and self.compiled_forest is not None:
+            proba, trees_used = self.compiled_forest.predict_fraud_proba_early_exit(
+                X, self.decision_threshold, self.early_exit_delta, self.early_exit_min_trees
+            )
+            return proba, trees_used < self.compiled_forest.n_trees
+        
+        if self.compiled_forest is not None and (
+            self.model is None or X.shape[0] <= COMPILED_FOREST_MAX_ROWS
+        ):
+            proba = self.compiled_forest.predict_fraud_proba(X)
+        else:
+            proba = self._sklearn_fraud_proba(X)
+        return proba, np.zeros(len(proba), dtype=bool)
+    
+    def _sklearn_fraud_proba(self, X: np.ndarray) -> np.ndarray:
+        """P(fraud) from the sklearn model; regression students predict it directly."""
+        if hasattr(self.model, 'predict_proba'):
+            return self.model.predict_proba(X)[:, 1]
+        return np.clip(self.model.predict(X), 0.0, 1.0)
+    
+    def _load_model_meta(self, model_dir: str, model_filename: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Load model metadata (decision and cascade thresholds) stored with the artifact.
+        
+        Keys under meta["artifacts"][model_filename] override the top-level
+        ones, so artifacts sharing a directory (e.g. the distilled student)
+        can carry their own thresholds.
+        
+        Args:
+            model_dir: Directory containing the model pickle
+            model_filename: File name of the artifact being loaded
+            
+        Returns:
+            The metadata dictionary (empty if there is no metadata file)
+        """
+        meta_path = os.path.join(model_dir, MODEL_META_FILENAME)
+        self._sidecar_paths.append(meta_path)
+        if not os.path.exists(meta_path):
+            logger.info(f"No {MODEL_META_FILENAME} found - using default threshold")
+            self.decision_threshold = DEFAULT_DECISION_THRESHOLD
+            self.cascade_threshold = None
+            return {}
+        
+        with open(meta_path, 'r') as f:
+            meta = json.load(f)
+        overrides = meta.get('artifacts', {}).get(model_filename)
+        if overrides:
+            logger.info(f"Using {MODEL_META_FILENAME} thresholds for {model_filename}")
+            meta = {**meta, **overrides}
+        
+        self.set_decision_threshold(meta.get('decision_threshold', DEFAULT_DECISION_THRESHOLD))
+        self.cascade_threshold = meta.get('cascade_threshold')
+        return meta
+    
+    def _load_cascade(self, meta: Dict[str, Any]) -> None:
+        """
+        Load the logistic regression pre-filter from the model metadata.
+        
+        ml/train_model.py stores the regression as one weight vector and a
+        bias: cascade_weights/cascade_bias for scaled features, and
+        cascade_raw_weights/cascade_raw_bias with the Time/Amount scaler
+        folded in, for scaler-fused artifacts. No pickle or scikit-learn
+        import is needed.
+        
+        Args:
+            meta: Metadata returned by _load_model_meta
+        """
+        self.cascade_weights = None
+        self.cascade_bias = 0.0
+        prefix = 'cascade_raw_' if self.scaler_fused else 'cascade_'
+        weights = meta.get(prefix + 'weights')
+        if weights is None or self.cascade_threshold is None:
+            logger.warning(
+                f"⚠️  No cascade weights or threshold in {MODEL_META_FILENAME} - scoring every row with the forest"
+            )
+            return
+        
+        weights = np.asarray(weights, dtype=np.float64)
+        if weights.shape != (N_FEATURES,):
+            logger.warning(
+                f"⚠️  Cascade weights have shape {weights.shape}, expected ({N_FEATURES},) - "
+                f"scoring every row with the forest"
+            )
+            return
+        
+        self.cascade_weights = weights.astype(FEATURE_DTYPE)
+        self.cascade_bias = float(meta.get(prefix + 'bias', 0.0))
+        logger.info(f"✅ Cascade pre-filter loaded (threshold {self.cascade_threshold})")
+    
+    def set_decision_threshold(self, threshold: float) -> None:
+        """
+        Set the fraud decision threshold.
+        
+        A transaction is flagged as fraud when P(fraud) is strictly above
+        the threshold.
+        
+        Args:
+            threshold: Threshold on P(fraud), between 0 and 1
+        """
+        threshold = float(threshold)
+        if not 0.0 <= threshold <= 1.0:
+            raise ValueError(f"Decision threshold must be in [0, 1], got {threshold}")
+        self.decision_threshold = threshold
+        logger.info(f"Decision threshold set to {threshold}")
+    
+    def set_early_exit(self, delta: Optional[float], min_trees: int = EARLY_EXIT_MIN_TREES) -> None:
+        """
+        Enable or disable early-exit forest evaluation.
+        
+        Needs the compiled forest; with the sklearn engine every tree is
+        always evaluated.
+        
+        Args:
+            delta: Allowed probability that an early exit flips a decision
+                (see CompiledForest.predict_fraud_proba_early_exit), or None
+                to evaluate every tree
+            min_trees: Trees evaluated before the first exit check
+        """
+        if delta is not None and not 0.0 < delta < 1.0:
+            raise ValueError(f"Early-exit delta must be in (0, 1), got {delta}")
+        if min_trees < 1:
+            raise ValueError(f"Early-exit min_trees must be positive, got {min_trees}")
+        if delta is not None and self.compiled_forest is None:
+            logger.warning("⚠️  Early exit needs the compiled forest - evaluating every tree")
+        self.early_exit_delta = delta
+        self.early_exit_min_trees = min_trees
+        if delta is None:
+            logger.info("Early exit disabled")
+        else:
+            logger.info(f"Early exit enabled (delta={delta}, min_trees={min_trees})")
+    
     def load_scaler(self, scaler_path: Optional[str] = None) -> bool:
         """
         Load the feature scaler from disk.
@@ -79,6 +1047,10 @@ class FraudDetectionModel:
         Returns:
             True if scaler loaded successfully, False otherwise.
         """
+        if self.scaler_fused:
+            logger.info("Scaler is fused into the loaded model - skipping scaler load")
+            return True
+        
         try:
             # Determine scaler path
             if scaler_path is None:
@@ -95,6 +1067,17 @@ class FraudDetectionModel:
             with open(scaler_path, 'rb') as f:
                 self.scaler = pickle.load(f)
             
+            # StandardScaler parameters, applied in float32 without sklearn
+            if hasattr(self.scaler, 'mean_') and hasattr(self.scaler, 'scale_'):
+                self.scaler_mean = np.asarray(self.scaler.mean_, dtype=FEATURE_DTYPE)
+                self.scaler_scale = np.asarray(self.scaler.scale_, dtype=FEATURE_DTYPE)
+            else:
+                self.scaler_mean = self.scaler_scale = None
+            
+            if self.artifact is not None:
+                self.artifact["scaler_path"] = scaler_path
+                self.artifact["files"].append(scaler_path)
+                self.version = artifact_version(self.artifact["files"])
             self.scaler_loaded = True
             logger.info("✅ Scaler loaded successfully!")
             return True
@@ -104,12 +1087,12 @@ class FraudDetectionModel:
             self.scaler_loaded = False
             return False
     
-    def predict(self, features: dict) -> Tuple[bool, float, str]:
+    def predict(self, features: FeatureSource) -> Tuple[bool, float, str]:
         """
         Make a fraud prediction on input features.
         
         Args:
-            features: Dictionary containing transaction features
+            features: TransactionInput or dictionary containing transaction features
             
         Returns:
             Tuple of (is_fraud, confidence, message)
@@ -128,12 +1111,11 @@ class FraudDetectionModel:
             # Reshape for single prediction
             X = feature_array.reshape(1, -1)
             
-            # Make prediction
-            prediction = self.model.predict(X)[0]
-            confidence = self.model.predict_proba(X)[0][1]  # Probability of fraud class
+            # Single forest pass; the label is derived from the probability
+            confidence = self._predict_fraud_proba(X)[0]  # Probability of fraud class
             
             # Determine message based on confidence
-            is_fraud = bool(prediction == 1)
+            is_fraud = bool(confidence > self.decision_threshold)
             message = self._get_message(is_fraud, confidence)
             
             return is_fraud, float(confidence), message
@@ -142,35 +1124,110 @@ class FraudDetectionModel:
             logger.error(f"❌ Prediction error: {e}")
             raise
     
-    def _extract_features(self, features: dict) -> np.ndarray:
+    def predict_batch(self, features_list: Sequence[FeatureSource]) -> List[Tuple[bool, float, str]]:
         """
-        Extract features from input dictionary in correct order.
+        Make fraud predictions for a batch of transactions in one pass.
+        
+        All rows are stacked into a single (N, 30) matrix, Time/Amount are
+        scaled with one scaler call and the model is queried once.
         
         Args:
-            features: Input feature dictionary
+            features_list: List of TransactionInputs or transaction feature dictionaries
             
         Returns:
-            NumPy array of features
+            List of (is_fraud, confidence, message) tuples, in input order
         """
-        # Map input keys to feature names
-        feature_map = {
-            'time': 'Time',
-            'v1': 'V1', 'v2': 'V2', 'v3': 'V3', 'v4': 'V4',
-            'v5': 'V5', 'v6': 'V6', 'v7': 'V7', 'v8': 'V8', 'v9': 'V9',
-            'v10': 'V10', 'v11': 'V11', 'v12': 'V12', 'v13': 'V13', 'v14': 'V14',
-            'v15': 'V15', 'v16': 'V16', 'v17': 'V17', 'v18': 'V18', 'v19': 'V19',
-            'v20': 'V20', 'v21': 'V21', 'v22': 'V22', 'v23': 'V23', 'v24': 'V24',
-            'v25': 'V25', 'v26': 'V26', 'v27': 'V27', 'v28': 'V28',
-            'amount': 'Amount'
-        }
+        if not self.model_loaded:
+            raise RuntimeError("Model not loaded. Call load_model() first.")
+        
+        if not features_list:
+            return []
+        
+        return self.predict_matrix(self._extract_feature_matrix(features_list))
+    
+    def predict_matrix(self, X: np.ndarray) -> List[Tuple[bool, float, str]]:
+        """
+        Make fraud predictions for a raw (unscaled) feature matrix.
+        
+        Args:
+            X: Array of shape (N, 30) in FEATURE_KEYS order; FEATURE_DTYPE
+                input may be scaled in place
+            
+        Returns:
+            List of (is_fraud, confidence, message) tuples, in row order
+        """
+        is_fraud, confidences = self.predict_arrays(X)
+        messages = [MESSAGES[i] for i in message_indices(is_fraud, confidences).tolist()]
+        return list(zip(is_fraud.tolist(), confidences.tolist(), messages))
+    
+    def predict_arrays(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Make fraud predictions for a raw feature matrix, as arrays.
+        
+        Args:
+            X: Array of shape (N, 30) in FEATURE_KEYS order; FEATURE_DTYPE
+                input may be scaled in place
+            
+        Returns:
+            Tuple of (boolean decisions, float64 fraud probabilities)
+        """
+        is_fraud, confidences, _ = self.predict_arrays_partial(X)
+        return is_fraud, confidences
+    
+    def predict_arrays_partial(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Like predict_arrays, but also flag early-exit rows.
         
-        # Build feature array
-        feature_array = []
-        for key, feature_name in feature_map.items():
-            value = features.get(key, 0.0)
-            feature_array.append(float(value))
+        Args:
+            X: Array of shape (N, 30) in FEATURE_KEYS order; FEATURE_DTYPE
+                input may be scaled in place, other dtypes are converted once
+            
+        Returns:
+            Tuple of (boolean decisions, float64 fraud probabilities, boolean
+            flags marking probabilities that are partial averages)
+        """
+        if not self.model_loaded:
+            raise RuntimeError("Model not loaded. Call load_model() first.")
         
-        return np.array(feature_array)
+        try:
+            X = np.asarray(X, dtype=FEATURE_DTYPE)
+            
+            # Apply scaling if scaler is available
+            if self.scaler_loaded and self.scaler is not None:
+                X = self._apply_scaling_batch(X)
+            
+            # One forest pass for the whole batch
+            confidences, partial = self._predict_fraud_proba_partial(X)
+            confidences = np.asarray(confidences, dtype=np.float64)
+            return confidences > self.decision_threshold, confidences, partial
+            
+        except Exception as e:
+            logger.error(f"❌ Batch prediction error: {e}")
+            raise
+    
+    def _extract_features(self, features: FeatureSource) -> np.ndarray:
+        """
+        Extract features from a TransactionInput or dictionary in correct order.
+        
+        Args:
+            features: TransactionInput instance or input feature dictionary
+            
+        Returns:
+            NumPy array of features
+        """
+        return fill_feature_row(features, np.empty(N_FEATURES, dtype=FEATURE_DTYPE))
+    
+    def _extract_feature_matrix(self, features_list: Sequence[FeatureSource]) -> np.ndarray:
+        """
+        Extract features from a list of TransactionInputs or dictionaries.
+        
+        Args:
+            features_list: List of TransactionInput instances or feature dictionaries
+            
+        Returns:
+            NumPy array of shape (N, 30)
+        """
+        return feature_matrix(features_list)
     
     def _apply_scaling(self, feature_array: np.ndarray) -> np.ndarray:
         """
@@ -186,14 +1243,41 @@ class FraudDetectionModel:
         scaled = feature_array.copy()
         
         # Time is at index 0, Amount is at index 29
-        time_amount = scaled[[0, 29]].reshape(1, -1)
-        scaled_time_amount = self.scaler.transform(time_amount)
-        
-        scaled[0] = scaled_time_amount[0, 0]
-        scaled[29] = scaled_time_amount[0, 1]
+        scaled[[0, 29]] = self._scale_time_amount(scaled[[0, 29]].reshape(1, -1))[0]
         
         return scaled
     
+    def _apply_scaling_batch(self, X: np.ndarray) -> np.ndarray:
+        """
+        Apply scaling to the Time and Amount columns of a feature matrix.
+        
+        Args:
+            X: Raw feature matrix of shape (N, 30)
+            
+        Returns:
+            Scaled feature matrix (X is modified in place unless read-only,
+            e.g. a view on a request body, in which case it is copied)
+        """
+        if not X.flags.writeable:
+            X = X.copy()
+        # Time is column 0, Amount is column 29
+        X[:, [0, 29]] = self._scale_time_amount(X[:, [0, 29]])
+        return X
+    
+    def _scale_time_amount(self, time_amount: np.ndarray) -> np.ndarray:
+        """
+        Scale (N, 2) Time/Amount values, in float32 for a StandardScaler.
+        
+        Args:
+            time_amount: Raw Time and Amount columns
+            
+        Returns:
+            Scaled values
+        """
+        if self.scaler_mean is not None:
+            return (time_amount - self.scaler_mean) / self.scaler_scale
+        return self.scaler.transform(time_amount)
+    
     def _get_message(self, is_fraud: bool, confidence: float) -> str:
         """
         Generate human-readable message based on prediction.
@@ -206,19 +1290,25 @@ class FraudDetectionModel:
             Human-readable message
         """
         if is_fraud:
-            if confidence > 0.9:
-                return "🚨 High risk transaction detected! Immediate attention required."
-            elif confidence > 0.7:
-                return "⚠️  Suspicious transaction detected. Review recommended."
-            else:
-                return "⚡ Potential fraud detected. Please verify."
-        else:
-            if confidence < 0.1:
-                return "✅ Transaction appears safe."
-            elif confidence < 0.3:
-                return "✅ Low risk transaction."
-            else:
-                return "✅ Transaction within normal parameters."
+            return FRAUD_MESSAGES[bisect.bisect_left(FRAUD_BAND_BOUNDS, confidence)]
+        return SAFE_MESSAGES[bisect.bisect_right(SAFE_BAND_BOUNDS, confidence)]
+    
+    def warmup(self, iterations: int = 3) -> None:
+        """
+        Run a few dummy predictions so the first real request does not
+        pay for lazy initialisation inside numpy/sklearn.
+        
+        Args:
+            iterations: Number of single-row warmup predictions
+        """
+        if not self.model_loaded:
+            raise RuntimeError("Model not loaded. Call load_model() first.")
+        
+        dummy = {}
+        for _ in range(iterations):
+            self.predict(dummy)
+        self.predict_batch([dummy, dummy])
+        logger.info("🔥 Model warmed up")
     
     def get_model_info(self) -> dict:
         """
@@ -229,7 +1319,21 @@ class FraudDetectionModel:
         """
         return {
             "model_loaded": self.model_loaded,
+            "version": self.version,
+            "artifact": self.artifact,
+            "loaded_at": self.loaded_at,
             "scaler_loaded": self.scaler_loaded,
+            "scaler_fused": self.scaler_fused,
+            "decision_threshold": self.decision_threshold,
+            "inference_engine": "compiled_forest" if self.compiled_forest is not None else "sklearn",
+            "cascade": None if self.cascade_weights is None else {
+                "enabled": self.use_cascade,
+                "threshold": self.cascade_threshold
+            },
+            "early_exit": None if self.early_exit_delta is None else {
+                "delta": self.early_exit_delta,
+                "min_trees": self.early_exit_min_trees
+            },
             "feature_count": len(self.feature_names),
             "features": self.feature_names
         }
@@ -242,3 +1346,17 @@ fraud_model = FraudDetectionModel()
 def get_model() -> FraudDetectionModel:
     """Get the global fraud detection model instance."""
     return fraud_model
+
+
+def set_model(model: FraudDetectionModel) -> None:
+    """
+    Replace the global model instance.
+    
+    Rebinding the global is atomic; callers that already hold the old
+    instance from get_model() keep using it until they finish.
+    
+    Args:
+        model: Loaded model to serve from now on
+    """
+    global fraud_model
+    fraud_model = model
@@ -0,0 +1,306 @@
+"""
+Model Registry Module
+=====================
+Versioned model hot-reload: load a candidate in the background, validate it
+on a holdout batch, then atomically swap it in.
+"""
+
+import os
+import logging
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .model import FEATURE_DTYPE, N_FEATURES, FraudDetectionModel, get_model, load_artifact, set_model
+
+logger = logging.getLogger(__name__)
+
+# Labelled raw-feature holdout written next to the model by ml/train_model.py
+HOLDOUT_FILENAME = 'holdout.npz'
+
+# Rows in the synthetic batch used when no holdout file exists
+SMOKE_TEST_ROWS = 64
+
+
+class ModelReloadError(RuntimeError):
+    """Raised when a candidate model cannot be loaded or fails validation."""
+
+
+class ModelRegistry:
+    """
+    Keeps a history of served model versions and swaps in new ones.
+
+    A reload builds a fresh FraudDetectionModel next to the serving one,
+    validates it, warms it up and only then rebinds the global model.
+    Requests that already hold the old instance finish on it, so a reload
+    never fails or stalls in-flight predictions. Reloads are serialized.
+    """
+
+    def __init__(
+        self,
+        holdout_path: Optional[str] = None,
+        max_recall_drop: float = 0.05,
+        max_history: int = 20
+    ):
+        self.holdout_path = holdout_path
+        self.max_recall_drop = max_recall_drop
+        self._history: Deque[Dict[str, Any]] = deque(maxlen=max_history)
+        self._lock = threading.Lock()
+        self._watch_thread: Optional[threading.Thread] = None
+        self._watch_stop = threading.Event()
+        self._swap_listeners: List[Callable[[FraudDetectionModel], None]] = []
+
+    def add_swap_listener(self, listener: Callable[[FraudDetectionModel], None]) -> None:
+        """
+        Register a callback run with the new model after every swap.
+
+        Args:
+            listener: Callable taking the newly active model
+        """
+        self._swap_listeners.append(listener)
+
+    def register_current(self) -> None:
+        """Record the model loaded at startup as the active version."""
+        model = get_model()
+        if model.model_loaded:
+            self._history.append(self._entry(model, "active"))
+
+    def reload(
+        self,
+        artifact: Optional[str] = None,
+        model_path: Optional[str] = None,
+        scaler_path: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Load, validate and swap in a model artifact.
+
+        Args:
+            artifact: "pickle", "fused" or "mmap". If None, reuses the
+                serving model's artifact kind (or "pickle").
+            model_path: Artifact path. If None, reuses the serving model's path.
+            scaler_path: Scaler pickle for the "pickle" artifact
+
+        Returns:
+            History entry for the candidate, with status "active" or "unchanged"
+
+        Raises:
+            ModelReloadError: If the candidate cannot be loaded or fails validation
+        """
+        with self._lock:
+            current = get_model()
+            served = current.artifact or {}
+            artifact = artifact or served.get("kind") or "pickle"
+            if model_path is None and artifact == served.get("kind"):
+                model_path = served.get("model_path")
+                scaler_path = scaler_path or served.get("scaler_path")
+
+            candidate = FraudDetectionModel()
+            if not load_artifact(candidate, artifact, model_path, scaler_path):
+                raise ModelReloadError(f"Could not load {artifact} model from {model_path or 'default path'}")
+
+            if current.model_loaded and candidate.version == current.version:
+                logger.info(f"Model version {candidate.version} is already serving")
+                return self._entry(candidate, "unchanged")
+
+            try:
+                validation = self.validate(candidate, current)
+            except ModelReloadError as e:
+                self._history.append(self._entry(candidate, "rejected", error=str(e)))
+                logger.warning(f"⚠️  Rejected model {candidate.version}: {e}")
+                raise
+
+            candidate.warmup()
+            set_model(candidate)
+            for listener in self._swap_listeners:
+                listener(candidate)
+
+            for entry in self._history:
+                if entry["status"] == "active":
+                    entry["status"] = "retired"
+            entry = self._entry(candidate, "active", validation=validation)
+            self._history.append(entry)
+            logger.info(f"✅ Swapped model {current.version} -> {candidate.version}")
+            return entry
+
+    def validate(self, candidate: FraudDetectionModel, current: FraudDetectionModel) -> Dict[str, Any]:
+        """
+        Score the holdout batch with a candidate and compare it to the current model.
+
+        The candidate must produce finite probabilities in [0, 1]. With a
+        labelled holdout its fraud recall may not fall more than
+        max_recall_drop below the current model's.
+
+        Args:
+            candidate: Loaded candidate model
+            current: Model currently serving (may be unloaded)
+
+        Returns:
+            Dictionary with row count, fraud rate, agreement and recall figures
+
+        Raises:
+            ModelReloadError: If the candidate fails a check
+        """
+        X, y = self._holdout_batch(candidate)
+        confidences, flagged = self._score(candidate, X)
+        if not np.all(np.isfinite(confidences)) or confidences.min() < 0 or confidences.max() > 1:
+            raise ModelReloadError("Candidate produced probabilities outside [0, 1]")
+
+        report: Dict[str, Any] = {
+            "rows": len(X),
+            "labelled": y is not None,
+            "fraud_rate": round(float(flagged.mean()), 4)
+        }
+
+        current_flagged = None
+        if current.model_loaded:
+            _, current_flagged = self._score(current, X)
+            report["agreement"] = round(float(np.mean(flagged == current_flagged)), 4)
+
+        if y is not None and y.any():
+            recall = float(flagged[y == 1].mean())
+            report["recall"] = round(recall, 4)
+            if current_flagged is not None:
+                current_recall = float(current_flagged[y == 1].mean())
+                report["current_recall"] = round(current_recall, 4)
+                if recall < current_recall - self.max_recall_drop:
+                    raise ModelReloadError(
+                        f"Holdout recall {recall:.4f} is below current {current_recall:.4f} "
+                        f"by more than {self.max_recall_drop}"
+                    )
+        return report
+
+    def history(self) -> List[Dict[str, Any]]:
+        """Get loaded, rejected and retired versions, newest first."""
+        return [dict(entry) for entry in reversed(self._history)]
+
+    def start_watching(self, interval: float) -> None:
+        """
+        Poll the serving artifact and reload when it changes on disk.
+
+        The model file and every sidecar its loader read (model_meta.json,
+        scaler.pkl, ...) are watched. A change is acted on once sizes and
+        mtimes are the same on two consecutive polls, so half-written files
+        are not loaded.
+
+        Args:
+            interval: Seconds between polls
+        """
+        if self._watch_thread is not None and self._watch_thread.is_alive():
+            return
+        self._watch_stop.clear()
+        self._watch_thread = threading.Thread(
+            target=self._watch, args=(interval,), name="model-watcher", daemon=True
+        )
+        self._watch_thread.start()
+        logger.info(f"✅ Watching model artifact for changes every {interval:g}s")
+
+    def stop_watching(self) -> None:
+        """Stop the file watcher thread."""
+        if self._watch_thread is None:
+            return
+        self._watch_stop.set()
+        self._watch_thread.join()
+        self._watch_thread = None
+
+    def _watch(self, interval: float) -> None:
+        """Watcher loop."""
+        seen = self._artifact_signature()
+        pending = None
+        while not self._watch_stop.wait(interval):
+            signature = self._artifact_signature()
+            if signature is None or signature == seen:
+                pending = None
+                continue
+            if signature != pending:
+                # Still being written, or first sighting - check again next poll
+                pending = signature
+                continue
+
+            pending = None
+            try:
+                self.reload()
+            except Exception as e:
+                logger.warning(f"⚠️  Model reload from watcher failed: {e}")
+            seen = self._artifact_signature()
+
+    def _artifact_signature(self) -> Optional[Tuple[Optional[Tuple[int, int]], ...]]:
+        """
+        Get (mtime_ns, size) of each file of the serving artifact.
+
+        Sidecars that do not exist are None, so creating or deleting one is
+        a change too. Returns None if the model file itself is unavailable.
+        """
+        artifact = get_model().artifact
+        if artifact is None:
+            return None
+        signature = []
+        for path in artifact.get("files") or [artifact["model_path"]]:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                if path == artifact["model_path"]:
+                    return None
+                signature.append(None)
+                continue
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def _holdout_batch(self, candidate: FraudDetectionModel) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Load the holdout batch for validation.
+
+        Uses holdout_path, else holdout.npz next to the candidate artifact,
+        else a fixed synthetic batch without labels.
+
+        Returns:
+            Tuple of (raw feature matrix, labels or None)
+        """
+        path = self.holdout_path
+        if path is None:
+            path = os.path.join(os.path.dirname(candidate.artifact["model_path"]), HOLDOUT_FILENAME)
+
+        if os.path.exists(path):
+            with np.load(path) as data:
+                return data['X'].astype(FEATURE_DTYPE), data['y'].astype(np.int64)
+
+        logger.info(f"No holdout at {path} - validating on a synthetic batch")
+        rng = np.random.default_rng(0)
+        X = rng.standard_normal((SMOKE_TEST_ROWS, N_FEATURES)).astype(FEATURE_DTYPE)
+        X[:, [0, 29]] = np.abs(X[:, [0, 29]]) * [50000.0, 100.0]
+        return X, None
+
+    @staticmethod
+    def _score(model: FraudDetectionModel, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Get fraud probabilities and decisions for a copy of X."""
+        results = model.predict_matrix(X.copy())
+        confidences = np.fromiter((confidence for _, confidence, _ in results), dtype=np.float64)
+        flagged = np.fromiter((is_fraud for is_fraud, _, _ in results), dtype=bool)
+        return confidences, flagged
+
+    @staticmethod
+    def _entry(model: FraudDetectionModel, status: str, **extra: Any) -> Dict[str, Any]:
+        """Build a history entry for a model."""
+        entry = {
+            "version": model.version,
+            "artifact": model.artifact,
+            "loaded_at": model.loaded_at,
+            "status": status,
+            "recorded_at": datetime.utcnow().isoformat()
+        }
+        entry.update(extra)
+        return entry
+
+
+# Global registry instance
+model_registry = ModelRegistry(
+    holdout_path=os.getenv("MODEL_HOLDOUT_PATH") or None,
+    max_recall_drop=float(os.getenv("MODEL_MAX_RECALL_DROP", "0.05"))
+)
+
+
+def get_model_registry() -> ModelRegistry:
+    """Get the global model registry instance."""
+    return model_registry
@@ -0,0 +1,92 @@
+"""
+Response Rendering Module
+=========================
+Fast JSON rendering: orjson-backed responses and batch prediction bodies
+built directly from NumPy arrays.
+"""
+
+import json
+from typing import Any, Optional, Sequence
+
+import numpy as np
+from fastapi.responses import JSONResponse
+
+from .model import MESSAGES, message_indices
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+# Each message JSON-encoded once, spliced into batch bodies as-is
+MESSAGES_JSON = tuple(json.dumps(message, ensure_ascii=False) for message in MESSAGES)
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Serialize to compact UTF-8 JSON, with orjson when installed.
+
+    Args:
+        content: JSON-compatible value (NumPy arrays allowed with orjson)
+
+    Returns:
+        Encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson (or compact stdlib json)."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def render_batch_predictions(
+    is_fraud: np.ndarray,
+    confidences: np.ndarray,
+    partial: np.ndarray,
+    transaction_ids: Sequence[str],
+    timestamp: str,
+    model_version: Optional[str]
+) -> bytes:
+    """
+    Render a BatchPredictionResponse body straight from prediction arrays.
+
+    Produces the same JSON as serializing BatchPredictionResponse, without
+    building a PredictionResponse model per row: confidences are rounded in
+    one vectorized call and messages are spliced in from MESSAGES_JSON.
+
+    Args:
+        is_fraud: Boolean decisions
+        confidences: Fraud probabilities
+        partial: Flags for probabilities that are not the full forest average
+        transaction_ids: One ID per row
+        timestamp: ISO timestamp shared by the batch
+        model_version: Version of the model that scored the batch
+
+    Returns:
+        Encoded JSON body
+    """
+    bool_json = ("false", "true")
+    shared = f',"timestamp":{json.dumps(timestamp)},"model_version":{json.dumps(model_version)},"partial":'
+    rows = [
+        f'{{"fraud":{bool_json[fraud]},"confidence":{confidence!r},'
+        f'"message":{MESSAGES_JSON[message]},"transaction_id":"{transaction_id}"{shared}{bool_json[part]}}}'
+        for fraud, confidence, message, part, transaction_id in zip(
+            is_fraud.tolist(),
+            np.round(confidences, 4).tolist(),
+            message_indices(is_fraud, confidences).tolist(),
+            partial.tolist(),
+            transaction_ids
+        )
+    ]
+
+    total = len(rows)
+    fraud_count = int(np.count_nonzero(is_fraud))
+    return (
+        f'{{"predictions":[{",".join(rows)}],"total_processed":{total},'
+        f'"fraud_count":{fraud_count},"safe_count":{total - fraud_count}}}'
+    ).encode("utf-8")
@@ -0,0 +1,76 @@
+"""
+Ring Buffer Module
+==================
+Fixed-capacity in-memory history of recent prediction records.
+"""
+
+import threading
+from typing import Any, List, Optional
+
+
+class RingBuffer:
+    """
+    Fixed-capacity circular buffer that overwrites its oldest entry.
+
+    Appends are O(1) and newest-first reads are O(limit); the full history
+    is never copied. Slots are preallocated, so memory is bounded by
+    ``capacity`` regardless of traffic.
+
+    Memory footprint: one 8-byte slot per entry plus the stored record.
+    A /predict record (dict with an ISO timestamp string, two floats and a
+    bool) is about 310 bytes, so roughly 320 bytes per entry in total, or
+    ~3.2 MB for 10,000 entries.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        if capacity <= 0:
+            raise ValueError(f"Capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        self._slots: List[Optional[Any]] = [None] * capacity
+        self._next = 0
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def append(self, item: Any) -> None:
+        """
+        Add an item, overwriting the oldest one when full.
+
+        Args:
+            item: Item to store
+        """
+        with self._lock:
+            self._slots[self._next] = item
+            self._next = (self._next + 1) % self.capacity
+            if self._size < self.capacity:
+                self._size += 1
+
+    def extend(self, items: List[Any]) -> None:
+        """
+        Add several items in order under a single lock acquisition.
+
+        Args:
+            items: Items to store, oldest first
+        """
+        with self._lock:
+            for item in items[-self.capacity:]:
+                self._slots[self._next] = item
+                self._next = (self._next + 1) % self.capacity
+            self._size = min(self.capacity, self._size + len(items))
+
+    def newest(self, limit: int) -> List[Any]:
+        """
+        Get up to ``limit`` items, newest first.
+
+        Args:
+            limit: Maximum number of items to return
+
+        Returns:
+            List of items ordered from newest to oldest
+        """
+        with self._lock:
+            count = max(0, min(limit, self._size))
+            last = self._next - 1
+            return [self._slots[(last - i) % self.capacity] for i in range(count)]
+
+    def __len__(self) -> int:
+        return self._size
@@ -5,7 +5,7 @@ Request/response validation models.
 """
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Optional, List
+from typing import Annotated, Literal, Optional, List
 from datetime import datetime
 from enum import Enum
 
@@ -61,6 +61,9 @@ class PredictionResponse(BaseModel):
     message: str
     transaction_id: Optional[str] = None
     timestamp: Optional[str] = None
+    model_version: Optional[str] = None
+    # True when the probability is not the full forest average (early exit or cascade skip)
+    partial: bool = False
 
 
 class TransactionLog(BaseModel):
@@ -84,8 +87,23 @@ class BatchPredictionInput(BaseModel):
     transactions: List[TransactionInput]
 
 
+class BatchArrayInput(BaseModel):
+    """
+    Batch of transactions as rows of 30 floats in Time, V1..V28, Amount
+    order. Validated as one typed array, without per-field validators.
+    """
+    rows: List[Annotated[List[float], Field(min_length=30, max_length=30)]]
+
+
 class BatchPredictionResponse(BaseModel):
     predictions: List[PredictionResponse]
     total_processed: int
     fraud_count: int
     safe_count: int
+
+
+class ModelReloadRequest(BaseModel):
+    artifact: Optional[Literal["pickle", "fused", "mmap"]] = None
+    # Resolved inside MODEL_RELOAD_DIR; anything outside it is refused
+    model_path: Optional[str] = None
+    scaler_path: Optional[str] = None
@@ -0,0 +1,108 @@
+"""
+Streaming Module
+================
+Incremental NDJSON/CSV parsing into fixed-size feature blocks for bulk scoring.
+"""
+
+import json
+from typing import IO, Iterator, List, Tuple
+
+import numpy as np
+
+from .model import FEATURE_DTYPE, FEATURE_KEYS, N_FEATURES, fill_feature_row
+
+
+class StreamFormatError(ValueError):
+    """Raised when a streamed row cannot be parsed."""
+
+
+def iter_ndjson_blocks(lines: IO[bytes], block_size: int) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Parse NDJSON transactions into feature blocks.
+
+    One (block_size, 30) buffer is reused for every block, so memory stays
+    constant; each yielded block must be consumed before the next is read.
+
+    Args:
+        lines: Binary file-like object with one JSON object per line
+        block_size: Rows per block
+
+    Yields:
+        Tuples of (index of the block's first row, FEATURE_DTYPE view of shape (n, 30))
+    """
+    block = np.empty((block_size, N_FEATURES), dtype=FEATURE_DTYPE)
+    start = 0
+    n = 0
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            fill_feature_row(json.loads(line), block[n])
+        except (ValueError, TypeError, AttributeError) as e:
+            raise StreamFormatError(f"Row {start + n}: {e}") from e
+        n += 1
+        if n == block_size:
+            yield start, block
+            start += n
+            n = 0
+    if n:
+        yield start, block[:n]
+
+
+def iter_csv_blocks(lines: IO[bytes], block_size: int) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Parse CSV transactions into feature blocks.
+
+    The header is matched case-insensitively against the feature names
+    (e.g. the Kaggle "Time,V1..V28,Amount,Class" layout); extra columns are
+    ignored and missing features are 0. Each block is parsed with one
+    np.loadtxt call into a reused buffer.
+
+    Args:
+        lines: Binary file-like object whose first line is the header
+        block_size: Rows per block
+
+    Yields:
+        Tuples of (index of the block's first row, FEATURE_DTYPE view of shape (n, 30))
+    """
+    header = lines.readline().decode('utf-8-sig').strip()
+    if not header:
+        return
+    columns = [name.strip().strip('"').lower() for name in header.split(',')]
+    usecols, targets = [], []
+    for target, key in enumerate(FEATURE_KEYS):
+        if key in columns:
+            usecols.append(columns.index(key))
+            targets.append(target)
+    if not usecols:
+        raise StreamFormatError(f"CSV header has no feature columns: {header}")
+
+    block = np.zeros((block_size, N_FEATURES), dtype=FEATURE_DTYPE)
+    start = 0
+    pending: List[str] = []
+    for line in lines:
+        line = line.decode('utf-8').strip()
+        if line:
+            pending.append(line)
+        if len(pending) == block_size:
+            yield start, _parse_csv_block(pending, usecols, targets, block, start)
+            start += len(pending)
+            pending = []
+    if pending:
+        yield start, _parse_csv_block(pending, usecols, targets, block, start)
+
+
+def _parse_csv_block(
+    lines: List[str], usecols: List[int], targets: List[int], block: np.ndarray, start: int
+) -> np.ndarray:
+    """Parse CSV lines into the first len(lines) rows of block."""
+    try:
+        values = np.loadtxt(lines, delimiter=',', usecols=usecols, ndmin=2, dtype=FEATURE_DTYPE)
+    except ValueError as e:
+        raise StreamFormatError(f"Rows {start}-{start + len(lines) - 1}: {e}") from e
+    # Scoring may scale the block in place, so reset columns not in the file
+    out = block[:len(lines)]
+    out.fill(0.0)
+    out[:, targets] = values
+    return out
@@ -0,0 +1,74 @@
+"""
+Validation Module
+=================
+Vectorized validation of whole feature matrices, as a cheaper alternative to
+per-field TransactionInput validation for batch endpoints.
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+
+from .model import N_FEATURES
+
+# Column indexes of the non-negative features (Time, Amount)
+NON_NEGATIVE_COLUMNS = [0, N_FEATURES - 1]
+
+NON_FINITE_ERROR = "Non-finite values"
+NEGATIVE_ERROR = "Negative time or amount"
+
+
+class FeatureValidationError(ValueError):
+    """Raised when a feature matrix fails validation."""
+
+
+def validate_feature_matrix(X: np.ndarray) -> None:
+    """
+    Check a feature matrix with vectorized operations.
+
+    Applies TransactionInput's constraints to every row at once: shape
+    (N, 30), all values finite, Time and Amount non-negative.
+
+    Args:
+        X: Feature matrix of shape (N, 30)
+
+    Raises:
+        FeatureValidationError: Naming up to 10 offending rows
+    """
+    if X.ndim != 2 or X.shape[1] != N_FEATURES:
+        raise FeatureValidationError(f"Expected an array of shape (N, {N_FEATURES}), got {X.shape}")
+
+    non_finite, negative = _invalid_rows(X)
+    if non_finite.any():
+        rows = np.flatnonzero(non_finite)
+        raise FeatureValidationError(f"{NON_FINITE_ERROR} in rows {rows[:10].tolist()}")
+    if negative.any():
+        rows = np.flatnonzero(negative)
+        raise FeatureValidationError(f"{NEGATIVE_ERROR} in rows {rows[:10].tolist()}")
+
+
+def feature_row_errors(X: np.ndarray) -> List[Tuple[int, str]]:
+    """
+    Per-row form of validate_feature_matrix, for streams that skip bad rows.
+
+    Args:
+        X: Feature matrix of shape (N, 30)
+
+    Returns:
+        (row index, error message) for every invalid row, in row order
+    """
+    non_finite, negative = _invalid_rows(X)
+    invalid = np.flatnonzero(non_finite | negative)
+    if not len(invalid):
+        return []
+    return [
+        (row, NON_FINITE_ERROR if flagged else NEGATIVE_ERROR)
+        for row, flagged in zip(invalid.tolist(), non_finite[invalid].tolist())
+    ]
+
+
+def _invalid_rows(X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Boolean masks of rows with non-finite values and of finite rows with negative Time/Amount."""
+    non_finite = ~np.isfinite(X).all(axis=1)
+    negative = (X[:, NON_NEGATIVE_COLUMNS] < 0).any(axis=1) & ~non_finite
+    return non_finite, negative
@@ -0,0 +1,51 @@
+"""
+Compiled Forest Benchmark
+=========================
+Compares CompiledForest against the stock sklearn predict_proba and checks
+that both produce the same fraud probabilities.
+
+Usage (from backend/):
+    python -m benchmarks.benchmark_compiled_forest [model_path] [scaler_path]
+"""
+
+import sys
+
+import numpy as np
+
+from benchmarks.common import load_model, print_row, random_features, time_call
+
+from app.model import CompiledForest
+
+BATCH_SIZES = [1, 100, 10000]
+TOLERANCE = 1e-9
+
+
+def main():
+    print("\n" + "="*60)
+    print("🌲 COMPILED FOREST vs SKLEARN predict_proba")
+    print("="*60)
+
+    model = load_model(*sys.argv[1:3])
+    forest = CompiledForest.from_sklearn(model.model)
+    print(f"Trees: {forest.n_trees} | Nodes: {len(forest.feature):,} | Max depth: {forest.max_depth}")
+
+    # Correctness
+    X = model._apply_scaling_batch(random_features(max(BATCH_SIZES)))
+    max_diff = float(np.abs(model.model.predict_proba(X)[:, 1] - forest.predict_fraud_proba(X)).max())
+    status = "✅" if max_diff <= TOLERANCE else "❌"
+    print(f"\n{status} Max |sklearn - compiled| = {max_diff:.3e} (tolerance {TOLERANCE:.0e})")
+
+    # Latency
+    for n_rows in BATCH_SIZES:
+        batch = X[:n_rows]
+        repeat = 200 if n_rows < 1000 else 20
+        print(f"\n📦 Batch size {n_rows:,}")
+        print_row("sklearn predict_proba", time_call(lambda: model.model.predict_proba(batch), repeat), n_rows)
+        print_row("CompiledForest", time_call(lambda: forest.predict_fraud_proba(batch), repeat), n_rows)
+
+    if max_diff > TOLERANCE:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Request Format Benchmark
+========================
+Compares JSON batch requests (parse + TransactionInput validation) against
+the raw float64 and float64/float32 .npy formats accepted by
+/predict/batch/binary, both for decoding alone and end to end through the API.
+
+Usage (from backend/):
+    python -m benchmarks.benchmark_request_formats
+"""
+
+import io
+import json
+import os
+
+import numpy as np
+
+from benchmarks.common import print_row, random_features, random_transactions, time_call
+
+# Skip the blocking MongoDB connect during app startup
+os.environ.setdefault("FAST_STARTUP", "true")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.binary_format import NPY_CONTENT_TYPE, RAW_CONTENT_TYPE, decode_body  # noqa: E402
+from app.main import app  # noqa: E402
+from app.model import feature_matrix  # noqa: E402
+from app.schema import BatchPredictionInput  # noqa: E402
+
+BATCH_SIZES = [1, 100, 10000]
+
+
+def npy_bytes(X: np.ndarray) -> bytes:
+    """Serialize an array in .npy format."""
+    buffer = io.BytesIO()
+    np.save(buffer, X)
+    return buffer.getvalue()
+
+
+def main():
+    print("\n" + "="*60)
+    print("📨 JSON vs BINARY BATCH REQUESTS")
+    print("="*60)
+
+    with TestClient(app) as client:
+        for n_rows in BATCH_SIZES:
+            X = random_features(n_rows)
+            json_body = json.dumps({"transactions": random_transactions(n_rows)}).encode()
+            raw_body = X.astype('<f8').tobytes()
+            npy_body = npy_bytes(X)
+            npy32_body = npy_bytes(X.astype(np.float32))
+            repeat = 200 if n_rows < 1000 else 10
+
+            print(f"\n📦 Batch size {n_rows:,}")
+            print(f"   Body size: JSON {len(json_body):,} B | raw {len(raw_body):,} B | "
+                  f"npy {len(npy_body):,} B | npy float32 {len(npy32_body):,} B")
+
+            print("   Decode only:")
+            print_row("JSON + TransactionInput", time_call(
+                lambda: feature_matrix(BatchPredictionInput.model_validate_json(json_body).transactions),
+                repeat), n_rows)
+            print_row("raw float64", time_call(lambda: decode_body(raw_body, RAW_CONTENT_TYPE), repeat), n_rows)
+            print_row(".npy", time_call(lambda: decode_body(npy_body, NPY_CONTENT_TYPE), repeat), n_rows)
+            print_row(".npy float32", time_call(lambda: decode_body(npy32_body, NPY_CONTENT_TYPE), repeat), n_rows)
+
+            print("   End to end:")
+            print_row("POST /predict/batch", time_call(lambda: client.post(
+                "/predict/batch", content=json_body,
+                headers={"content-type": "application/json"}), repeat), n_rows)
+            print_row("POST /predict/batch/binary (raw)", time_call(lambda: client.post(
+                "/predict/batch/binary", content=raw_body,
+                headers={"content-type": RAW_CONTENT_TYPE}), repeat), n_rows)
+            print_row("POST /predict/batch/binary (npy)", time_call(lambda: client.post(
+                "/predict/batch/binary", content=npy_body,
+                headers={"content-type": NPY_CONTENT_TYPE}), repeat), n_rows)
+            print_row("POST /predict/batch/binary (npy float32)", time_call(lambda: client.post(
+                "/predict/batch/binary", content=npy32_body,
+                headers={"content-type": NPY_CONTENT_TYPE}), repeat), n_rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Response Rendering Benchmark
+============================
+Compares building a BatchPredictionResponse per row and encoding it the
+default FastAPI way (jsonable_encoder + json.dumps) against rendering the
+body straight from prediction arrays, and checks both produce the same JSON.
+
+Usage (from backend/):
+    python -m benchmarks.benchmark_response_rendering
+"""
+
+import json
+import sys
+import uuid
+
+import numpy as np
+from fastapi.encoders import jsonable_encoder
+
+from benchmarks.common import print_row, time_call
+
+from app.model import FraudDetectionModel
+from app.responses import render_batch_predictions
+from app.schema import BatchPredictionResponse, PredictionResponse
+
+BATCH_SIZES = [1, 100, 10000]
+TIMESTAMP = "2026-01-01T00:00:00"
+MODEL_VERSION = "benchmark"
+
+
+def render_default(is_fraud: np.ndarray, confidences: np.ndarray, partial: np.ndarray, transaction_ids: list) -> bytes:
+    """Per-row Pydantic models, message if/elif chain, stdlib json."""
+    model = FraudDetectionModel()
+    predictions = [
+        PredictionResponse(
+            fraud=fraud,
+            confidence=round(confidence, 4),
+            message=model._get_message(fraud, confidence),
+            transaction_id=transaction_id,
+            timestamp=TIMESTAMP,
+            model_version=MODEL_VERSION,
+            partial=part
+        )
+        for fraud, confidence, part, transaction_id in zip(
+            is_fraud.tolist(), confidences.tolist(), partial.tolist(), transaction_ids
+        )
+    ]
+    fraud_count = int(is_fraud.sum())
+    response = BatchPredictionResponse(
+        predictions=predictions,
+        total_processed=len(predictions),
+        fraud_count=fraud_count,
+        safe_count=len(predictions) - fraud_count
+    )
+    return json.dumps(jsonable_encoder(response), ensure_ascii=False).encode("utf-8")
+
+
+def main():
+    print("\n" + "="*60)
+    print("🧾 DEFAULT vs ARRAY-RENDERED BATCH RESPONSES")
+    print("="*60)
+
+    rng = np.random.default_rng(42)
+    mismatches = 0
+    for n_rows in BATCH_SIZES:
+        confidences = rng.beta(0.3, 2.0, n_rows)
+        is_fraud = confidences > 0.5
+        partial = rng.random(n_rows) < 0.5
+        transaction_ids = [str(uuid.uuid4()) for _ in range(n_rows)]
+        repeat = 200 if n_rows < 1000 else 10
+
+        default = render_default(is_fraud, confidences, partial, transaction_ids)
+        fast = render_batch_predictions(is_fraud, confidences, partial, transaction_ids, TIMESTAMP, MODEL_VERSION)
+        same = json.loads(default) == json.loads(fast)
+        mismatches += not same
+
+        print(f"\n📦 Batch size {n_rows:,} {'✅ identical JSON' if same else '❌ JSON differs'}")
+        print_row("Pydantic + jsonable_encoder", time_call(
+            lambda: render_default(is_fraud, confidences, partial, transaction_ids), repeat), n_rows)
+        print_row("render_batch_predictions", time_call(
+            lambda: render_batch_predictions(
+                is_fraud, confidences, partial, transaction_ids, TIMESTAMP, MODEL_VERSION
+            ),
+            repeat), n_rows)
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Validation Benchmark
+====================
+Compares per-field TransactionInput validation (/predict/batch) with the
+typed-array schema plus one vectorized check (/predict/batch/array).
+
+Usage (from backend/):
+    python -m benchmarks.benchmark_validation
+"""
+
+import json
+
+import numpy as np
+
+from benchmarks.common import print_row, random_features, random_transactions, time_call
+
+from app.model import FEATURE_DTYPE, feature_matrix
+from app.schema import BatchArrayInput, BatchPredictionInput
+from app.validation import validate_feature_matrix
+
+BATCH_SIZES = [1, 100, 10000]
+
+
+def validate_strict(body: bytes) -> np.ndarray:
+    """Validate through TransactionInput and build the feature matrix."""
+    return feature_matrix(BatchPredictionInput.model_validate_json(body).transactions)
+
+
+def validate_fast(body: bytes) -> np.ndarray:
+    """Validate as a typed array and check it in one vectorized pass."""
+    X = np.array(BatchArrayInput.model_validate_json(body).rows, dtype=FEATURE_DTYPE)
+    validate_feature_matrix(X)
+    return X
+
+
+def main():
+    print("\n" + "="*60)
+    print("🛂 PER-FIELD vs VECTORIZED BATCH VALIDATION")
+    print("="*60)
+
+    for n_rows in BATCH_SIZES:
+        strict_body = json.dumps({"transactions": random_transactions(n_rows)}).encode()
+        fast_body = json.dumps({"rows": random_features(n_rows).tolist()}).encode()
+        repeat = 200 if n_rows < 1000 else 10
+
+        assert np.allclose(validate_strict(strict_body), validate_fast(fast_body))
+
+        print(f"\n📦 Batch size {n_rows:,}")
+        print_row("TransactionInput (strict)", time_call(lambda: validate_strict(strict_body), repeat), n_rows)
+        print_row("BatchArrayInput (fast)", time_call(lambda: validate_fast(fast_body), repeat), n_rows)
+
+
+if __name__ == "__main__":
+    main()
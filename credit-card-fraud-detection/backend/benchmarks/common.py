@@ -0,0 +1,107 @@
+"""
+Benchmark Helpers
+=================
+Shared utilities for the backend micro-benchmarks.
+
+Run benchmarks from the backend/ directory, e.g.:
+    python -m benchmarks.benchmark_compiled_forest
+"""
+
+import os
+import sys
+import time
+import warnings
+from typing import Callable, Dict
+
+import numpy as np
+
+# Make the `app` package importable when run as a script
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+warnings.filterwarnings('ignore')
+
+from app.model import FraudDetectionModel  # noqa: E402
+
+RANDOM_STATE = 42
+
+
+def load_model(model_path: str = None, scaler_path: str = None) -> FraudDetectionModel:
+    """
+    Load a fresh FraudDetectionModel from the given (or default) artifacts.
+
+    Args:
+        model_path: Path to fraud_model.pkl, defaults to backend/model/
+        scaler_path: Path to scaler.pkl, defaults to backend/model/
+
+    Returns:
+        Loaded model instance
+    """
+    model = FraudDetectionModel()
+    if not model.load_model(model_path):
+        sys.exit("❌ Model could not be loaded - run ml/train_model.py first")
+    model.load_scaler(scaler_path)
+    return model
+
+
+def random_features(n_rows: int, seed: int = RANDOM_STATE) -> np.ndarray:
+    """
+    Generate raw (unscaled) feature rows in the creditcard.csv layout.
+
+    Args:
+        n_rows: Number of rows
+        seed: Random seed
+
+    Returns:
+        Array of shape (n_rows, 30)
+    """
+    rng = np.random.default_rng(seed)
+    X = rng.normal(0, 1.5, size=(n_rows, 30))
+    X[:, 0] = rng.uniform(0, 172792, n_rows)
+    X[:, 29] = rng.lognormal(4, 1.5, n_rows)
+    return X
+
+
+def random_transactions(n_rows: int, seed: int = RANDOM_STATE) -> list:
+    """
+    Generate raw transactions as request-style dictionaries.
+
+    Args:
+        n_rows: Number of rows
+        seed: Random seed
+
+    Returns:
+        List of feature dictionaries keyed like TransactionInput
+    """
+    keys = ['time'] + [f'v{i}' for i in range(1, 29)] + ['amount']
+    return [dict(zip(keys, row.tolist())) for row in random_features(n_rows, seed)]
+
+
+def time_call(fn: Callable[[], object], repeat: int = 200, warmup: int = 5) -> Dict[str, float]:
+    """
+    Time a zero-argument callable.
+
+    Args:
+        fn: Callable to benchmark
+        repeat: Number of timed calls
+        warmup: Number of untimed calls before measuring
+
+    Returns:
+        Dictionary with p50/p99/mean latency in milliseconds
+    """
+    for _ in range(warmup):
+        fn()
+
+    samples = np.empty(repeat, dtype=np.float64)
+    for i in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples[i] = (time.perf_counter() - started) * 1000
+
+    p50, p99 = np.percentile(samples, [50, 99])
+    return {"p50_ms": float(p50), "p99_ms": float(p99), "mean_ms": float(samples.mean())}
+
+
+def print_row(label: str, timing: Dict[str, float], n_rows: int = 1) -> None:
+    """Print one formatted benchmark result line."""
+    rows_per_sec = n_rows / (timing["mean_ms"] / 1000) if timing["mean_ms"] > 0 else float('inf')
+    print(f"   {label:<32} p50 {timing['p50_ms']:9.3f} ms | "
+          f"p99 {timing['p99_ms']:9.3f} ms | {rows_per_sec:14,.0f} rows/s")
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Tests import the backend package as ``app``, like the benchmarks do
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -0,0 +1,31 @@
+"""
+MicroBatcher shutdown with a blocked worker and a full request queue.
+"""
+
+import threading
+import time
+
+from app.batching import MicroBatcher
+
+
+def test_stop_does_not_hang_when_queue_is_full():
+    release = threading.Event()
+
+    def predict_batch(items):
+        release.wait()
+        return [(False, 0.9, "ok", False, "v1") for _ in items]
+
+    batcher = MicroBatcher(predict_batch, max_batch_size=1, max_wait_ms=0, max_queue_size=1)
+    batcher.start()
+    first = batcher.submit("a")
+    # Wait until the worker has taken the first request and is stuck scoring it
+    while batcher.get_stats()["queue_depth"]:
+        time.sleep(0.001)
+    batcher.submit("b")
+
+    started = time.perf_counter()
+    batcher.stop(timeout=0.1)
+    assert time.perf_counter() - started < 1.0
+
+    release.set()
+    assert first.result(timeout=1.0) == (False, 0.9, "ok", False, "v1")
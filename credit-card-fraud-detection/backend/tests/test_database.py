@@ -0,0 +1,87 @@
+"""
+DatabaseManager tests against an in-memory stand-in for the MongoDB client.
+"""
+
+from unittest import mock
+
+from app.database import STATS_DOCUMENT_ID, DatabaseManager
+
+
+class FakeCollection:
+    """The subset of pymongo's Collection the manager touches on connect."""
+
+    def __init__(self, documents=None):
+        self.documents = list(documents or [])
+
+    def create_index(self, *args, **kwargs):
+        return "index"
+
+    def find_one(self, query):
+        return next((doc for doc in self.documents if doc.get("_id") == query.get("_id")), None)
+
+    def replace_one(self, query, replacement, upsert=False):
+        self.documents = [doc for doc in self.documents if doc.get("_id") != query["_id"]]
+        self.documents.append(dict(replacement, _id=query["_id"]))
+
+    def aggregate(self, pipeline):
+        # Only the stats $group pipeline is used by connect()
+        if not self.documents:
+            return []
+        return [{
+            "_id": None,
+            "total_predictions": len(self.documents),
+            "fraud_count": sum(doc["prediction"] is True for doc in self.documents),
+            "safe_count": sum(doc["prediction"] is False for doc in self.documents),
+            "confidence_sum": sum(doc["confidence"] for doc in self.documents)
+        }]
+
+
+def fake_client(logs):
+    client = mock.MagicMock()
+    collections = {
+        "prediction_logs": FakeCollection(logs),
+        "prediction_stats": FakeCollection(),
+        "prediction_rollups": FakeCollection()
+    }
+    client.__getitem__.return_value.__getitem__.side_effect = collections.__getitem__
+    return client, collections
+
+
+def test_connect_seeds_stats_from_existing_logs():
+    logs = [
+        {"transaction_id": "a", "prediction": True, "confidence": 0.9},
+        {"transaction_id": "b", "prediction": False, "confidence": 0.1},
+        {"transaction_id": "c", "prediction": False, "confidence": 0.2}
+    ]
+    client, collections = fake_client(logs)
+    manager = DatabaseManager(log_flush_interval=0.01)
+
+    with mock.patch("pymongo.MongoClient", return_value=client):
+        assert manager.connect("mongodb://example/")
+    try:
+        seeded = collections["prediction_stats"].find_one({"_id": STATS_DOCUMENT_ID})
+        assert seeded["total_predictions"] == 3
+        assert seeded["fraud_count"] == 1
+        assert seeded["safe_count"] == 2
+
+        stats = manager.get_prediction_stats()
+        assert stats["total_predictions"] == 3
+        assert stats["fraud_count"] == 1
+        assert abs(stats["avg_confidence"] - 0.4) < 1e-9
+    finally:
+        manager.close()
+
+
+def test_connect_keeps_existing_counters():
+    client, collections = fake_client([{"transaction_id": "a", "prediction": True, "confidence": 0.9}])
+    collections["prediction_stats"].documents.append(
+        {"_id": STATS_DOCUMENT_ID, "total_predictions": 7, "fraud_count": 2, "safe_count": 5, "confidence_sum": 1.0}
+    )
+    manager = DatabaseManager(log_flush_interval=0.01)
+
+    with mock.patch("pymongo.MongoClient", return_value=client):
+        assert manager.connect("mongodb://example/")
+    try:
+        assert manager.get_prediction_stats()["total_predictions"] == 7
+    finally:
+        manager.close()
@@ -0,0 +1,31 @@
+"""
+Per-artifact thresholds in model_meta.json, as written by
+ml/train_model.py::save_student.
+"""
+
+import json
+
+from app.model import MODEL_META_FILENAME, STUDENT_MODEL_FILENAME, FraudDetectionModel
+
+
+def _write_meta(tmp_path, meta):
+    with open(tmp_path / MODEL_META_FILENAME, 'w') as f:
+        json.dump(meta, f)
+
+
+def test_artifact_thresholds_override_shared_ones(tmp_path):
+    _write_meta(tmp_path, {
+        'decision_threshold': 0.5,
+        'cascade_threshold': 0.2,
+        'artifacts': {STUDENT_MODEL_FILENAME: {'decision_threshold': 0.35, 'cascade_threshold': 0.1}},
+    })
+
+    student = FraudDetectionModel()
+    student._load_model_meta(str(tmp_path), STUDENT_MODEL_FILENAME)
+    teacher = FraudDetectionModel()
+    teacher._load_model_meta(str(tmp_path), 'fraud_model.pkl')
+
+    assert student.decision_threshold == 0.35
+    assert student.cascade_threshold == 0.1
+    assert teacher.decision_threshold == 0.5
+    assert teacher.cascade_threshold == 0.2
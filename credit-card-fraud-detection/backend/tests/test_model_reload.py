@@ -0,0 +1,41 @@
+"""
+POST /model/reload access control. Requests are refused before any model is
+loaded, so no trained artifacts are needed.
+"""
+
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    monkeypatch.setattr(main, "MODEL_ADMIN_TOKEN", "s3cret")
+    monkeypatch.setattr(main, "MODEL_RELOAD_DIR", os.path.realpath(tmp_path))
+    # No lifespan: startup would load the model and connect to MongoDB
+    return TestClient(main.app)
+
+
+def test_reload_disabled_without_configured_token(client, monkeypatch):
+    monkeypatch.setattr(main, "MODEL_ADMIN_TOKEN", None)
+    assert client.post("/model/reload", headers={"X-Admin-Token": "s3cret"}).status_code == 403
+
+
+@pytest.mark.parametrize("headers", [{}, {"X-Admin-Token": "wrong"}])
+def test_reload_requires_admin_token(client, headers):
+    assert client.post("/model/reload", headers=headers).status_code == 401
+
+
+@pytest.mark.parametrize("model_path", ["/etc/passwd", "../outside.pkl", "link.pkl"])
+def test_reload_refuses_paths_outside_model_dir(client, tmp_path, model_path):
+    outside = tmp_path.parent / "outside.pkl"
+    outside.write_bytes(b"not a model")
+    (tmp_path / "link.pkl").symlink_to(outside)
+
+    response = client.post(
+        "/model/reload", headers={"X-Admin-Token": "s3cret"}, json={"model_path": model_path}
+    )
+    assert response.status_code == 403
@@ -0,0 +1,34 @@
+"""
+Per-row validation of streamed blocks. Uses the parsers and renderer only,
+so no trained model is needed.
+"""
+
+import io
+
+import numpy as np
+
+from app.main import _render_stream_rows
+from app.streaming import iter_csv_blocks
+from app.validation import NEGATIVE_ERROR, NON_FINITE_ERROR, feature_row_errors
+
+
+def test_streamed_block_reports_each_invalid_row():
+    csv = b"Time,V1,Amount\n1,0.5,10\nnan,0,1\n2,0,-5\n3,inf,-1\n4,0,2\n"
+    [(start, block)] = list(iter_csv_blocks(io.BytesIO(csv), block_size=8))
+
+    assert start == 0
+    assert feature_row_errors(block) == [(1, NON_FINITE_ERROR), (2, NEGATIVE_ERROR), (3, NON_FINITE_ERROR)]
+
+
+def test_error_lines_are_rendered_in_row_order():
+    rendered = _render_stream_rows(
+        [10, 13], np.array([False, True]), np.array([0.9, 0.8]), np.array([False, False]),
+        [(11, NON_FINITE_ERROR), (12, NEGATIVE_ERROR)]
+    )
+
+    assert rendered.splitlines() == [
+        '{"row":10,"fraud":false,"confidence":0.9,"partial":false}',
+        f'{{"row": 11, "error": "{NON_FINITE_ERROR}"}}',
+        f'{{"row": 12, "error": "{NEGATIVE_ERROR}"}}',
+        '{"row":13,"fraud":true,"confidence":0.8,"partial":false}',
+    ]
@@ -0,0 +1,126 @@
+"""
+Credit Card Fraud Detection - Early-Exit Evaluation
+====================================================
+Measures how early-exit forest evaluation compares with scoring every tree
+on the test split: decision agreement, how many trees rows actually use,
+precision/recall, and the speedup.
+
+The test split is rebuilt exactly as train_model.py makes it, and the saved
+fraud_model.pkl is compiled with the backend's CompiledForest.
+
+Usage:
+    python evaluate_early_exit.py --deltas 0.1 0.01 0.001
+"""
+
+import os
+import sys
+import json
+import time
+import pickle
+import argparse
+
+import numpy as np
+from sklearn.model_selection import train_test_split
+from sklearn.metrics import precision_score, recall_score
+
+from train_model import RANDOM_STATE, DECISION_THRESHOLD, load_data, preprocess_data
+
+
+def load_forest(model_dir: str):
+    """
+    Load the saved forest as a CompiledForest, with its decision threshold.
+
+    Args:
+        model_dir: Directory containing fraud_model.pkl
+
+    Returns:
+        Tuple of (CompiledForest, decision threshold)
+    """
+    # The backend owns the compiled forest and early-exit evaluator
+    backend_dir = os.path.abspath(os.path.join(model_dir, '..'))
+    if backend_dir not in sys.path:
+        sys.path.insert(0, backend_dir)
+    from app.model import CompiledForest, MODEL_META_FILENAME
+
+    with open(os.path.join(model_dir, 'fraud_model.pkl'), 'rb') as f:
+        model = pickle.load(f)
+
+    threshold = DECISION_THRESHOLD
+    meta_path = os.path.join(model_dir, MODEL_META_FILENAME)
+    if os.path.exists(meta_path):
+        with open(meta_path, 'r') as f:
+            threshold = json.load(f).get('decision_threshold', DECISION_THRESHOLD)
+
+    return CompiledForest.from_sklearn(model), threshold
+
+
+def best_time(fn, repeat: int) -> float:
+    """Best wall time of fn() over repeat runs, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    """
+    Compare full and early-exit evaluation on the test split.
+    """
+    parser = argparse.ArgumentParser(description="Measure early-exit agreement and speedup")
+    parser.add_argument('--data', default='data/creditcard.csv', help="Training dataset")
+    parser.add_argument('--model-dir', default='../backend/model', help="Directory with model artifacts")
+    parser.add_argument('--deltas', type=float, nargs='+', default=[0.1, 0.01, 0.001],
+                        help="Early-exit error probabilities to evaluate")
+    parser.add_argument('--min-trees', type=int, default=None, help="Trees before the first exit check")
+    parser.add_argument('--repeat', type=int, default=3, help="Timing runs (best is reported)")
+    args = parser.parse_args()
+
+    print("\n" + "="*60)
+    print("⏱️  CREDIT CARD FRAUD DETECTION - EARLY-EXIT EVALUATION")
+    print("="*60)
+
+    if not os.path.exists(args.data):
+        raise SystemExit(f"❌ Error: Dataset not found at {args.data}")
+
+    # Same split as train_model.py
+    X, y, _ = preprocess_data(load_data(args.data))
+    _, X_test, _, y_test = train_test_split(
+        X, y, test_size=0.2, random_state=RANDOM_STATE, stratify=y
+    )
+
+    forest, threshold = load_forest(args.model_dir)
+    exit_options = {'min_trees': args.min_trees} if args.min_trees else {}
+    print(f"\n🌲 {forest.n_trees} trees | threshold {threshold} | "
+          f"{len(X_test):,} test rows ({int(y_test.sum())} fraud)")
+
+    full = forest.predict_fraud_proba(X_test)
+    full_fraud = full > threshold
+    full_time = best_time(lambda: forest.predict_fraud_proba(X_test), args.repeat)
+    print(f"\n{'Mode':<16} {'Agree':>9} {'Exited':>8} {'Trees':>7} "
+          f"{'Precision':>10} {'Recall':>8} {'Time':>9} {'Speedup':>8}")
+    print("-" * 80)
+    print(f"{'all trees':<16} {100.0:>8.3f}% {0.0:>7.1f}% {forest.n_trees:>7.1f} "
+          f"{precision_score(y_test, full_fraud):>10.4f} {recall_score(y_test, full_fraud):>8.4f} "
+          f"{full_time * 1000:>7.1f}ms {1.0:>7.2f}x")
+
+    for delta in args.deltas:
+        proba, trees_used = forest.predict_fraud_proba_early_exit(X_test, threshold, delta, **exit_options)
+        fraud = proba > threshold
+        elapsed = best_time(
+            lambda: forest.predict_fraud_proba_early_exit(X_test, threshold, delta, **exit_options), args.repeat
+        )
+        print(f"{f'delta={delta:g}':<16} {np.mean(fraud == full_fraud) * 100:>8.3f}% "
+              f"{np.mean(trees_used < forest.n_trees) * 100:>7.1f}% {trees_used.mean():>7.1f} "
+              f"{precision_score(y_test, fraud):>10.4f} {recall_score(y_test, fraud):>8.4f} "
+              f"{elapsed * 1000:>7.1f}ms {full_time / elapsed:>7.2f}x")
+
+        flipped = np.flatnonzero(fraud != full_fraud)
+        if len(flipped):
+            print(f"   ⚠️  {len(flipped)} decisions differ from the full forest "
+                  f"(max |full - partial| {np.abs(full - proba)[flipped].max():.3f})")
+
+
+if __name__ == "__main__":
+    main()
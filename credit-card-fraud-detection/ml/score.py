@@ -0,0 +1,192 @@
+"""
+Credit Card Fraud Detection - Offline Bulk Scoring
+===================================================
+Scores a CSV (or Parquet) file in the creditcard.csv schema with the saved
+fraud_model.pkl and scaler.pkl.
+
+The input is read in chunks and predictions are appended to the output as
+each chunk finishes, so files larger than RAM can be scored. Chunks can be
+spread across a process pool; at most two chunks per worker are in flight.
+
+Usage:
+    python score.py data/creditcard.csv --output data/predictions.csv --workers 4
+"""
+
+import os
+import json
+import time
+import pickle
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+# Column order the model was trained on
+FEATURE_COLUMNS = ['Time'] + [f'V{i}' for i in range(1, 29)] + ['Amount']
+
+# Fraud decision threshold used when model_meta.json is missing
+DEFAULT_DECISION_THRESHOLD = 0.5
+
+# Per-process model state, set by load_artifacts()
+_model = None
+_scaler = None
+_threshold = DEFAULT_DECISION_THRESHOLD
+
+
+def load_artifacts(model_dir: str, n_jobs: Optional[int] = None) -> None:
+    """
+    Load the model, scaler and decision threshold into this process.
+
+    Args:
+        model_dir: Directory containing fraud_model.pkl and scaler.pkl
+        n_jobs: Override the forest's n_jobs (pool workers use 1 so
+            workers x forest threads do not oversubscribe the CPUs)
+    """
+    global _model, _scaler, _threshold
+    with open(os.path.join(model_dir, 'fraud_model.pkl'), 'rb') as f:
+        _model = pickle.load(f)
+    if n_jobs is not None and hasattr(_model, 'n_jobs'):
+        _model.n_jobs = n_jobs
+    with open(os.path.join(model_dir, 'scaler.pkl'), 'rb') as f:
+        _scaler = pickle.load(f)
+
+    meta_path = os.path.join(model_dir, 'model_meta.json')
+    if os.path.exists(meta_path):
+        with open(meta_path, 'r') as f:
+            _threshold = json.load(f).get('decision_threshold', DEFAULT_DECISION_THRESHOLD)
+
+
+def read_chunks(input_path: str, chunksize: int) -> Iterator[pd.DataFrame]:
+    """
+    Read the input file in chunks.
+
+    Args:
+        input_path: CSV or .parquet file
+        chunksize: Rows per chunk
+
+    Yields:
+        DataFrame chunks, indexed by row number in the whole file
+    """
+    if input_path.endswith('.parquet'):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise SystemExit("❌ Reading Parquet requires pyarrow: pip install pyarrow")
+        offset = 0
+        for batch in pq.ParquetFile(input_path).iter_batches(batch_size=chunksize):
+            # to_pandas() numbers every batch from 0; continue the CSV reader's numbering
+            chunk = batch.to_pandas()
+            chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+            offset += len(chunk)
+            yield chunk
+    else:
+        yield from pd.read_csv(input_path, chunksize=chunksize)
+
+
+def score_chunk(chunk: pd.DataFrame) -> pd.DataFrame:
+    """
+    Score one chunk with a single vectorized model call.
+
+    Args:
+        chunk: DataFrame with the feature columns (extra columns are ignored)
+
+    Returns:
+        DataFrame with fraud_probability and is_fraud, indexed like the input
+    """
+    X = chunk[FEATURE_COLUMNS].astype(np.float64)
+    X[['Time', 'Amount']] = _scaler.transform(X[['Time', 'Amount']])
+
+    probabilities = _model.predict_proba(X.values)[:, 1]
+    return pd.DataFrame({
+        'fraud_probability': probabilities,
+        'is_fraud': (probabilities > _threshold).astype(np.int8)
+    }, index=chunk.index)
+
+
+def score_file(input_path: str, output_path: str, model_dir: str,
+               chunksize: int = 100000, workers: int = 0) -> int:
+    """
+    Score a file chunk by chunk and write predictions incrementally.
+
+    Args:
+        input_path: CSV or .parquet file in the creditcard.csv schema
+        output_path: CSV file for the predictions
+        model_dir: Directory containing the model artifacts
+        chunksize: Rows per chunk
+        workers: Process pool size; 0 scores in this process
+
+    Returns:
+        Number of rows scored
+    """
+    started = time.perf_counter()
+    rows = 0
+    fraud_count = 0
+
+    pool: Optional[ProcessPoolExecutor] = None
+    if workers > 0:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=load_artifacts,
+                                   initargs=(model_dir, 1))
+    else:
+        load_artifacts(model_dir)
+
+    def write(predictions: pd.DataFrame, out) -> None:
+        nonlocal rows, fraud_count
+        predictions.to_csv(out, header=rows == 0, index_label='row')
+        rows += len(predictions)
+        fraud_count += int(predictions['is_fraud'].sum())
+        elapsed = time.perf_counter() - started
+        print(f"   {rows:,} rows scored ({rows / elapsed:,.0f} rows/sec)")
+
+    with open(output_path, 'w', newline='') as out:
+        try:
+            if pool is None:
+                for chunk in read_chunks(input_path, chunksize):
+                    write(score_chunk(chunk), out)
+            else:
+                # Bounded in-flight window keeps memory flat and output in order
+                pending = deque()
+                for chunk in read_chunks(input_path, chunksize):
+                    pending.append(pool.submit(score_chunk, chunk))
+                    if len(pending) >= 2 * workers:
+                        write(pending.popleft().result(), out)
+                while pending:
+                    write(pending.popleft().result(), out)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+    elapsed = time.perf_counter() - started
+    print(f"\n✅ Scored {rows:,} rows in {elapsed:.2f}s "
+          f"({rows / elapsed if elapsed > 0 else 0:,.0f} rows/sec)")
+    print(f"   Flagged as fraud: {fraud_count:,}")
+    print(f"💾 Predictions saved to: {output_path}")
+    return rows
+
+
+def main():
+    """
+    Parse arguments and score the input file.
+    """
+    parser = argparse.ArgumentParser(description="Score transactions with the trained fraud model")
+    parser.add_argument('input', help="CSV or .parquet file in the creditcard.csv schema")
+    parser.add_argument('--output', default='data/predictions.csv', help="Output CSV path")
+    parser.add_argument('--model-dir', default='../backend/model', help="Directory with model artifacts")
+    parser.add_argument('--chunksize', type=int, default=100000, help="Rows per chunk")
+    parser.add_argument('--workers', type=int, default=0, help="Process pool size (0 = in-process)")
+    args = parser.parse_args()
+
+    print("\n" + "="*60)
+    print("🔎 CREDIT CARD FRAUD DETECTION - BULK SCORING")
+    print("="*60)
+
+    if not os.path.exists(args.input):
+        raise SystemExit(f"❌ Error: Input file not found at {args.input}")
+
+    score_file(args.input, args.output, args.model_dir, args.chunksize, args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,7 +10,11 @@ Date: 2026
 
 import os
 import sys
+import json
+import time
 import pickle
+import shutil
+import tempfile
 import numpy as np
 import pandas as pd
 from typing import Tuple, Dict, Any
@@ -18,10 +22,11 @@ import warnings
 warnings.filterwarnings('ignore')
 
 # Scikit-learn imports
+from sklearn.base import clone
 from sklearn.model_selection import train_test_split, cross_val_score, StratifiedKFold
 from sklearn.preprocessing import StandardScaler
 from sklearn.linear_model import LogisticRegression
-from sklearn.ensemble import RandomForestClassifier
+from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
 from sklearn.metrics import (
     classification_report, confusion_matrix, 
     precision_score, recall_score, f1_score, roc_auc_score,
@@ -33,6 +38,25 @@ from imblearn.over_sampling import SMOTE
 
 # Set random seed for reproducibility
 RANDOM_STATE = 42
+
+# Fraud decision threshold on P(fraud), stored in model_meta.json
+DECISION_THRESHOLD = 0.5
+
+# Share of the (pre-SMOTE) training split held out to tune the cascade
+VALIDATION_SIZE = 0.2
+
+# Recall the LR -> forest cascade must keep on the validation split
+CASCADE_TARGET_RECALL = 0.95
+
+# Distilled student candidates (n_estimators, max_depth), and the largest
+# ROC-AUC drop from the teacher forest the chosen student may have
+STUDENT_CANDIDATES = [(n_trees, depth) for n_trees in (5, 10, 20) for depth in (4, 6, 8)]
+DISTILL_MAX_AUC_DROP = 0.005
+
+# Largest recall and precision drops from the teacher the chosen student may
+# have, both measured at the student's own tuned decision threshold
+DISTILL_MAX_RECALL_DROP = 0.02
+DISTILL_MAX_PRECISION_DROP = 0.05
 np.random.seed(RANDOM_STATE)
 
 
@@ -195,7 +219,8 @@ def train_random_forest(X_train: np.ndarray, y_train: np.ndarray) -> RandomFores
     return model
 
 
-def evaluate_model(model, X_test: np.ndarray, y_test: np.ndarray, model_name: str) -> Dict[str, Any]:
+def evaluate_model(model, X_test: np.ndarray, y_test: np.ndarray, model_name: str,
+                   verbose: bool = True) -> Dict[str, Any]:
     """
     Evaluate model performance with comprehensive metrics.
     
@@ -204,24 +229,27 @@ def evaluate_model(model, X_test: np.ndarray, y_test: np.ndarray, model_name: st
         X_test: Test features
         y_test: Test labels
         model_name: Name of the model
+        verbose: Print the metrics, classification report and confusion matrix
         
     Returns:
         Dictionary of evaluation metrics
     """
-    print(f"\n📊 Evaluating {model_name}...")
-    print("="*60)
-    
     # Predictions
     y_pred = model.predict(X_test)
     y_pred_proba = model.predict_proba(X_test)[:, 1]
     
     # Calculate metrics
     metrics = {
-        'precision': precision_score(y_test, y_pred),
+        'precision': precision_score(y_test, y_pred, zero_division=0),
         'recall': recall_score(y_test, y_pred),
         'f1_score': f1_score(y_test, y_pred),
         'roc_auc': roc_auc_score(y_test, y_pred_proba)
     }
+    if not verbose:
+        return metrics
+    
+    print(f"\n📊 Evaluating {model_name}...")
+    print("="*60)
     
     # Print results
     print(f"\n🎯 {model_name} Performance:")
@@ -241,7 +269,342 @@ def evaluate_model(model, X_test: np.ndarray, y_test: np.ndarray, model_name: st
     return metrics
 
 
-def save_model(model, scaler, model_dir: str = '../backend/model') -> None:
+def tune_cascade_threshold(lr_model, rf_model, X_val: np.ndarray, y_val: np.ndarray,
+                           target_recall: float = CASCADE_TARGET_RECALL,
+                           decision_threshold: float = DECISION_THRESHOLD,
+                           model_name: str = "Random Forest") -> float:
+    """
+    Pick the LR score a transaction needs to be sent on to the forest.
+    
+    The cascade flags a transaction only if its LR score is at or above the
+    cascade threshold and the forest flags it. The highest threshold whose
+    cascade recall reaches target_recall is chosen (or the forest's own
+    recall, if that is lower), capped at the decision threshold so a row the
+    forest never sees is always classified safe. Tuning uses a validation
+    split so the test split still gives an unbiased recall (report_cascade).
+    
+    Args:
+        lr_model: Trained Logistic Regression (pre-filter)
+        rf_model: Trained Random Forest (or any model with predict_proba)
+        X_val: Scaled validation features
+        y_val: Validation labels
+        target_recall: Recall the cascade must keep
+        decision_threshold: Fraud threshold on P(fraud)
+        model_name: Name of the model behind the pre-filter, for the log
+        
+    Returns:
+        Cascade threshold on the LR P(fraud)
+    """
+    print(f"\n🪜 Tuning LR -> {model_name} cascade...")
+    
+    y_val = np.asarray(y_val)
+    lr_scores = lr_model.predict_proba(X_val)[:, 1]
+    caught = (y_val == 1) & (rf_model.predict_proba(X_val)[:, 1] > decision_threshold)
+    n_fraud = int((y_val == 1).sum())
+    
+    # Every caught fraud whose LR score is kept counts toward recall
+    caught_scores = np.sort(lr_scores[caught])[::-1]
+    target = min(target_recall, len(caught_scores) / n_fraud) if n_fraud else 0.0
+    n_keep = int(np.ceil(target * n_fraud - 1e-9))
+    threshold = float(caught_scores[n_keep - 1]) if n_keep > 0 else decision_threshold
+    threshold = min(threshold, decision_threshold)
+    
+    skipped = np.mean(lr_scores < threshold)
+    recall = np.sum(caught & (lr_scores >= threshold)) / n_fraud if n_fraud else 0.0
+    print(f"   Cascade threshold: {threshold:.6f} (target recall {target:.4f})")
+    print(f"   Validation cascade recall: {recall:.4f} | "
+          f"Forest-only recall: {len(caught_scores) / max(n_fraud, 1):.4f}")
+    print(f"   Validation traffic skipping the forest: {skipped * 100:.2f}%")
+    
+    return threshold
+
+
+class SoftLabelStudent:
+    """
+    Classifier view of a regression student, so evaluate_model can score it.
+    
+    The student regresses the teacher's P(fraud); predict thresholds it like
+    the teacher's predict does.
+    """
+    
+    def __init__(self, regressor, decision_threshold: float = DECISION_THRESHOLD):
+        self.regressor = regressor
+        self.decision_threshold = decision_threshold
+    
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        fraud = np.clip(self.regressor.predict(X), 0.0, 1.0)
+        return np.column_stack([1.0 - fraud, fraud])
+    
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        return (self.predict_proba(X)[:, 1] > self.decision_threshold).astype(int)
+
+
+def serving_latency_us(model, X: np.ndarray, model_dir: str = '../backend/model',
+                       n_rows: int = 200, repeat: int = 5) -> float:
+    """
+    Single-row serving latency of a forest, as the backend evaluates it.
+    
+    Args:
+        model: Fitted forest (classifier or regression student)
+        X: Scaled features to score
+        model_dir: Backend model directory (locates the backend package)
+        n_rows: Rows scored one at a time per pass
+        repeat: Timing passes (the best is reported)
+        
+    Returns:
+        Mean microseconds per single-row prediction
+    """
+    # Serving uses the backend's compiled forest for small requests
+    backend_dir = os.path.abspath(os.path.join(model_dir, '..'))
+    if backend_dir not in sys.path:
+        sys.path.insert(0, backend_dir)
+    from app.model import CompiledForest
+    
+    forest = CompiledForest.from_sklearn(model)
+    rows = [row.reshape(1, -1) for row in X[:n_rows]]
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for row in rows:
+            forest.predict_fraud_proba(row)
+        best = min(best, (time.perf_counter() - started) / len(rows) * 1e6)
+    return best
+
+
+def tune_student_threshold(student, X_val: np.ndarray, y_val: np.ndarray,
+                           default: float = DECISION_THRESHOLD) -> float:
+    """
+    Pick the student's decision threshold on the validation split.
+    
+    A regression student's P(fraud) is calibrated differently from the
+    teacher's, so the teacher's threshold can cost it a lot of precision.
+    Candidates lie midway between consecutive distinct student scores; the
+    one with the best F1 wins, ties going to the threshold nearest default.
+    
+    Args:
+        student: Distilled RandomForestRegressor
+        X_val: Scaled validation features
+        y_val: Validation labels
+        default: Threshold kept when the validation split has no fraud
+        
+    Returns:
+        Decision threshold on the student's P(fraud) (fraud is score > threshold)
+    """
+    y_val = np.asarray(y_val)
+    scores = np.clip(student.predict(X_val), 0.0, 1.0)
+    n_fraud = int((y_val == 1).sum())
+    if n_fraud == 0:
+        return default
+    
+    distinct = np.unique(scores)
+    candidates = np.append((distinct[:-1] + distinct[1:]) / 2, default)
+    sorted_scores = np.sort(scores)
+    fraud_scores = np.sort(scores[y_val == 1])
+    flagged = len(sorted_scores) - np.searchsorted(sorted_scores, candidates, side='right')
+    caught = n_fraud - np.searchsorted(fraud_scores, candidates, side='right')
+    f1 = 2 * caught / np.maximum(flagged + n_fraud, 1)
+    
+    best = np.flatnonzero(f1 == f1.max())
+    return float(candidates[best[np.argmin(np.abs(candidates[best] - default))]])
+
+
+def distill_student(teacher, X_train: np.ndarray, X_val: np.ndarray, y_val: np.ndarray,
+                    max_auc_drop: float = DISTILL_MAX_AUC_DROP,
+                    max_recall_drop: float = DISTILL_MAX_RECALL_DROP,
+                    max_precision_drop: float = DISTILL_MAX_PRECISION_DROP) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Distill the forest into a small regression forest on its soft labels.
+    
+    Every STUDENT_CANDIDATES shape is trained on the teacher's P(fraud) for
+    the training rows, given its own decision threshold with
+    tune_student_threshold, then scored on the validation split with
+    evaluate_model at that threshold and timed with serving_latency_us.
+    The fastest student whose validation ROC-AUC, recall and precision are
+    all within the allowed drops from the teacher's wins (the best F1 if
+    none is). refit_student retrains its shape for serving.
+    
+    Args:
+        teacher: Random Forest trained on the training split
+        X_train: Training features (SMOTE-balanced)
+        X_val: Scaled validation features
+        y_val: Validation labels
+        max_auc_drop: Largest ROC-AUC loss accepted for the latency gain
+        max_recall_drop: Largest recall loss accepted
+        max_precision_drop: Largest precision loss accepted
+        
+    Returns:
+        Tuple of (chosen RandomForestRegressor, its validation metrics incl.
+        latency_us and decision_threshold)
+    """
+    print("\n" + "="*60)
+    print("🧪 FOREST DISTILLATION")
+    print("="*60)
+    
+    soft_labels = teacher.predict_proba(X_train)[:, 1]
+    teacher_metrics = evaluate_model(teacher, X_val, y_val, "Teacher", verbose=False)
+    teacher_metrics['latency_us'] = serving_latency_us(teacher, X_val)
+    
+    print("\nValidation split:")
+    print(f"{'Model':<18} {'Threshold':>9} {'ROC-AUC':>8} {'Recall':>8} {'Precision':>10} {'Latency':>10}")
+    print("-" * 68)
+    print(f"{f'teacher {teacher.n_estimators}x{teacher.max_depth}':<18} {DECISION_THRESHOLD:>9.4f} "
+          f"{teacher_metrics['roc_auc']:>8.4f} {teacher_metrics['recall']:>8.4f} "
+          f"{teacher_metrics['precision']:>10.4f} {teacher_metrics['latency_us']:>8.1f}us")
+    
+    # Latency vs accuracy curve over the candidate shapes
+    curve = []
+    for n_trees, depth in STUDENT_CANDIDATES:
+        student = RandomForestRegressor(
+            n_estimators=n_trees,
+            max_depth=depth,
+            min_samples_leaf=5,
+            random_state=RANDOM_STATE,
+            n_jobs=-1
+        )
+        student.fit(X_train, soft_labels)
+        threshold = tune_student_threshold(student, X_val, y_val)
+        metrics = evaluate_model(SoftLabelStudent(student, threshold), X_val, y_val, "Student", verbose=False)
+        metrics['decision_threshold'] = threshold
+        metrics['latency_us'] = serving_latency_us(student, X_val)
+        curve.append((student, metrics))
+        print(f"{f'student {n_trees}x{depth}':<18} {threshold:>9.4f} {metrics['roc_auc']:>8.4f} "
+              f"{metrics['recall']:>8.4f} {metrics['precision']:>10.4f} {metrics['latency_us']:>8.1f}us")
+    
+    eligible = [
+        entry for entry in curve
+        if entry[1]['roc_auc'] >= teacher_metrics['roc_auc'] - max_auc_drop
+        and entry[1]['recall'] >= teacher_metrics['recall'] - max_recall_drop
+        and entry[1]['precision'] >= teacher_metrics['precision'] - max_precision_drop
+    ]
+    if eligible:
+        student, metrics = min(eligible, key=lambda entry: entry[1]['latency_us'])
+    else:
+        print("⚠️  No student within the ROC-AUC/recall/precision limits of the teacher - keeping the best F1")
+        student, metrics = max(curve, key=lambda entry: (entry[1]['f1_score'], entry[1]['roc_auc']))
+    
+    print(f"\n✅ Selected student: {student.n_estimators} trees, max_depth {student.max_depth}, "
+          f"threshold {metrics['decision_threshold']:.4f} "
+          f"({teacher_metrics['latency_us'] / metrics['latency_us']:.1f}x faster per row)")
+    
+    return student, metrics
+
+
+def refit_student(student, teacher, X_train: np.ndarray, X_test: np.ndarray, y_test: np.ndarray,
+                  decision_threshold: float) -> Any:
+    """
+    Retrain the chosen student shape on the final teacher's soft labels.
+    
+    The shape and threshold were picked on the validation split by
+    distill_student; this refit only changes the data, and the refitted
+    student is the one scored on the test split and served.
+    
+    Args:
+        student: Student chosen by distill_student
+        teacher: Random Forest refitted on training + validation rows
+        X_train: Training + validation features (SMOTE-balanced)
+        X_test: Scaled test features
+        y_test: Test labels
+        decision_threshold: Student threshold tuned by distill_student
+        
+    Returns:
+        Refitted RandomForestRegressor
+    """
+    print("\n🧪 Refitting the distilled student...")
+    
+    student = clone(student)
+    student.fit(X_train, teacher.predict_proba(X_train)[:, 1])
+    
+    test_metrics = evaluate_model(SoftLabelStudent(student, decision_threshold), X_test, y_test,
+                                  "Student", verbose=False)
+    teacher_test = evaluate_model(teacher, X_test, y_test, "Teacher", verbose=False)
+    print(f"   Test ROC-AUC {test_metrics['roc_auc']:.4f} (teacher {teacher_test['roc_auc']:.4f}) | "
+          f"Test recall {test_metrics['recall']:.4f} (teacher {teacher_test['recall']:.4f}) | "
+          f"Test precision {test_metrics['precision']:.4f} (teacher {teacher_test['precision']:.4f})")
+    
+    return student
+
+
+def save_student(student, decision_threshold: float, cascade_threshold: float = None,
+                 model_dir: str = '../backend/model') -> str:
+    """
+    Save the distilled student as an alternative serving artifact.
+    
+    It shares scaler.pkl and the cascade weights with fraud_model.pkl. Its
+    own thresholds go under "artifacts" in model_meta.json (written by
+    save_model first), which the backend applies when MODEL_PATH points at
+    the student file.
+    
+    Args:
+        student: Distilled RandomForestRegressor
+        decision_threshold: Student's tuned fraud threshold
+        cascade_threshold: Pre-filter score needed to reach the student
+        model_dir: Directory to save the artifact
+        
+    Returns:
+        File name of the saved student
+    """
+    backend_dir = os.path.abspath(os.path.join(model_dir, '..'))
+    if backend_dir not in sys.path:
+        sys.path.insert(0, backend_dir)
+    from app.model import MODEL_META_FILENAME, STUDENT_MODEL_FILENAME
+    
+    os.makedirs(model_dir, exist_ok=True)
+    student_path = os.path.join(model_dir, STUDENT_MODEL_FILENAME)
+    with open(student_path, 'wb') as f:
+        pickle.dump(student, f)
+    
+    meta_path = os.path.join(model_dir, MODEL_META_FILENAME)
+    meta = {}
+    if os.path.exists(meta_path):
+        with open(meta_path, 'r') as f:
+            meta = json.load(f)
+    overrides = {'decision_threshold': decision_threshold}
+    if cascade_threshold is not None:
+        overrides['cascade_threshold'] = cascade_threshold
+    meta.setdefault('artifacts', {})[STUDENT_MODEL_FILENAME] = overrides
+    with open(meta_path, 'w') as f:
+        json.dump(meta, f, indent=2)
+    
+    print(f"✅ Distilled student saved to: {student_path} (threshold {decision_threshold:.4f})")
+    return STUDENT_MODEL_FILENAME
+
+
+def cascade_meta(cascade_model, scaler) -> Dict[str, Any]:
+    """
+    Reduce the Logistic Regression pre-filter to plain weights for model_meta.json.
+    
+    The backend scores the cascade as one dot product, so it needs neither
+    the pickle nor scikit-learn. The raw variant has the Time/Amount scaler
+    folded in, for the scaler-fused artifacts that see unscaled features.
+    
+    Args:
+        cascade_model: Trained Logistic Regression
+        scaler: Fitted Time/Amount scaler
+        
+    Returns:
+        Dictionary of cascade_weights, cascade_bias, cascade_raw_weights
+        and cascade_raw_bias
+    """
+    weights = np.asarray(cascade_model.coef_, dtype=np.float64).ravel()
+    bias = float(np.ravel(cascade_model.intercept_)[0])
+    
+    # w * (x - mean) / scale == (w / scale) * x - w * mean / scale
+    columns = [0, 29]
+    raw_weights = weights.copy()
+    raw_weights[columns] = weights[columns] / scaler.scale_
+    raw_bias = bias - float(np.sum(weights[columns] * scaler.mean_ / scaler.scale_))
+    
+    return {
+        'cascade_weights': weights.tolist(),
+        'cascade_bias': bias,
+        'cascade_raw_weights': raw_weights.tolist(),
+        'cascade_raw_bias': raw_bias
+    }
+
+
+def save_model(model, scaler, model_dir: str = '../backend/model',
+               decision_threshold: float = DECISION_THRESHOLD,
+               cascade_model=None, cascade_threshold: float = None) -> None:
     """
     Save the trained model and scaler.
     
@@ -249,6 +612,10 @@ def save_model(model, scaler, model_dir: str = '../backend/model') -> None:
         model: Trained model
         scaler: Fitted scaler
         model_dir: Directory to save models
+        decision_threshold: Fraud threshold on P(fraud) used at serving time
+        cascade_model: Optional pre-filter model for the cascade serving mode,
+            stored as weights in model_meta.json (see cascade_meta)
+        cascade_threshold: Pre-filter score needed to reach the main model
     """
     print("\n💾 Saving model and scaler...")
     
@@ -265,8 +632,239 @@ def save_model(model, scaler, model_dir: str = '../backend/model') -> None:
     with open(scaler_path, 'wb') as f:
         pickle.dump(scaler, f)
     
+    # Cascade pre-filter travels as plain weights in the metadata
+    meta = {'decision_threshold': decision_threshold}
+    if cascade_model is not None:
+        meta['cascade_threshold'] = cascade_threshold
+        meta.update(cascade_meta(cascade_model, scaler))
+    
+    # Save metadata (editable without retraining)
+    meta_path = os.path.join(model_dir, 'model_meta.json')
+    with open(meta_path, 'w') as f:
+        json.dump(meta, f, indent=2)
+    
     print(f"✅ Model saved to: {model_path}")
     print(f"✅ Scaler saved to: {scaler_path}")
+    print(f"✅ Metadata{' and cascade pre-filter' if cascade_model is not None else ''} saved to: {meta_path}")
+
+
+def export_fused_model(model, scaler, X_test: np.ndarray,
+                       model_dir: str = '../backend/model') -> None:
+    """
+    Export the forest as a scaler-fused compiled artifact.
+    
+    The Time/Amount StandardScaler is folded into the split thresholds so
+    the backend can score raw features without calling the scaler.
+    
+    Args:
+        model: Trained Random Forest
+        scaler: Fitted Time/Amount scaler
+        X_test: Scaled test features, used to check decision agreement
+        model_dir: Directory to save the artifact
+    """
+    print("\n🧩 Exporting scaler-fused model...")
+    
+    # The backend owns the compiled forest format
+    backend_dir = os.path.abspath(os.path.join(model_dir, '..'))
+    if backend_dir not in sys.path:
+        sys.path.insert(0, backend_dir)
+    from app.model import CompiledForest, FUSED_MODEL_FILENAME, RAW_MODEL_FILENAME
+    
+    # Time is column 0, Amount is column 29
+    fused = CompiledForest.from_sklearn(model).fold_scaler(
+        scaler.mean_, scaler.scale_, columns=[0, 29]
+    )
+    
+    # Check against the original pipeline on unscaled test rows
+    X_raw = X_test.copy()
+    X_raw[:, [0, 29]] = scaler.inverse_transform(X_test[:, [0, 29]])
+    expected = model.predict_proba(X_test)[:, 1]
+    actual = fused.predict_fraud_proba(X_raw)
+    agreement = np.mean((expected > DECISION_THRESHOLD) == (actual > DECISION_THRESHOLD))
+    print(f"   Decision agreement: {agreement * 100:.4f}%")
+    print(f"   Max probability diff: {np.abs(expected - actual).max():.2e}")
+    
+    os.makedirs(model_dir, exist_ok=True)
+    fused_path = os.path.join(model_dir, FUSED_MODEL_FILENAME)
+    fused.save(fused_path)
+    print(f"✅ Fused model saved to: {fused_path}")
+    
+    # Same arrays in one raw file that serving workers memory-map
+    raw_path = os.path.join(model_dir, RAW_MODEL_FILENAME)
+    fused.save_raw(raw_path)
+    print(f"✅ Memory-mappable model saved to: {raw_path}")
+
+
+def report_cascade(X_test: np.ndarray, y_test: np.ndarray, scaler,
+                   model_dir: str = '../backend/model', latency_rows: int = 500,
+                   repeat: int = 3) -> None:
+    """
+    Compare the saved model served with and without the cascade.
+    
+    Both runs go through the backend's FraudDetectionModel on unscaled
+    test rows, as the API receives them. The cascade threshold was tuned
+    on the validation split, so this is its held-out recall.
+    
+    Args:
+        X_test: Scaled test features
+        y_test: Test labels
+        scaler: Fitted Time/Amount scaler
+        model_dir: Directory with the saved artifacts
+        latency_rows: Rows scored one at a time for the latency figure
+        repeat: Timing passes per mode (the best is reported)
+    """
+    print("\n⏱️  Cascade serving latency...")
+    
+    backend_dir = os.path.abspath(os.path.join(model_dir, '..'))
+    if backend_dir not in sys.path:
+        sys.path.insert(0, backend_dir)
+    from app.model import FraudDetectionModel
+    
+    X_raw = X_test.copy()
+    X_raw[:, [0, 29]] = scaler.inverse_transform(X_test[:, [0, 29]])
+    single_rows = [dict(zip(['time'] + [f'v{i}' for i in range(1, 29)] + ['amount'], row))
+                   for row in X_raw[:latency_rows].tolist()]
+    
+    results = {}
+    for use_cascade in (False, True):
+        model = FraudDetectionModel()
+        model.use_cascade = use_cascade
+        model.load_model(os.path.join(model_dir, 'fraud_model.pkl'))
+        model.load_scaler(os.path.join(model_dir, 'scaler.pkl'))
+        model.warmup()
+        
+        # Best of a few passes, to keep scheduler noise out of the comparison
+        batch_ms, single_us = float('inf'), float('inf')
+        for _ in range(repeat):
+            started = time.perf_counter()
+            is_fraud, _, partial = model.predict_arrays_partial(X_raw.copy())
+            batch_ms = min(batch_ms, (time.perf_counter() - started) * 1000)
+            
+            started = time.perf_counter()
+            for row in single_rows:
+                model.predict(row)
+            single_us = min(single_us, (time.perf_counter() - started) / len(single_rows) * 1e6)
+        
+        results[use_cascade] = (recall_score(y_test, is_fraud), partial.mean(), batch_ms, single_us)
+    
+    print(f"   {'Mode':<14} {'Recall':>8} {'Skipped':>9} {'Batch':>10} {'Per row':>10}")
+    for use_cascade, (recall, skipped, batch_ms, single_us) in results.items():
+        print(f"   {'cascade' if use_cascade else 'forest only':<14} {recall:>8.4f} {skipped * 100:>8.2f}% "
+              f"{batch_ms:>8.1f}ms {single_us:>8.1f}us")
+    print(f"   Latency gain: {results[False][2] / results[True][2]:.2f}x batch, "
+          f"{results[False][3] / results[True][3]:.2f}x per row")
+
+
+def verify_float32_inference(model, scaler, X_test: np.ndarray,
+                             model_dir: str = '../backend/model',
+                             model_filename: str = 'fraud_model.pkl') -> bool:
+    """
+    Check the backend's float32 serving path against the float64 pipeline.
+    
+    The reference scales unscaled test rows with the sklearn scaler in
+    float64 and calls predict_proba. The backend loads the saved artifacts
+    and scores the same rows with float32 buffers, float32 scaler
+    parameters and float32 thresholds, through both the compiled forest
+    (small batches) and sklearn (large batches).
+    
+    Args:
+        model: Trained model with predict_proba (SoftLabelStudent for the student)
+        scaler: Fitted Time/Amount scaler
+        X_test: Scaled test features
+        model_dir: Directory with the saved artifacts
+        model_filename: Artifact to load from model_dir
+        
+    Returns:
+        True if every decision is identical
+    """
+    print(f"\n🔬 Checking float32 inference path for {model_filename}...")
+    
+    backend_dir = os.path.abspath(os.path.join(model_dir, '..'))
+    if backend_dir not in sys.path:
+        sys.path.insert(0, backend_dir)
+    from app.model import COMPILED_FOREST_MAX_ROWS, FraudDetectionModel
+    
+    X_raw = X_test.copy()
+    X_raw[:, [0, 29]] = scaler.inverse_transform(X_test[:, [0, 29]])
+    
+    # Float64 reference: sklearn scaler, then predict_proba
+    X_reference = X_raw.copy()
+    X_reference[:, [0, 29]] = scaler.transform(X_raw[:, [0, 29]])
+    expected = model.predict_proba(X_reference)[:, 1]
+    
+    served = FraudDetectionModel()
+    served.load_model(os.path.join(model_dir, model_filename))
+    served.load_scaler(os.path.join(model_dir, 'scaler.pkl'))
+    threshold = served.decision_threshold
+    
+    engines = {
+        'compiled forest': np.concatenate([
+            served.predict_arrays(X_raw[start:start + COMPILED_FOREST_MAX_ROWS])[1]
+            for start in range(0, len(X_raw), COMPILED_FOREST_MAX_ROWS)
+        ]),
+        'sklearn': served.predict_arrays(X_raw)[1]
+    }
+    
+    identical = True
+    for engine, actual in engines.items():
+        flipped = int(np.count_nonzero((expected > threshold) != (actual > threshold)))
+        identical = identical and flipped == 0
+        print(f"   {engine:<16} decisions differing: {flipped} / {len(X_raw)} | "
+              f"max probability diff: {np.abs(expected - actual).max():.2e}")
+    
+    if identical:
+        print("✅ float32 path gives identical decisions on the test split")
+    else:
+        print("❌ float32 path changes decisions on the test split")
+    return identical
+
+
+def publish_artifacts(staging_dir: str, model_dir: str = '../backend/model') -> None:
+    """
+    Move verified artifacts from a staging directory into the model directory.
+    
+    Each file is swapped in with os.replace, so the backend (or its
+    MODEL_WATCH_INTERVAL watcher) never reads a half-written artifact.
+    
+    Args:
+        staging_dir: Directory the artifacts were written and checked in
+        model_dir: Directory the backend serves from
+    """
+    os.makedirs(model_dir, exist_ok=True)
+    for name in sorted(os.listdir(staging_dir)):
+        os.replace(os.path.join(staging_dir, name), os.path.join(model_dir, name))
+    print(f"✅ Verified artifacts published to: {model_dir}")
+
+
+def save_holdout(X_test: np.ndarray, y_test: np.ndarray, scaler,
+                 model_dir: str = '../backend/model', max_legit: int = 2000) -> None:
+    """
+    Save a labelled holdout batch the backend uses to validate hot-reloads.
+    
+    Keeps every fraud row of the test split plus up to max_legit legitimate
+    rows, with Time/Amount unscaled as the API receives them.
+    
+    Args:
+        X_test: Scaled test features
+        y_test: Test labels
+        scaler: Fitted Time/Amount scaler
+        model_dir: Directory to save the holdout
+        max_legit: Maximum number of legitimate rows to keep
+    """
+    rng = np.random.default_rng(RANDOM_STATE)
+    y_test = np.asarray(y_test)
+    fraud_rows = np.flatnonzero(y_test == 1)
+    legit_rows = np.flatnonzero(y_test == 0)
+    legit_rows = rng.choice(legit_rows, size=min(max_legit, len(legit_rows)), replace=False)
+    rows = np.sort(np.concatenate([fraud_rows, legit_rows]))
+    
+    X_raw = X_test[rows].copy()
+    X_raw[:, [0, 29]] = scaler.inverse_transform(X_raw[:, [0, 29]])
+    
+    os.makedirs(model_dir, exist_ok=True)
+    holdout_path = os.path.join(model_dir, 'holdout.npz')
+    np.savez(holdout_path, X=X_raw, y=y_test[rows])
+    print(f"✅ Holdout ({len(rows)} rows, {len(fraud_rows)} fraud) saved to: {holdout_path}")
 
 
 def main():
@@ -296,11 +894,17 @@ def main():
     X, y, scaler = preprocess_data(df)
     
     # Split data
-    print("\n✂️  Splitting data into train/test sets...")
+    print("\n✂️  Splitting data into train/validation/test sets...")
     X_train, X_test, y_train, y_test = train_test_split(
         X, y, test_size=0.2, random_state=RANDOM_STATE, stratify=y
     )
+    # Validation rows for tuning, held out before SMOTE so none are synthetic;
+    # they rejoin the training rows once every threshold is fixed
+    X_train, X_val, y_train, y_val = train_test_split(
+        X_train, y_train, test_size=VALIDATION_SIZE, random_state=RANDOM_STATE, stratify=y_train
+    )
     print(f"Training set: {X_train.shape[0]} samples")
+    print(f"Validation set: {X_val.shape[0]} samples")
     print(f"Test set: {X_test.shape[0]} samples")
     
     # Apply SMOTE only on training data
@@ -313,11 +917,35 @@ def main():
     
     # Logistic Regression
     lr_model = train_logistic_regression(X_train_balanced, y_train_balanced)
-    lr_metrics = evaluate_model(lr_model, X_test, y_test, "Logistic Regression")
     
     # Random Forest
     rf_model = train_random_forest(X_train_balanced, y_train_balanced)
+    
+    # Logistic Regression becomes the cascade pre-filter
+    cascade_threshold = tune_cascade_threshold(lr_model, rf_model, X_val, y_val)
+    
+    # Distilled student as an alternative serving artifact, with its own
+    # decision and cascade thresholds
+    student, student_metrics = distill_student(rf_model, X_train_balanced, X_val, y_val)
+    student_threshold = student_metrics['decision_threshold']
+    student_cascade_threshold = tune_cascade_threshold(
+        lr_model, SoftLabelStudent(student, student_threshold), X_val, y_val,
+        decision_threshold=student_threshold, model_name="student"
+    )
+    
+    # Thresholds are fixed, so refit the served models on training +
+    # validation rows rather than leave 20% of the training data unused
+    print("\n" + "="*60)
+    print("🔁 REFIT ON TRAINING + VALIDATION")
+    print("="*60)
+    X_full_balanced, y_full_balanced = apply_smote(
+        np.vstack([X_train, X_val]), np.concatenate([y_train, y_val])
+    )
+    lr_model = train_logistic_regression(X_full_balanced, y_full_balanced)
+    lr_metrics = evaluate_model(lr_model, X_test, y_test, "Logistic Regression")
+    rf_model = train_random_forest(X_full_balanced, y_full_balanced)
     rf_metrics = evaluate_model(rf_model, X_test, y_test, "Random Forest")
+    student = refit_student(student, rf_model, X_full_balanced, X_test, y_test, student_threshold)
     
     # Compare models
     print("\n" + "="*60)
@@ -332,8 +960,28 @@ def main():
     best_model = rf_model
     print("\n✅ Selected Random Forest as the production model")
     
-    # Save model and scaler
-    save_model(best_model, scaler)
+    served_student = SoftLabelStudent(student, student_threshold)
+    
+    # Save model and scaler to a staging directory next to backend/model, and
+    # only publish them once the float32 serving path has been verified
+    model_dir = '../backend/model'
+    staging_dir = tempfile.mkdtemp(prefix='.model-staging-', dir=os.path.dirname(os.path.abspath(model_dir)))
+    try:
+        save_model(best_model, scaler, staging_dir, cascade_model=lr_model, cascade_threshold=cascade_threshold)
+        student_filename = save_student(student, served_student.decision_threshold,
+                                        student_cascade_threshold, staging_dir)
+        export_fused_model(best_model, scaler, X_test, staging_dir)
+        verified = verify_float32_inference(best_model, scaler, X_test, staging_dir)
+        verified = verify_float32_inference(served_student, scaler, X_test, staging_dir,
+                                            model_filename=student_filename) and verified
+        if not verified:
+            print(f"❌ Keeping the previous artifacts in {model_dir}")
+            sys.exit(1)
+        publish_artifacts(staging_dir, model_dir)
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+    save_holdout(X_test, y_test, scaler)
+    report_cascade(X_test, y_test, scaler)
     
     print("\n" + "="*60)
     print("🎉 TRAINING COMPLETED SUCCESSFULLY!")
@@ -341,6 +989,11 @@ def main():
     print("\n📁 Output files:")
     print("   - backend/model/fraud_model.pkl")
     print("   - backend/model/scaler.pkl")
+    print("   - backend/model/fraud_model_student.pkl")
+    print("   - backend/model/model_meta.json")
+    print("   - backend/model/fraud_model_fused.npz")
+    print("   - backend/model/fraud_model_fused.bin")
+    print("   - backend/model/holdout.npz")
     print("\n🚀 Ready for deployment!")
 
 